@@ -0,0 +1,106 @@
+"""Benchmarks loading data from Nautobot through the contrib `NautobotAdapter`.
+
+To run this script use the following command:
+
+```
+invoke nbshell \
+    --plain \
+    --file development/benchmark_contrib_load.py \
+    --env BENCHMARK_ROWS=10000
+```
+
+The benchmark data is created in a transaction which is rolled back afterwards. The load time is reported per 10k rows
+for both a precompiled field plan (see `NautobotModel.get_field_plan`) as well as for a field plan that is recompiled
+for every row, which mirrors the type annotation introspection for every parameter of every row that was done before.
+"""
+
+import os
+import time
+from typing import List, Optional
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from nautobot.extras.models import Tag, TaggedItem
+from nautobot.tenancy.models import Tenant, TenantGroup
+from typing_extensions import TypedDict
+
+from nautobot_ssot.contrib import NautobotAdapter, NautobotModel
+
+_ROWS = int(os.getenv("BENCHMARK_ROWS", "10000"))
+_ROUNDS = int(os.getenv("BENCHMARK_ROUNDS", "3"))
+
+
+class TagDict(TypedDict):
+    """Tag typed dict for the benchmark."""
+
+    name: str
+
+
+class BenchmarkTenant(NautobotModel):
+    """Tenant model for the benchmark."""
+
+    _model = Tenant
+    _modelname = "tenant"
+    _identifiers = ("name",)
+    _attributes = ("description", "tenant_group__name", "tags")
+
+    name: str
+    description: Optional[str] = None
+    tenant_group__name: Optional[str] = None
+    tags: List[TagDict] = []
+
+
+class BenchmarkAdapter(NautobotAdapter):
+    """Adapter for the benchmark."""
+
+    tenant = BenchmarkTenant
+    top_level = ("tenant",)
+
+
+class RecompilingBenchmarkAdapter(BenchmarkAdapter):
+    """Adapter recompiling the field plan for every row."""
+
+    def _load_single_object(self, database_object, diffsync_model, field_plan_entries):
+        NautobotModel._field_plans.pop(diffsync_model, None)
+        field_plan_entries = self._get_field_plan_entries(diffsync_model)
+        return super()._load_single_object(database_object, diffsync_model, field_plan_entries)
+
+
+def measure(adapter_class):
+    """Return the fastest load time in seconds out of `_ROUNDS` rounds."""
+    timings = []
+    for _ in range(_ROUNDS):
+        adapter = adapter_class(job=None)
+        start = time.perf_counter()
+        adapter.load()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+class _Rollback(Exception):
+    """Raised to roll back the benchmark data."""
+
+
+try:
+    with transaction.atomic():
+        tag = Tag.objects.create(name="Benchmark Tag")
+        group = TenantGroup.objects.create(name="Benchmark Group")
+        Tenant.objects.bulk_create(
+            Tenant(name=f"Benchmark Tenant {index}", description="Benchmark", tenant_group=group)
+            for index in range(_ROWS)
+        )
+        tenant_content_type = ContentType.objects.get_for_model(Tenant)
+        tag.content_types.add(tenant_content_type)
+        TaggedItem.objects.bulk_create(
+            TaggedItem(tag=tag, content_type=tenant_content_type, object_id=pk)
+            for pk in Tenant.objects.filter(tenant_group=group).values_list("pk", flat=True)
+        )
+        for name, adapter_class in (
+            ("field plan recompiled per row", RecompilingBenchmarkAdapter),
+            ("precompiled field plan", BenchmarkAdapter),
+        ):
+            seconds = measure(adapter_class)
+            print(f"{name}: {seconds * 10_000 / _ROWS:.3f}s per 10k rows ({_ROWS} rows in {seconds:.3f}s)")
+        raise _Rollback
+except _Rollback:
+    pass
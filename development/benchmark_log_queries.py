@@ -0,0 +1,83 @@
+"""Benchmarks the queries listing the log entries of a Sync.
+
+To run this script use the following command:
+
+```
+invoke nbshell \
+    --plain \
+    --file development/benchmark_log_queries.py \
+    --env BENCHMARK_ROWS=2000000
+```
+
+The benchmark data is created in a transaction which is rolled back afterwards. The log entries are spread across
+`BENCHMARK_SYNCS` Syncs. The fastest time out of `BENCHMARK_ROUNDS` rounds and the query plan are reported for each
+query of the Sync Logs tab, which should stay below `BENCHMARK_BUDGET_MS` milliseconds.
+"""
+
+import os
+import time
+
+from django.db import connection, transaction
+
+from nautobot_ssot.models import Sync, SyncLogEntry
+
+_ROWS = int(os.getenv("BENCHMARK_ROWS", "2000000"))
+_SYNCS = int(os.getenv("BENCHMARK_SYNCS", "200"))
+_ROUNDS = int(os.getenv("BENCHMARK_ROUNDS", "3"))
+_BUDGET_MS = int(os.getenv("BENCHMARK_BUDGET_MS", "200"))
+_BATCH_SIZE = 10000
+
+
+def measure(function):
+    """Return the fastest time in milliseconds out of `_ROUNDS` rounds to run the function."""
+    timings = []
+    for _ in range(_ROUNDS):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+class _Rollback(Exception):
+    """Raised to roll back the benchmark data."""
+
+
+try:
+    with transaction.atomic():
+        syncs = Sync.objects.bulk_create(Sync(source="Benchmark", target="Nautobot", diff={}) for _ in range(_SYNCS))
+        actions = ("no-change", "create", "update", "delete")
+        statuses = ("success", "failure", "error")
+        for offset in range(0, _ROWS, _BATCH_SIZE):
+            SyncLogEntry.objects.bulk_create(
+                SyncLogEntry(
+                    sync=syncs[index % _SYNCS],
+                    action=actions[index % len(actions)],
+                    status=statuses[index % len(statuses)],
+                    message="Benchmark",
+                )
+                for index in range(offset, min(offset + _BATCH_SIZE, _ROWS))
+            )
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE nautobot_ssot_synclogentry")
+
+        sync = syncs[0]
+        logs = SyncLogEntry.objects.filter(sync=sync).order_by("-timestamp")
+        # Each query is run as the list view does: a COUNT for the paginator and the rows of the first page.
+        queries = {
+            "logs of a sync": logs,
+            "logs of a sync by action": logs.filter(action="create"),
+            "logs of a sync by status": logs.filter(status="failure"),
+        }
+        for name, queryset in queries.items():
+            for kind, function, explained in (
+                ("count", queryset.count, queryset.order_by()),
+                ("first page", lambda queryset=queryset: list(queryset[:50]), queryset[:50]),
+            ):
+                milliseconds = measure(function)
+                verdict = "ok" if milliseconds <= _BUDGET_MS else f"over the {_BUDGET_MS}ms budget"
+                print(f"{name}, {kind}: {milliseconds:.1f}ms, {verdict} ({_ROWS} log entries of {_SYNCS} syncs)")
+                print("    " + explained.explain().replace("\n", "\n    "))
+        raise _Rollback
+except _Rollback:
+    pass
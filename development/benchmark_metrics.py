@@ -0,0 +1,90 @@
+"""Benchmarks collecting the Prometheus metrics of the app.
+
+To run this script use the following command:
+
+```
+invoke nbshell \
+    --plain \
+    --file development/benchmark_metrics.py \
+    --env BENCHMARK_ROWS=10000
+```
+
+The benchmark data is created in a transaction which is rolled back afterwards. The Syncs are spread across all SSoT
+jobs. The scrape time and query count are reported for a scrape with an empty cache as well as a cached scrape.
+"""
+
+import os
+import time
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+from nautobot.extras.choices import JobResultStatusChoices
+from nautobot.extras.models import JobResult
+
+from nautobot_ssot import metrics
+from nautobot_ssot.jobs import get_data_jobs
+from nautobot_ssot.models import Sync
+
+_ROWS = int(os.getenv("BENCHMARK_ROWS", "10000"))
+_ROUNDS = int(os.getenv("BENCHMARK_ROUNDS", "3"))
+
+
+def scrape():
+    """Collect all metrics, like a scrape of the metrics endpoint does."""
+    for collector in metrics.metrics:
+        for _ in collector():
+            pass
+
+
+def measure(clear_cache):
+    """Return the fastest scrape time in seconds out of `_ROUNDS` rounds along with its number of queries."""
+    timings = []
+    for _ in range(_ROUNDS):
+        if clear_cache:
+            metrics._metrics_data_cache["data"] = None  # pylint: disable=protected-access
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            scrape()
+            timings.append(time.perf_counter() - start)
+    return min(timings), len(queries)
+
+
+class _Rollback(Exception):
+    """Raised to roll back the benchmark data."""
+
+
+try:
+    with transaction.atomic():
+        data_sources, data_targets = get_data_jobs()
+        jobs = data_sources + data_targets
+        statuses = (JobResultStatusChoices.STATUS_SUCCESS, JobResultStatusChoices.STATUS_FAILURE)
+        job_results = JobResult.objects.bulk_create(
+            JobResult(
+                name=jobs[index % len(jobs)].name,
+                job_model=jobs[index % len(jobs)],
+                task_name=jobs[index % len(jobs)].class_path,
+                worker="default",
+                status=statuses[index % len(statuses)],
+            )
+            for index in range(_ROWS)
+        )
+        start_time = now()
+        Sync.objects.bulk_create(
+            Sync(
+                source="Benchmark",
+                target="Nautobot",
+                start_time=start_time + timedelta(seconds=index),
+                source_load_time=timedelta(seconds=1),
+                summary={"create": index},
+                job_result=job_result,
+            )
+            for index, job_result in enumerate(job_results)
+        )
+        for name, clear_cache in (("uncached scrape", True), ("cached scrape", False)):
+            seconds, query_count = measure(clear_cache)
+            print(f"{name}: {seconds:.3f}s, {query_count} queries ({_ROWS} syncs of {len(jobs)} jobs)")
+        raise _Rollback
+except _Rollback:
+    pass
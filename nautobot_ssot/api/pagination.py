@@ -0,0 +1,22 @@
+"""API pagination for nautobot_ssot."""
+
+from nautobot.apps.utils import get_settings_or_config
+from rest_framework.pagination import CursorPagination
+
+
+class SSOTCursorPagination(CursorPagination):
+    """Cursor pagination, so that the cost of a page doesn't grow with its position in a long history.
+
+    The `limit` query parameter sets the page size, which defaults to `PAGINATE_COUNT` and is capped at `MAX_PAGE_SIZE`.
+    Viewsets set the `ordering` to paginate by, which should be a field that doesn't change once a record is created.
+    """
+
+    page_size_query_param = "limit"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Paginate the queryset, unless rendering to CSV."""
+        if "text/csv" in request.accepted_media_type:
+            return None
+        self.page_size = get_settings_or_config("PAGINATE_COUNT")
+        self.max_page_size = get_settings_or_config("MAX_PAGE_SIZE") or None
+        return super().paginate_queryset(queryset, request, view=view)
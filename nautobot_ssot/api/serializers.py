@@ -0,0 +1,34 @@
+"""API serializers for nautobot_ssot."""
+
+from nautobot.apps.api import BaseModelSerializer, ContentTypeField
+from rest_framework import serializers
+
+from nautobot_ssot.models import Sync, SyncLogEntry
+
+
+class SyncSerializer(BaseModelSerializer):  # pylint: disable=too-many-ancestors
+    """REST API serializer for Sync records.
+
+    The diff is only included with `?include=diff`, use the `diff` endpoint to read it one model type at a time.
+    """
+
+    diff = serializers.JSONField(source="get_diff", read_only=True)
+
+    class Meta:
+        """Meta attributes."""
+
+        model = Sync
+        fields = "__all__"
+        opt_in_fields = ["diff"]
+
+
+class SyncLogEntrySerializer(BaseModelSerializer):  # pylint: disable=too-many-ancestors
+    """REST API serializer for SyncLogEntry records."""
+
+    synced_object_type = ContentTypeField(read_only=True)
+
+    class Meta:
+        """Meta attributes."""
+
+        model = SyncLogEntry
+        fields = "__all__"
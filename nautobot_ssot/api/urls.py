@@ -1,9 +1,16 @@
 """Django urlpatterns declaration for nautobot_ssot API."""
 
+from rest_framework import routers
+
+from nautobot_ssot.api.views import SyncLogEntryViewSet, SyncViewSet
 from nautobot_ssot.integrations.utils import each_enabled_integration_module
 
+router = routers.DefaultRouter()
+
+router.register("syncs", SyncViewSet)
+router.register("sync-log-entries", SyncLogEntryViewSet)
 app_name = "ssot"  # pylint: disable=invalid-name
-urlpatterns = []
+urlpatterns = router.urls
 
 
 def _add_integrations():
@@ -0,0 +1,100 @@
+"""API views for nautobot_ssot."""
+
+import json
+
+from django.http import StreamingHttpResponse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from nautobot.apps.api import ReadOnlyModelViewSet
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+
+from nautobot_ssot.filters import SyncFilterSet, SyncLogEntryFilterSet
+from nautobot_ssot.models import DiffJSONEncoder, Sync, SyncLogEntry
+
+from .pagination import SSOTCursorPagination
+from .serializers import SyncLogEntrySerializer, SyncSerializer
+
+
+class SyncPagination(SSOTCursorPagination):
+    """Cursor pagination of Sync records, latest first."""
+
+    ordering = "-start_time"
+
+
+class SyncLogEntryPagination(SSOTCursorPagination):
+    """Cursor pagination of SyncLogEntry records, in the order they were logged."""
+
+    ordering = "timestamp"
+
+
+def _stream_model_diff(model_type, count, elements):
+    """Yield the JSON of the diff elements of a model type, one element at a time."""
+    yield f'{{"model_type": {json.dumps(model_type)}, "count": {count}, "results": ['
+    for index, (name, diff) in enumerate(elements):
+        separator = ", " if index else ""
+        yield separator + json.dumps({"name": name, "diff": diff}, cls=DiffJSONEncoder)
+    yield "]}"
+
+
+def _get_non_negative_int(query_params, name, default=None):
+    """Get a non-negative integer query parameter, raising a ValidationError for any other value."""
+    if name not in query_params:
+        return default
+    try:
+        value = int(query_params[name])
+    except ValueError:
+        value = -1
+    if value < 0:
+        raise ValidationError({name: "Must be a non-negative integer."})
+    return value
+
+
+class SyncViewSet(ReadOnlyModelViewSet):  # pylint: disable=too-many-ancestors
+    """API read operations set for the Sync view, with the diff left out unless requested with `?include=diff`."""
+
+    queryset = Sync.annotated_queryset()
+    filterset_class = SyncFilterSet
+    serializer_class = SyncSerializer
+    pagination_class = SyncPagination
+
+    def get_queryset(self):
+        """Only load the diff of the Syncs if it's included in the response."""
+        queryset = super().get_queryset()
+        if self.action in ("list", "retrieve") and "diff" in self.request.query_params.getlist("include"):
+            queryset = queryset.defer(None)
+        return queryset
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("model_type", OpenApiTypes.STR, required=True, description="Model type of the diff"),
+            OpenApiParameter("offset", OpenApiTypes.INT, description="Number of diff elements to skip"),
+            OpenApiParameter("limit", OpenApiTypes.INT, description="Maximum number of diff elements to return"),
+        ],
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    @action(detail=True, methods=["get"])
+    def diff(self, request, pk=None):  # pylint: disable=unused-argument
+        """Stream the diff elements of a single model type of a Sync, optionally sliced by `offset` and `limit`.
+
+        Only the diff chunks holding the requested elements are loaded, one chunk at a time.
+        """
+        sync = self.get_object()
+        model_type = request.query_params.get("model_type")
+        if not model_type:
+            raise ValidationError({"model_type": "This parameter is required."})
+        offset = _get_non_negative_int(request.query_params, "offset", default=0)
+        limit = _get_non_negative_int(request.query_params, "limit")
+
+        count = sync.get_diff_model_counts().get(model_type, 0)
+        elements = sync.iter_model_diff(model_type, offset, limit)
+        return StreamingHttpResponse(_stream_model_diff(model_type, count, elements), content_type="application/json")
+
+
+class SyncLogEntryViewSet(ReadOnlyModelViewSet):  # pylint: disable=too-many-ancestors
+    """API read operations set for the SyncLogEntry view."""
+
+    queryset = SyncLogEntry.objects.select_related("synced_object_type")
+    filterset_class = SyncLogEntryFilterSet
+    serializer_class = SyncLogEntrySerializer
+    pagination_class = SyncLogEntryPagination
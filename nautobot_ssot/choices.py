@@ -31,3 +31,19 @@ class SyncLogEntryStatusChoices(ChoiceSet):
         (STATUS_FAILURE, "failed"),
         (STATUS_ERROR, "errored"),
     )
+
+
+class SyncLogPolicyChoices(ChoiceSet):
+    """Valid values for the SyncLogEntry logging policy of a data sync job."""
+
+    POLICY_ALL = "all"
+    POLICY_CHANGES_AND_FAILURES = "changes-and-failures"
+    POLICY_SAMPLE_UNCHANGED = "sample-unchanged"
+    POLICY_SUMMARY_ONLY = "summary-only"
+
+    CHOICES = (
+        (POLICY_ALL, "all entries"),
+        (POLICY_CHANGES_AND_FAILURES, "changes and failures only"),
+        (POLICY_SAMPLE_UNCHANGED, "sample of unchanged"),
+        (POLICY_SUMMARY_ONLY, "summary only"),
+    )
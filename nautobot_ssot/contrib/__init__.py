@@ -5,12 +5,16 @@ from nautobot_ssot.contrib.model import NautobotModel
 from nautobot_ssot.contrib.types import (
     CustomFieldAnnotation,
     CustomRelationshipAnnotation,
+    FieldPlanEntry,
+    FieldTypeEnum,
     RelationshipSideEnum,
 )
 
 __all__ = (
     "CustomFieldAnnotation",
     "CustomRelationshipAnnotation",
+    "FieldPlanEntry",
+    "FieldTypeEnum",
     "NautobotAdapter",
     "NautobotModel",
     "RelationshipSideEnum",
@@ -3,23 +3,43 @@
 # pylint: disable=protected-access
 # Diffsync relies on underscore-prefixed attributes quite heavily, which is why we disable this here.
 
-from collections import defaultdict
-from typing import DefaultDict, Dict, FrozenSet, Hashable, Tuple, Type, get_args
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from typing import (
+    Callable,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import pydantic
-from diffsync import Adapter
+from diffsync import Adapter, DiffSyncModel
+from diffsync.enum import DiffSyncFlags
 from diffsync.exceptions import ObjectCrudException
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Model
+from django.core.exceptions import FieldDoesNotExist
+from django.db import DatabaseError, transaction
+from django.db.models import ManyToOneRel, Model, Prefetch, ProtectedError, Q, QuerySet
 from nautobot.extras.choices import RelationshipTypeChoices
 from nautobot.extras.models import Relationship, RelationshipAssociation
-from typing_extensions import get_type_hints
 
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
 from nautobot_ssot.contrib.types import (
-    CustomFieldAnnotation,
     CustomRelationshipAnnotation,
+    FieldPlanEntry,
+    FieldTypeEnum,
     RelationshipSideEnum,
 )
+from nautobot_ssot.profiling import time_load
 
 # This type describes a set of parameters to use as a dictionary key for the cache. As such, its needs to be hashable
 # and therefore a frozenset rather than a normal set or a list.
@@ -33,6 +53,9 @@ from nautobot_ssot.contrib.types import (
 # )
 ParameterSet = FrozenSet[Tuple[str, Hashable]]
 
+# Maximum number of parent primary keys the children loaded from `values_list` rows are filtered for per query.
+_CHILDREN_PARENT_PKS_CHUNK_SIZE = 1000
+
 
 class NautobotAdapter(Adapter):
     """
@@ -42,34 +65,446 @@ class NautobotAdapter(Adapter):
     """
 
     # This dictionary acts as an ORM cache.
-    _cache: DefaultDict[str, Dict[ParameterSet, Model]]
+    _cache: DefaultDict[str, "OrderedDict[ParameterSet, Model]"]
     _cache_hits: DefaultDict[str, int] = defaultdict(int)
+    _cache_misses: DefaultDict[str, int]
+    _cache_evictions: DefaultDict[str, int]
+    # The key fields each model's objects are indexed under in the ORM cache besides their primary key, see
+    # `warm_cache`.
+    _cache_key_fields: DefaultDict[str, Set[Tuple[str, ...]]]
+    # Parameter sets of the key fields that match several objects of a model, which are never cached, see
+    # `_add_to_orm_cache`.
+    _ambiguous_parameter_sets: DefaultDict[str, Set[ParameterSet]]
+
+    # Maximum amount of entries per model in the ORM cache. When this is exceeded, the least recently used entries are
+    # evicted. When this is `None`, the ORM cache grows without limit.
+    cache_max_size: Optional[int] = None
+
+    # When this is set, `NautobotModel.create`/`update`/`delete` don't write to the database immediately. Instead, the
+    # ORM instances are queued by model class and written using `bulk_create`/`bulk_update`/batched deletes once
+    # `bulk_batch_size` operations are pending, as well as when the sync completes. See `flush_bulk_operations`.
+    bulk_operations: bool = False
+    bulk_batch_size: int = 1000
+
+    # When this is set, models are loaded from `values_list` rows instead of model instances where possible, joining
+    # foreign key lookups in SQL. Models with fields that require model instances (to-many relationships, custom
+    # relationships, generic foreign keys, `load_param_` methods) are loaded from model instances as usual. See
+    # `_can_load_with_values`.
+    values_loading: bool = False
+
+    # When this is set, only objects with a `last_updated` after it (or with children that have), as well as those
+    # matching the identifiers returned by the job's `get_delta_identifiers`, are loaded. It is taken from the job's
+    # `delta_since` by default, see `DataSyncBaseJob.run`.
+    delta_since: Optional[datetime] = None
+    # Maximum number of identifiers reported as changed by the job that are filtered for in the database. Above this, a
+    # delta sync loads all objects of the model instead of building a query with a condition per identifier.
+    delta_identifiers_max: int = 1000
+
+    # Pending bulk operations, see `bulk_operations`.
+    _pending_creates: DefaultDict[Type[Model], List[Model]]
+    _pending_updates: DefaultDict[Type[Model], Dict[Hashable, Tuple[Model, Set[str]]]]
+    _pending_deletes: DefaultDict[Type[Model], List[Hashable]]
+    _pending_relationship_operations: List[Callable[[], None]]
+    # Pending creates by model class and parameter names, indexed by their parameter values, see `_get_pending_object`.
+    _pending_create_index: Dict[Tuple[Type[Model], Tuple[str, ...]], Dict[Tuple, Model]]
+
+    # Field plan entries for the parameters of each diffsync model class, see `_get_field_plan_entries`.
+    _field_plan_entries: Dict[Type[DiffSyncModel], List[FieldPlanEntry]]
+
+    # Relationship associations by relationship label and side, see `_get_relationship_associations`.
+    _relationship_associations: Dict[Tuple[str, RelationshipSideEnum], DefaultDict[Hashable, List[Model]]]
 
     def __init__(self, *args, job, sync=None, **kwargs):
         """Instantiate this class, but do not load data immediately from the local system."""
         super().__init__(*args, **kwargs)
         self.job = job
         self.sync = sync
+        delta_since = getattr(job, "delta_since", None)
+        # Jobs not based on `DataSyncBaseJob` don't provide a watermark.
+        if isinstance(delta_since, datetime):
+            self.delta_since = delta_since
+        self._cache_key_fields = defaultdict(set)
+        self._ambiguous_parameter_sets = defaultdict(set)
         self.invalidate_cache()
+        self._reset_bulk_operations()
+        self._field_plan_entries = {}
+        self._relationship_associations = {}
 
     def invalidate_cache(self, zero_out_hits=True):
         """Invalidates all the objects in the ORM cache."""
-        self._cache = defaultdict(dict)
+        self._cache = defaultdict(OrderedDict)
         if zero_out_hits:
             self._cache_hits = defaultdict(int)
+            self._cache_misses = defaultdict(int)
+            self._cache_evictions = defaultdict(int)
+
+    @staticmethod
+    def _get_model_cache_key(model_class: Type[Model]) -> str:
+        """Get the key for a model class in the ORM cache, i.e. 'tenancy.tenant'."""
+        content_type = ContentType.objects.get_for_model(model_class)
+        return f"{content_type.app_label}.{content_type.model}"
 
     def get_from_orm_cache(self, parameters: Dict, model_class: Type[Model]):
         """Retrieve an object from the ORM or the cache."""
         parameter_set = frozenset(parameters.items())
-        content_type = ContentType.objects.get_for_model(model_class)
-        model_cache_key = f"{content_type.app_label}.{content_type.model}"
-        if cached_object := self._cache[model_cache_key].get(parameter_set):
+        model_cache_key = self._get_model_cache_key(model_class)
+        model_cache = self._cache[model_cache_key]
+        if cached_object := model_cache.get(parameter_set):
             self._cache_hits[model_cache_key] += 1
+            model_cache.move_to_end(parameter_set)
             return cached_object
+        self._cache_misses[model_cache_key] += 1
         # As we are using `get` here, this will error if there is not exactly one object that corresponds to the
         # parameter set. We intentionally pass these errors through.
-        self._cache[model_cache_key][parameter_set] = model_class.objects.get(**dict(parameter_set))
-        return self._cache[model_cache_key][parameter_set]
+        try:
+            obj = model_class.objects.get(**dict(parameter_set))
+        except model_class.DoesNotExist:
+            # In bulk mode, the object we are looking for may not have been written to the database yet.
+            obj = self._get_pending_object(parameters, model_class)
+            if obj is None:
+                raise
+        # Also index the object under its primary key and the key fields of this model, so that looking it up through
+        # any of those hits the cache. Key fields spanning relationships are skipped to avoid additional queries.
+        key_fields = {
+            fields for fields in self._cache_key_fields[model_cache_key] if not self._spans_relationship(fields)
+        }
+        self._add_to_orm_cache(model_cache_key, obj, key_fields, parameter_set)
+        return obj
+
+    def warm_cache(
+        self,
+        model_class: Type[Model],
+        key_fields: Iterable[Union[str, Sequence[str]]],
+        queryset: Optional[QuerySet] = None,
+    ):
+        """Load all objects of a model into the ORM cache with a single query.
+
+        Each object is indexed under its primary key as well as under every entry of `key_fields`, meaning that
+        `get_from_orm_cache` calls with any of these keys (for example when resolving foreign keys in
+        `NautobotModel.create`/`update`) don't query the database anymore. Objects fetched lazily at a later point in
+        time are indexed under the same key fields.
+
+        Example:
+            ```python
+            adapter.warm_cache(
+                Location,
+                key_fields=["name", ("name", "parent__name")],
+                queryset=Location.objects.select_related("parent"),
+            )
+            ```
+
+        Args:
+            model_class: The model class to load.
+            key_fields: The keys to index the objects under. Each key is either a single field name or a sequence of
+                field names. Field names may span relationships, in which case `queryset` should use `select_related`.
+            queryset: The queryset to load the objects from, defaults to all objects of `model_class`.
+        """
+        model_cache_key = self._get_model_cache_key(model_class)
+        key_fields = {(fields,) if isinstance(fields, str) else tuple(fields) for fields in key_fields}
+        self._cache_key_fields[model_cache_key].update(key_fields)
+        if queryset is None:
+            queryset = model_class.objects.all()
+        # Keys that match several objects can't be cached, the lookup needs to raise `MultipleObjectsReturned`. These
+        # are tracked here as well, as the first object of a key may have been evicted by the time the next one is
+        # indexed.
+        pks_by_parameter_set = {}
+        ambiguous_parameter_sets = self._ambiguous_parameter_sets[model_cache_key]
+        model_cache = self._cache[model_cache_key]
+        for obj in queryset:
+            for parameter_set in self._add_to_orm_cache(model_cache_key, obj, key_fields):
+                if pks_by_parameter_set.setdefault(parameter_set, obj.pk) != obj.pk:
+                    ambiguous_parameter_sets.add(parameter_set)
+                    model_cache.pop(parameter_set, None)
+
+    def _add_to_orm_cache(
+        self,
+        model_cache_key: str,
+        obj: Model,
+        key_fields: Iterable[Tuple[str, ...]],
+        parameter_set: Optional[ParameterSet] = None,
+    ) -> List[ParameterSet]:
+        """Index an object in the ORM cache under its primary key, the given key fields and parameter set.
+
+        The parameter set, which the object was looked up by, is known to match it alone. A key field parameter set is
+        skipped if it's known to match several objects, or marked as such if it's cached for another object already.
+        """
+        parameter_sets = [frozenset([("pk", obj.pk)])]
+        if parameter_set is not None:
+            parameter_sets.append(parameter_set)
+        model_cache = self._cache[model_cache_key]
+        ambiguous_parameter_sets = self._ambiguous_parameter_sets[model_cache_key]
+        for fields in key_fields:
+            try:
+                key = frozenset((field, self._resolve_lookup(obj, field)) for field in fields)
+            except (AttributeError, TypeError):
+                # The object doesn't have (hashable) values for these fields.
+                continue
+            if key == parameter_set or key in ambiguous_parameter_sets:
+                continue
+            cached_object = model_cache.get(key)
+            if cached_object is not None and cached_object.pk != obj.pk:
+                ambiguous_parameter_sets.add(key)
+                del model_cache[key]
+                continue
+            parameter_sets.append(key)
+        for key in parameter_sets:
+            model_cache[key] = obj
+            model_cache.move_to_end(key)
+        if self.cache_max_size is not None:
+            while len(model_cache) > self.cache_max_size:
+                model_cache.popitem(last=False)
+                self._cache_evictions[model_cache_key] += 1
+        return parameter_sets
+
+    @staticmethod
+    def _spans_relationship(fields: Tuple[str, ...]) -> bool:
+        """Check whether any field of a cache key spans a relationship, i.e. `parent__name`."""
+        return any("__" in field for field in fields)
+
+    @staticmethod
+    def _resolve_lookup(obj: Model, lookup: str) -> Hashable:
+        """Resolve a `__` delimited lookup such as `parent__name` on an object."""
+        value = obj
+        for attribute in lookup.split("__"):
+            value = getattr(value, attribute)
+            if value is None:
+                break
+        hash(value)
+        return value
+
+    def get_cache_statistics(self) -> Dict[str, Dict[str, int]]:
+        """Get the amount of hits, misses and evictions as well as the current size of the ORM cache per model."""
+        model_cache_keys = set(self._cache_hits) | set(self._cache_misses) | set(self._cache_evictions)
+        return {
+            model_cache_key: {
+                "hits": self._cache_hits[model_cache_key],
+                "misses": self._cache_misses[model_cache_key],
+                "evictions": self._cache_evictions[model_cache_key],
+                "size": len(self._cache[model_cache_key]),
+            }
+            for model_cache_key in sorted(model_cache_keys)
+        }
+
+    def _reset_bulk_operations(self):
+        """Discard all pending bulk operations."""
+        self._pending_creates = defaultdict(list)
+        self._pending_updates = defaultdict(dict)
+        self._pending_deletes = defaultdict(list)
+        self._pending_relationship_operations = []
+        self._pending_create_index = {}
+
+    @property
+    def pending_bulk_operations(self) -> int:
+        """Amount of ORM operations that are waiting to be flushed to the database."""
+        return (
+            sum(len(objects) for objects in self._pending_creates.values())
+            + sum(len(objects) for objects in self._pending_updates.values())
+            + sum(len(pks) for pks in self._pending_deletes.values())
+            + len(self._pending_relationship_operations)
+        )
+
+    def _get_pending_object(self, parameters: Dict, model_class: Type[Model]) -> Optional[Model]:
+        """Find an object that is queued for creation in bulk mode and matches the given parameters.
+
+        The pending creates of a model class are indexed by the values of each set of parameter names on its first
+        lookup, after that `enqueue_create` keeps the index up to date.
+        """
+        parameter_names = tuple(sorted(parameters))
+        index_key = (model_class, parameter_names)
+        if index_key not in self._pending_create_index:
+            index = self._pending_create_index[index_key] = {}
+            for pending_object in self._pending_creates.get(model_class, []):
+                index.setdefault(self._get_pending_object_values(pending_object, parameter_names), pending_object)
+        return self._pending_create_index[index_key].get(tuple(parameters[name] for name in parameter_names))
+
+    @staticmethod
+    def _get_pending_object_values(obj: Model, parameter_names: Tuple[str, ...]) -> Tuple:
+        """Get the values of the given parameters of an object that is queued for creation, following relationships."""
+        values = []
+        for parameter_name in parameter_names:
+            related_object = obj
+            for lookup in parameter_name.split("__"):
+                related_object = getattr(related_object, lookup, None)
+                if related_object is None:
+                    break
+            values.append(related_object)
+        return tuple(values)
+
+    def enqueue_create(self, obj: Model):
+        """Queue an unsaved ORM object for `bulk_create`."""
+        self._pending_creates[type(obj)].append(obj)
+        for (model_class, parameter_names), index in self._pending_create_index.items():
+            if model_class is type(obj):
+                index.setdefault(self._get_pending_object_values(obj, parameter_names), obj)
+        self._flush_if_batch_full()
+
+    def enqueue_update(self, obj: Model, fields: Set[str]):
+        """Queue an ORM object for `bulk_update` of the given concrete fields."""
+        # `bulk_update` doesn't call `pre_save`, which is what sets fields like `last_updated`.
+        for field in obj._meta.concrete_fields:
+            if getattr(field, "auto_now", False):
+                field.pre_save(obj, False)
+                fields.add(field.name)
+        _, pending_fields = self._pending_updates[type(obj)].setdefault(obj.pk, (obj, set()))
+        pending_fields.update(fields)
+        self._flush_if_batch_full()
+
+    def enqueue_delete(self, model_class: Type[Model], pk: Hashable):
+        """Queue the deletion of an ORM object by its primary key."""
+        self._pending_deletes[model_class].append(pk)
+        self._flush_if_batch_full()
+
+    def enqueue_relationship_operation(self, operation: Callable[[], None]):
+        """Queue a callable that writes relationships and therefore needs to run after its parents are flushed."""
+        self._pending_relationship_operations.append(operation)
+        self._flush_if_batch_full()
+
+    def _flush_if_batch_full(self):
+        if self.pending_bulk_operations >= self.bulk_batch_size:
+            self.flush_bulk_operations()
+
+    @staticmethod
+    def _sort_by_dependencies(model_classes: List[Type[Model]]) -> List[Type[Model]]:
+        """Order model classes so that foreign key targets come before the model classes referring to them."""
+        remaining = list(model_classes)
+        ordered = []
+        while remaining:
+            for model_class in remaining:
+                dependencies = {
+                    field.related_model
+                    for field in model_class._meta.concrete_fields
+                    if field.is_relation and field.related_model is not model_class
+                }
+                if not dependencies.intersection(remaining):
+                    break
+            else:
+                # Circular dependency - fall back to the order in which the objects were queued.
+                model_class = remaining[0]
+            remaining.remove(model_class)
+            ordered.append(model_class)
+        return ordered
+
+    def flush_bulk_operations(self):
+        """Write all pending bulk operations to the database.
+
+        Creates are written first in dependency order, followed by updates. After that, the many-to-many and custom
+        relationship writes that depend on these objects are performed. Deletes come last and in reverse dependency
+        order.
+
+        If the bulk writes fail with a database error, they are rolled back and retried one at a time, see
+        `_write_operations_one_by_one`. The operations that still fail and the deletes of protected objects are logged
+        as failed on the Sync of the job. Unless the job's `diffsync_flags` contain `CONTINUE_ON_FAILURE`, an
+        `ObjectCrudException` is raised afterwards, like when a single operation fails outside of bulk mode.
+        """
+        pending_creates = self._pending_creates
+        pending_updates = self._pending_updates
+        pending_deletes = self._pending_deletes
+        pending_relationship_operations = self._pending_relationship_operations
+        self._reset_bulk_operations()
+
+        failures = 0
+        try:
+            with transaction.atomic():
+                for model_class in self._sort_by_dependencies(list(pending_creates)):
+                    model_class.objects.bulk_create(pending_creates[model_class], batch_size=self.bulk_batch_size)
+                for model_class, updates in pending_updates.items():
+                    objects = [obj for obj, _ in updates.values()]
+                    fields = set().union(*(fields for _, fields in updates.values()))
+                    if fields:
+                        model_class.objects.bulk_update(objects, sorted(fields), batch_size=self.bulk_batch_size)
+                for operation in pending_relationship_operations:
+                    operation()
+        except DatabaseError:
+            failures += self._write_operations_one_by_one(
+                pending_creates, pending_updates, pending_relationship_operations
+            )
+        for model_class in reversed(self._sort_by_dependencies(list(pending_deletes))):
+            failures += self._bulk_delete(model_class, pending_deletes[model_class])
+            self._remove_from_orm_cache(model_class, set(pending_deletes[model_class]))
+        flags = getattr(self.job, "diffsync_flags", DiffSyncFlags.NONE)
+        if failures and not (isinstance(flags, DiffSyncFlags) and flags & DiffSyncFlags.CONTINUE_ON_FAILURE):
+            raise ObjectCrudException(f"{failures} bulk operations failed, see the sync log for details.")
+
+    def _write_operations_one_by_one(self, pending_creates, pending_updates, pending_relationship_operations) -> int:
+        """Write pending creates, updates and relationship operations one at a time, each in its own transaction.
+
+        This is the fallback for bulk writes that failed. The operations that still fail are logged as failed on the
+        Sync of the job and their number is returned.
+        """
+        failures = 0
+        writes = [
+            (SyncLogEntryActionChoices.ACTION_CREATE, obj, {})
+            for model_class in self._sort_by_dependencies(list(pending_creates))
+            for obj in pending_creates[model_class]
+        ] + [
+            (SyncLogEntryActionChoices.ACTION_UPDATE, obj, {"update_fields": sorted(fields)})
+            for updates in pending_updates.values()
+            for obj, fields in updates.values()
+            if fields
+        ]
+        for action, obj, save_kwargs in writes:
+            if action == SyncLogEntryActionChoices.ACTION_CREATE:
+                # The objects may have been marked as saved by a `bulk_create` that was rolled back.
+                obj._state.adding = True
+            try:
+                with transaction.atomic():
+                    obj.save(**save_kwargs)
+            except DatabaseError as error:
+                failures += 1
+                self._log_bulk_operation_failure(action, obj, error)
+        for operation in pending_relationship_operations:
+            try:
+                with transaction.atomic():
+                    operation()
+            except DatabaseError as error:
+                failures += 1
+                self._log_bulk_operation_failure(SyncLogEntryActionChoices.ACTION_UPDATE, None, error)
+        return failures
+
+    def _log_bulk_operation_failure(self, action: str, obj: Optional[Model], error: Exception):
+        """Log a failed bulk operation on the Sync of the job, `obj` is `None` for relationship operations."""
+        object_repr = repr(obj) if obj is not None else "relationship"
+        if hasattr(self.job, "sync_log"):
+            self.job.sync_log(
+                action=action,
+                status=SyncLogEntryStatusChoices.STATUS_FAILURE,
+                message=f"Bulk write failed: {error}",
+                synced_object=obj if action != SyncLogEntryActionChoices.ACTION_CREATE else None,
+                object_repr=object_repr,
+            )
+        elif self.job:
+            self.job.logger.error("Bulk write of %s failed: %s", object_repr, error)
+
+    def _remove_from_orm_cache(self, model_class: Type[Model], pks: Set[Hashable]):
+        """Remove all cache entries pointing to one of the given objects."""
+        model_cache = self._cache[self._get_model_cache_key(model_class)]
+        for parameter_set in [key for key, cached_object in model_cache.items() if cached_object.pk in pks]:
+            del model_cache[parameter_set]
+
+    def _bulk_delete(self, model_class: Type[Model], pks: List[Hashable]) -> int:
+        """Delete objects in batches, falling back to single deletes for batches containing protected objects.
+
+        The objects that are protected are logged as failed deletes and their number is returned.
+        """
+        failures = 0
+        for index in range(0, len(pks), self.bulk_batch_size):
+            batch = pks[index : index + self.bulk_batch_size]
+            try:
+                with transaction.atomic():
+                    model_class.objects.filter(pk__in=batch).delete()
+            except ProtectedError:
+                for obj in model_class.objects.filter(pk__in=batch):
+                    try:
+                        obj.delete()
+                    except ProtectedError as error:
+                        failures += 1
+                        self._log_bulk_operation_failure(SyncLogEntryActionChoices.ACTION_DELETE, obj, error)
+        return failures
+
+    def sync_complete(self, source, diff, flags=DiffSyncFlags.NONE, logger=None):
+        """Flush any pending bulk operations once the sync is complete."""
+        self.flush_bulk_operations()
+        super().sync_complete(source, diff, flags=flags, logger=logger)
 
     @staticmethod
     def _get_parameter_names(diffsync_model):
@@ -78,57 +513,226 @@ class NautobotAdapter(Adapter):
 
     def _load_objects(self, diffsync_model):
         """Given a diffsync model class, load a list of models from the database and return them."""
-        parameter_names = self._get_parameter_names(diffsync_model)
-        for database_object in diffsync_model._get_queryset():
-            self._load_single_object(database_object, diffsync_model, parameter_names)
-
-    def _handle_single_parameter(self, parameters, parameter_name, database_object, diffsync_model):
-        type_hints = get_type_hints(diffsync_model, include_extras=True)
-        # Handle custom fields and custom relationships. See CustomFieldAnnotation and CustomRelationshipAnnotation
-        # docstrings for more details.
-        is_custom_field = False
-        custom_relationship_annotation = None
-        metadata_for_this_field = getattr(type_hints[parameter_name], "__metadata__", [])
-        for metadata in metadata_for_this_field:
-            if isinstance(metadata, CustomFieldAnnotation):
-                if metadata.name in database_object.cf:
-                    parameters[parameter_name] = database_object.cf[metadata.key]
-                is_custom_field = True
-                break
-            if isinstance(metadata, CustomRelationshipAnnotation):
-                custom_relationship_annotation = metadata
-                break
-        if is_custom_field:
+        if self.values_loading and self._can_load_with_values(diffsync_model):
+            self._load_objects_with_values(
+                diffsync_model, self._filter_delta(diffsync_model, diffsync_model._get_queryset())
+            )
+            return
+        field_plan_entries = self._get_field_plan_entries(diffsync_model)
+        self._relationship_associations = {}
+        queryset = self._filter_delta(diffsync_model, self._get_queryset_with_children(diffsync_model))
+        for database_object in queryset:
+            self._load_single_object(database_object, diffsync_model, field_plan_entries)
+        self._relationship_associations = {}
+
+    def _filter_delta(self, diffsync_model, queryset: QuerySet) -> QuerySet:
+        """Restrict the queryset of a top-level diffsync model to the objects to load in a delta sync.
+
+        Children are always loaded along with their parent, which is why parents with changed children are included.
+        """
+        if self.delta_since is None:
+            return queryset
+        delta_filter = self._get_delta_filter(diffsync_model)
+        if diffsync_model._children:
+            # Filtering across children joins them, so the matching objects are selected in a subquery to avoid
+            # duplicates.
+            delta_filter = Q(pk__in=diffsync_model._model.objects.filter(delta_filter).values("pk"))
+        identifiers_filter = self._get_delta_identifiers_filter(diffsync_model)
+        if identifiers_filter is None:
+            return queryset
+        return queryset.filter(delta_filter | identifiers_filter)
+
+    def _get_delta_filter(self, diffsync_model, prefix=""):
+        """Get a filter for objects updated after `delta_since`, or with children (recursively) that were."""
+        delta_filter = Q(**{f"{prefix}last_updated__gt": self.delta_since})
+        for children_parameter, children_field in diffsync_model._children.items():
+            delta_filter |= self._get_delta_filter(
+                self._get_diffsync_class(model_name=children_parameter), prefix=f"{prefix}{children_field}__"
+            )
+        return delta_filter
+
+    def _get_delta_identifiers_filter(self, diffsync_model) -> Optional[Q]:
+        """Get a filter for the objects matching the identifiers the job reports as changed for a diffsync model.
+
+        Returns `None` if these can't be filtered for in the database, or if there are more than
+        `delta_identifiers_max` of them, in which case all objects need to be loaded.
+        """
+        get_delta_identifiers = getattr(self.job, "get_delta_identifiers", None)
+        identifiers_list = get_delta_identifiers(diffsync_model._modelname) if get_delta_identifiers else []
+        if not identifiers_list:
+            return Q(pk__in=[])
+        if len(identifiers_list) > self.delta_identifiers_max:
+            return None
+        field_plan = diffsync_model.get_field_plan()
+        for identifier in diffsync_model._identifiers:
+            if field_plan[identifier].field_type not in (FieldTypeEnum.ATTRIBUTE, FieldTypeEnum.FOREIGN_KEY):
+                return None
+        if len(diffsync_model._identifiers) == 1:
+            identifier = diffsync_model._identifiers[0]
+            return Q(**{f"{identifier}__in": [identifiers[identifier] for identifiers in identifiers_list]})
+        identifiers_filter = Q(pk__in=[])
+        for identifiers in identifiers_list:
+            identifiers_filter |= Q(**identifiers)
+        return identifiers_filter
+
+    def _can_load_with_values(self, diffsync_model) -> bool:
+        """Check whether a diffsync model and all of its children can be loaded from `values_list` rows."""
+        for field_plan_entry in self._get_field_plan_entries(diffsync_model):
+            if field_plan_entry.field_type == FieldTypeEnum.CUSTOM_FIELD:
+                continue
+            if field_plan_entry.field_type not in (FieldTypeEnum.ATTRIBUTE, FieldTypeEnum.FOREIGN_KEY):
+                return False
+            if hasattr(self, f"load_param_{field_plan_entry.name}"):
+                return False
+            if not self._is_values_lookup(diffsync_model._model, field_plan_entry.name):
+                return False
+        for children_parameter, children_field in diffsync_model._children.items():
+            try:
+                children_relation = diffsync_model._model._meta.get_field(children_field)
+            except FieldDoesNotExist:
+                return False
+            # Children are grouped by the foreign key pointing to their parent.
+            if not isinstance(children_relation, ManyToOneRel):
+                return False
+            if not self._can_load_with_values(self._get_diffsync_class(model_name=children_parameter)):
+                return False
+        return True
+
+    @staticmethod
+    def _is_values_lookup(model_class, lookup) -> bool:
+        """Check whether a lookup like `tenant__group__name` resolves to a single column through foreign keys only."""
+        *related_field_names, field_name = lookup.split("__")
+        try:
+            for related_field_name in related_field_names:
+                related_field = model_class._meta.get_field(related_field_name)
+                # Generic foreign keys can't be joined and to-many relationships would duplicate rows.
+                if not (related_field.many_to_one or related_field.one_to_one) or not related_field.related_model:
+                    return False
+                model_class = related_field.related_model
+            field = model_class._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return False
+        return field.concrete and not field.is_relation
+
+    def _load_objects_with_values(self, diffsync_model, queryset, parent_field_name=None):
+        """Load diffsync objects (and their children) from `values_list` rows of a queryset.
+
+        The children of the loaded objects are filtered for by the primary keys of their parents in the database, in
+        chunks of `_CHILDREN_PARENT_PKS_CHUNK_SIZE` parents, so that only the children of the loaded objects are read.
+
+        Args:
+            diffsync_model: The diffsync model class to load.
+            queryset: The queryset to load the objects from.
+            parent_field_name: For children, the name of the foreign key pointing to their parent.
+
+        Returns: The loaded diffsync objects grouped by the primary key of their parent.
+        """
+        field_plan_entries = self._get_field_plan_entries(diffsync_model)
+        columns = ["pk"]
+        for field_plan_entry in field_plan_entries:
+            column = (
+                "_custom_field_data"
+                if field_plan_entry.field_type == FieldTypeEnum.CUSTOM_FIELD
+                else field_plan_entry.name
+            )
+            if column not in columns:
+                columns.append(column)
+        if parent_field_name:
+            columns.append(parent_field_name)
+        column_indices = {column: index for index, column in enumerate(columns)}
+
+        diffsync_objects_by_parent = defaultdict(list)
+        diffsync_objects_by_pk = {}
+        # Prefetching only applies to model instances.
+        for row in queryset.prefetch_related(None).values_list(*columns):
+            parameters = {}
+            for field_plan_entry in field_plan_entries:
+                if field_plan_entry.field_type == FieldTypeEnum.CUSTOM_FIELD:
+                    custom_field_data = row[column_indices["_custom_field_data"]] or {}
+                    if field_plan_entry.custom_field_key in custom_field_data:
+                        parameters[field_plan_entry.name] = custom_field_data[field_plan_entry.custom_field_key]
+                    continue
+                parameters[field_plan_entry.name] = row[column_indices[field_plan_entry.name]]
+            parameters["pk"] = row[0]
+            diffsync_object = self._add_diffsync_object(diffsync_model, parameters)
+            diffsync_objects_by_pk[row[0]] = diffsync_object
+            if parent_field_name:
+                diffsync_objects_by_parent[row[-1]].append(diffsync_object)
+
+        for children_parameter, children_field in diffsync_model._children.items():
+            diffsync_model_child = self._get_diffsync_class(model_name=children_parameter)
+            children_parent_field_name = diffsync_model._model._meta.get_field(children_field).field.name
+            parent_pks = list(diffsync_objects_by_pk)
+            for index in range(0, len(parent_pks), _CHILDREN_PARENT_PKS_CHUNK_SIZE):
+                children_queryset = diffsync_model_child._get_queryset().filter(
+                    **{f"{children_parent_field_name}__in": parent_pks[index : index + _CHILDREN_PARENT_PKS_CHUNK_SIZE]}
+                )
+                children_by_parent = self._load_objects_with_values(
+                    diffsync_model_child, children_queryset, children_parent_field_name
+                )
+                for parent_pk, children in children_by_parent.items():
+                    for child in children:
+                        diffsync_objects_by_pk[parent_pk].add_child(child)
+        return diffsync_objects_by_parent
+
+    def _get_queryset_with_children(self, diffsync_model):
+        """Get the queryset for a diffsync model with all of its children (and theirs) prefetched.
+
+        The children are prefetched using their own diffsync model's `_get_queryset`, meaning each level of children is
+        loaded with a constant amount of queries regardless of the amount of parents.
+        """
+        children_prefetches = [
+            Prefetch(
+                children_field,
+                queryset=self._get_queryset_with_children(self._get_diffsync_class(model_name=children_parameter)),
+            )
+            for children_parameter, children_field in diffsync_model._children.items()
+        ]
+        return diffsync_model._get_queryset().prefetch_related(*children_prefetches)
+
+    def _get_field_plan_entries(self, diffsync_model):
+        """Get the field plan entries for all the parameters of a diffsync model, see `NautobotModel.get_field_plan`."""
+        if diffsync_model not in self._field_plan_entries:
+            field_plan = diffsync_model.get_field_plan()
+            self._field_plan_entries[diffsync_model] = [
+                field_plan[parameter_name] for parameter_name in self._get_parameter_names(diffsync_model)
+            ]
+        return self._field_plan_entries[diffsync_model]
+
+    def _handle_single_parameter(self, parameters, field_plan_entry, database_object, diffsync_model):
+        parameter_name = field_plan_entry.name
+        field_type = field_plan_entry.field_type
+
+        # Handle custom fields. See CustomFieldAnnotation docstring for more details.
+        if field_type == FieldTypeEnum.CUSTOM_FIELD:
+            if field_plan_entry.custom_field_key in database_object.cf:
+                parameters[parameter_name] = database_object.cf[field_plan_entry.custom_field_key]
             return
 
         # Handling of foreign keys where the local side is the many and the remote side the one.
         # Note: This includes the side of a generic foreign key that has the foreign key, i.e.
         # the 'many' side.
-        if "__" in parameter_name:
-            if custom_relationship_annotation:
-                parameters[parameter_name] = self._handle_custom_relationship_foreign_key(
-                    database_object, parameter_name, custom_relationship_annotation
-                )
-            else:
-                parameters[parameter_name] = self._handle_foreign_key(database_object, parameter_name)
+        if field_type == FieldTypeEnum.CUSTOM_RELATIONSHIP_FOREIGN_KEY:
+            parameters[parameter_name] = self._handle_custom_relationship_foreign_key(
+                database_object, parameter_name, field_plan_entry.custom_relationship_annotation
+            )
+            return
+        if field_type == FieldTypeEnum.FOREIGN_KEY:
+            parameters[parameter_name] = self._handle_foreign_key(database_object, parameter_name)
             return
 
         # Handling of one- and many-to custom relationship fields:
-        if custom_relationship_annotation:
+        if field_type == FieldTypeEnum.CUSTOM_RELATIONSHIP_TO_MANY:
             parameters[parameter_name] = self._handle_custom_relationship_to_many_relationship(
-                database_object, diffsync_model, parameter_name, custom_relationship_annotation
+                database_object, field_plan_entry
             )
             return
 
-        database_field = diffsync_model._model._meta.get_field(parameter_name)
-
         # Handling of one- and many-to-many non-custom relationship fields.
         # Note: This includes the side of a generic foreign key that constitutes the foreign key,
         # i.e. the 'one' side.
-        if database_field.many_to_many or database_field.one_to_many:
-            parameters[parameter_name] = self._handle_to_many_relationship(
-                database_object, diffsync_model, parameter_name
-            )
+        if field_type == FieldTypeEnum.TO_MANY:
+            parameters[parameter_name] = self._handle_to_many_relationship(database_object, field_plan_entry)
             return
 
         # Handling of normal fields - as this is the default case, set the attribute directly.
@@ -137,29 +741,35 @@ class NautobotAdapter(Adapter):
         else:
             parameters[parameter_name] = getattr(database_object, parameter_name)
 
-    def _load_single_object(self, database_object, diffsync_model, parameter_names):
+    def _load_single_object(self, database_object, diffsync_model, field_plan_entries):
         """Load a single diffsync object from a single database object."""
         parameters = {}
-        for parameter_name in parameter_names:
-            self._handle_single_parameter(parameters, parameter_name, database_object, diffsync_model)
+        for field_plan_entry in field_plan_entries:
+            self._handle_single_parameter(parameters, field_plan_entry, database_object, diffsync_model)
         parameters["pk"] = database_object.pk
-        try:
-            diffsync_model = diffsync_model(**parameters)
-        except pydantic.ValidationError as error:
-            raise ValueError(f"Parameters: {parameters}") from error
-        self.add(diffsync_model)
+        diffsync_model = self._add_diffsync_object(diffsync_model, parameters)
 
         self._handle_children(database_object, diffsync_model)
         return diffsync_model
 
+    def _add_diffsync_object(self, diffsync_model, parameters):
+        """Instantiate a diffsync object from its parameters and add it to the adapter."""
+        try:
+            diffsync_object = diffsync_model(**parameters)
+        except pydantic.ValidationError as error:
+            raise ValueError(f"Parameters: {parameters}") from error
+        self.add(diffsync_object)
+        return diffsync_object
+
     def _handle_children(self, database_object, diffsync_model):
         """Recurse through all the children for this model."""
         for children_parameter, children_field in diffsync_model._children.items():
+            # This doesn't query the database, as the children are prefetched by `_get_queryset_with_children`.
             children = getattr(database_object, children_field).all()
             diffsync_model_child = self._get_diffsync_class(model_name=children_parameter)
+            field_plan_entries = self._get_field_plan_entries(diffsync_model_child)
             for child in children:
-                parameter_names = self._get_parameter_names(diffsync_model_child)
-                child_diffsync_object = self._load_single_object(child, diffsync_model_child, parameter_names)
+                child_diffsync_object = self._load_single_object(child, diffsync_model_child, field_plan_entries)
                 diffsync_model.add_child(child_diffsync_object)
 
     def load(self):
@@ -172,7 +782,8 @@ class NautobotAdapter(Adapter):
 
             # This function directly mutates the diffsync store, i.e. it will create and load the objects
             # for this specific model class as well as its children without returning anything.
-            self._load_objects(diffsync_model)
+            with time_load(self, model_name):
+                self._load_objects(diffsync_model)
 
     def _get_diffsync_class(self, model_name):
         """Given a model name, return the diffsync class."""
@@ -184,41 +795,16 @@ class NautobotAdapter(Adapter):
             ) from error
         return diffsync_model
 
-    def _handle_custom_relationship_to_many_relationship(
-        self, database_object, diffsync_model, parameter_name, annotation
-    ):
-        # Introspect type annotations to deduce which fields are of interest
-        # for this many-to-many relationship.
-        diffsync_field_type = get_type_hints(diffsync_model)[parameter_name]
-        inner_type = get_args(diffsync_field_type)[0]
+    def _handle_custom_relationship_to_many_relationship(self, database_object, field_plan_entry):
+        annotation = field_plan_entry.custom_relationship_annotation
         related_objects_list = []
         # TODO: Allow for filtering, i.e. not taking into account all the objects behind the relationship.
         relationship = self.get_from_orm_cache({"label": annotation.name}, Relationship)
-        relationship_association_parameters = self._construct_relationship_association_parameters(
-            annotation, database_object
-        )
-        relationship_associations = RelationshipAssociation.objects.filter(**relationship_association_parameters)
-
-        field_name = ""
-        field_name += "source" if annotation.side == RelationshipSideEnum.DESTINATION else "destination"
-        field_name += "_"
-        field_name += (
-            relationship.source_type.app_label.lower()
-            if annotation.side == RelationshipSideEnum.DESTINATION
-            else relationship.destination_type.app_label.lower()
-        )
-        field_name += "_"
-        field_name += (
-            relationship.source_type.model.lower()
-            if annotation.side == RelationshipSideEnum.DESTINATION
-            else relationship.destination_type.model.lower()
-        )
-
-        for association in relationship_associations:
+        for association in self._get_relationship_associations(annotation, database_object):
             related_object = getattr(
                 association, "source" if annotation.side == RelationshipSideEnum.DESTINATION else "destination"
             )
-            dictionary_representation = self._handle_typed_dict(inner_type, related_object)
+            dictionary_representation = self._handle_typed_dict(field_plan_entry.typed_dict_fields, related_object)
             # Only use those where there is a single field defined, all 'None's will not help us.
             if any(dictionary_representation.values()):
                 related_objects_list.append(dictionary_representation)
@@ -241,45 +827,55 @@ class NautobotAdapter(Adapter):
         return related_objects_list
 
     @classmethod
-    def _handle_typed_dict(cls, inner_type, related_object):
+    def _handle_typed_dict(cls, typed_dict_fields, related_object):
         """Handle a typed dict for many to many relationships.
 
         Args:
-            inner_type: The typed dict.
+            typed_dict_fields: The field names of the typed dict.
             related_object: The related object
-        Returns: The dictionary representation of `related_object` as described by `inner_type`.
+        Returns: The dictionary representation of `related_object` as described by the typed dict.
         """
         dictionary_representation = {}
-        for field_name in get_type_hints(inner_type):
+        for field_name in typed_dict_fields:
             if "__" in field_name:
                 dictionary_representation[field_name] = cls._handle_foreign_key(related_object, field_name)
                 continue
             dictionary_representation[field_name] = getattr(related_object, field_name)
         return dictionary_representation
 
-    def _construct_relationship_association_parameters(self, annotation, database_object):
-        relationship = self.get_from_orm_cache({"label": annotation.name}, Relationship)
-        relationship_association_parameters = {
-            "relationship": relationship,
-            "source_type": relationship.source_type,
-            "destination_type": relationship.destination_type,
-        }
-        if annotation.side == RelationshipSideEnum.SOURCE:
-            relationship_association_parameters["source_id"] = database_object.id
-        else:
-            relationship_association_parameters["destination_id"] = database_object.id
-        return relationship_association_parameters
+    def _get_relationship_associations(self, annotation, database_object):
+        """Get the relationship associations for one side of a custom relationship on a single database object.
+
+        All the associations of the relationship are loaded with a single query on first use and grouped by the id of
+        the object on the annotated side. This is reset for every model class that is loaded, see `_load_objects`.
+        """
+        key = (annotation.name, annotation.side)
+        if key not in self._relationship_associations:
+            relationship = self.get_from_orm_cache({"label": annotation.name}, Relationship)
+            if annotation.side == RelationshipSideEnum.SOURCE:
+                own_id_field, related_field = "source_id", "destination"
+            else:
+                own_id_field, related_field = "destination_id", "source"
+            associations_by_id = defaultdict(list)
+            for association in RelationshipAssociation.objects.filter(
+                relationship=relationship,
+                source_type=relationship.source_type,
+                destination_type=relationship.destination_type,
+            ).prefetch_related(related_field):
+                associations_by_id[getattr(association, own_id_field)].append(association)
+            self._relationship_associations[key] = associations_by_id
+        return self._relationship_associations[key].get(database_object.id, [])
 
     @staticmethod
-    def _handle_to_many_relationship(database_object, diffsync_model, parameter_name):
+    def _handle_to_many_relationship(database_object, field_plan_entry):
         """Handle a single one- or many-to-many relationship field.
 
         one- or many-to-many relationships are type annotated as a list of typed dictionaries. The typed
         dictionary type expresses, which attributes we are interested in for diffsync.
 
         :param database_object: The Django ORM database object
-        :param diffsync_model: The diffsync model class (not specific object) for this ORM object
-        :param parameter_name: The field name of the specific relationship to handle
+        :param field_plan_entry: The field plan entry of the specific relationship to handle, see
+            `NautobotModel.get_field_plan`
         :return: A list of dictionaries which represent the related objects.
 
         :example:
@@ -309,7 +905,7 @@ class NautobotAdapter(Adapter):
             ip_addresses: List[IPAddressDict] = []
         ```
 
-        - a field name like `ip_addresses` as the `parameter_name`
+        - the field plan entry for a field like `ip_addresses` as the `field_plan_entry`
 
         Example return list within the above input example:
 
@@ -320,13 +916,12 @@ class NautobotAdapter(Adapter):
         ]
         ```
         """
-        # Introspect type annotations to deduce which fields are of interest
-        # for this many-to-many relationship.
-        inner_type = get_args(get_type_hints(diffsync_model)[parameter_name])[0]
         related_objects_list = []
         # TODO: Allow for filtering, i.e. not taking into account all the objects behind the relationship.
-        for related_object in getattr(database_object, parameter_name).all():
-            dictionary_representation = NautobotAdapter._handle_typed_dict(inner_type, related_object)
+        for related_object in getattr(database_object, field_plan_entry.name).all():
+            dictionary_representation = NautobotAdapter._handle_typed_dict(
+                field_plan_entry.typed_dict_fields, related_object
+            )
             # Only use those where there is a single field defined, all 'None's will not help us.
             if any(dictionary_representation.values()):
                 related_objects_list.append(dictionary_representation)
@@ -336,16 +931,12 @@ class NautobotAdapter(Adapter):
         self, database_object, parameter_name: str, annotation: CustomRelationshipAnnotation
     ):
         """Handle a single custom relationship foreign key field."""
-        relationship_association_parameters = self._construct_relationship_association_parameters(
-            annotation, database_object
-        )
-
-        relationship_association = RelationshipAssociation.objects.filter(**relationship_association_parameters)
-        amount_of_relationship_associations = relationship_association.count()
+        relationship_associations = self._get_relationship_associations(annotation, database_object)
+        amount_of_relationship_associations = len(relationship_associations)
         if amount_of_relationship_associations == 0:
             return None
         if amount_of_relationship_associations == 1:
-            association = relationship_association.first()
+            association = relationship_associations[0]
             related_object = getattr(
                 association, "source" if annotation.side == RelationshipSideEnum.DESTINATION else "destination"
             )
@@ -4,13 +4,14 @@
 # Diffsync relies on underscore-prefixed attributes quite heavily, which is why we disable this here.
 
 from collections import defaultdict
-from typing import ClassVar, Optional
+from typing import ClassVar, Dict, Optional, get_args
 from uuid import UUID
 
 from diffsync import DiffSyncModel
 from diffsync.exceptions import ObjectCrudException, ObjectNotCreated, ObjectNotDeleted, ObjectNotUpdated
+from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import MultipleObjectsReturned, ValidationError
+from django.core.exceptions import FieldDoesNotExist, MultipleObjectsReturned, ValidationError
 from django.db.models import Model, ProtectedError
 from nautobot.extras.choices import RelationshipTypeChoices
 from nautobot.extras.models import Relationship, RelationshipAssociation
@@ -19,6 +20,8 @@ from typing_extensions import get_type_hints
 from nautobot_ssot.contrib.types import (
     CustomFieldAnnotation,
     CustomRelationshipAnnotation,
+    FieldPlanEntry,
+    FieldTypeEnum,
     RelationshipSideEnum,
 )
 
@@ -36,26 +39,166 @@ class NautobotModel(DiffSyncModel):
 
     _model: ClassVar[Model]
 
+    # Field plans compiled by `get_field_plan`, keyed by the model class they belong to.
+    _field_plans: ClassVar[Dict[type, Dict[str, FieldPlanEntry]]] = {}
+
     pk: Optional[UUID] = None
 
     @classmethod
     def _get_queryset(cls):
         """Get the queryset used to load the models data from Nautobot."""
-        available_fields = {field.name for field in cls._model._meta.get_fields()}
-        parameter_names = [
-            parameter for parameter in list(cls._identifiers) + list(cls._attributes) if parameter in available_fields
-        ]
-        # Here we identify any foreign keys (i.e. fields with '__' in them) so that we can load them directly in the
-        # first query if this function hasn't been overridden.
-        prefetch_related_parameters = [parameter.split("__")[0] for parameter in parameter_names if "__" in parameter]
         qs = cls.get_queryset()
-        return qs.prefetch_related(*prefetch_related_parameters)
+        return qs.prefetch_related(*cls._get_prefetch_related_lookups())
+
+    @classmethod
+    def _get_prefetch_related_lookups(cls):
+        """Get the lookups to load all foreign keys and to-many relationships with a constant amount of queries."""
+        prefetch_related_lookups = set()
+        for field_plan_entry in cls.get_field_plan().values():
+            # Here we identify any foreign keys (i.e. fields with '__' in them) so that we can load them directly in
+            # the first query if this function hasn't been overridden. The whole relation path is prefetched, i.e.
+            # `tenant__tenant_group` for `tenant__tenant_group__name`, so that no hop is fetched per related object.
+            if field_plan_entry.field_type == FieldTypeEnum.FOREIGN_KEY:
+                relation_path = cls._get_relation_path(cls._model, field_plan_entry.name)
+                if relation_path:
+                    prefetch_related_lookups.add(relation_path)
+            # For to-many relationships, foreign keys in the typed dictionary are loaded along with the related
+            # objects, i.e. `vlans__location` for a `vlans` field with `location__name` in its typed dictionary.
+            elif field_plan_entry.field_type == FieldTypeEnum.TO_MANY:
+                prefetch_related_lookups.add(field_plan_entry.name)
+                related_model = field_plan_entry.related_model
+                for typed_dict_field in field_plan_entry.typed_dict_fields:
+                    relation_path = cls._get_relation_path(related_model, typed_dict_field)
+                    if relation_path:
+                        prefetch_related_lookups.add(f"{field_plan_entry.name}__{relation_path}")
+        return sorted(prefetch_related_lookups)
+
+    @staticmethod
+    def _get_relation_path(model_class, lookup):
+        """Get the longest part of a `__` delimited lookup, without its final attribute, that only traverses relations.
+
+        For example, this is `tenant__tenant_group` for `tenant__tenant_group__name` and empty for `name`. Relations
+        without a single related model, such as generic foreign keys, end the path.
+        """
+        relation_path = []
+        for field_name in lookup.split("__")[:-1]:
+            if model_class is None:
+                break
+            try:
+                field = model_class._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                break
+            if not field.is_relation:
+                break
+            relation_path.append(field_name)
+            model_class = field.related_model
+        return "__".join(relation_path)
 
     @classmethod
     def get_queryset(cls):
         """Get the queryset used to load the models data from Nautobot."""
         return cls._model.objects.all()
 
+    @classmethod
+    def get_field_plan(cls) -> Dict[str, FieldPlanEntry]:
+        """Get the field plan for this model class, i.e. how to load and set each of its identifiers and attributes.
+
+        Introspecting the type annotations is expensive, which is why the plan is only compiled once per model class.
+        """
+        if cls not in cls._field_plans:
+            type_hints = get_type_hints(cls, include_extras=True)
+            cls._field_plans[cls] = {
+                name: cls._compile_field_plan_entry(name, type_hints[name])
+                for name in list(cls._identifiers) + list(cls._attributes)
+            }
+        return cls._field_plans[cls]
+
+    @classmethod
+    def _get_field_plan_entry(cls, name) -> FieldPlanEntry:
+        """Get the field plan entry for a single field, compiling it if it is neither an identifier nor an attribute."""
+        field_plan = cls.get_field_plan()
+        if name not in field_plan:
+            field_plan[name] = cls._compile_field_plan_entry(name, get_type_hints(cls, include_extras=True)[name])
+        return field_plan[name]
+
+    @classmethod
+    def _compile_field_plan_entry(cls, name, type_hint) -> FieldPlanEntry:
+        """Use the type annotation of a single field to determine how it maps to the ORM model."""
+        # Handle custom fields and custom relationships. See CustomFieldAnnotation and CustomRelationshipAnnotation
+        # docstrings for more details.
+        custom_relationship_annotation = None
+        for metadata in getattr(type_hint, "__metadata__", []):
+            if isinstance(metadata, CustomFieldAnnotation):
+                return FieldPlanEntry(
+                    name=name,
+                    field_type=FieldTypeEnum.CUSTOM_FIELD,
+                    custom_field_key=metadata.key,
+                    concrete_field_names=("_custom_field_data",),
+                )
+            if isinstance(metadata, CustomRelationshipAnnotation):
+                custom_relationship_annotation = metadata
+                break
+
+        # Foreign keys, i.e. `tenant__group__name` is the `group__name` lookup on the `tenant` foreign key.
+        if "__" in name:
+            related_field_name, lookup = name.split("__", maxsplit=1)
+            if custom_relationship_annotation:
+                return FieldPlanEntry(
+                    name=name,
+                    field_type=FieldTypeEnum.CUSTOM_RELATIONSHIP_FOREIGN_KEY,
+                    related_field_name=related_field_name,
+                    lookup=lookup,
+                    custom_relationship_annotation=custom_relationship_annotation,
+                )
+            django_field = cls._model._meta.get_field(related_field_name)
+            if isinstance(django_field, GenericForeignKey):
+                concrete_field_names = (django_field.ct_field, django_field.fk_field)
+            else:
+                concrete_field_names = (django_field.name,)
+            return FieldPlanEntry(
+                name=name,
+                field_type=FieldTypeEnum.FOREIGN_KEY,
+                related_field_name=related_field_name,
+                lookup=lookup,
+                related_model=django_field.related_model,
+                concrete_field_names=concrete_field_names,
+            )
+
+        if custom_relationship_annotation:
+            return FieldPlanEntry(
+                name=name,
+                field_type=FieldTypeEnum.CUSTOM_RELATIONSHIP_TO_MANY,
+                custom_relationship_annotation=custom_relationship_annotation,
+                typed_dict_fields=cls._get_typed_dict_fields(type_hint),
+            )
+
+        django_field = cls._model._meta.get_field(name)
+        if django_field.many_to_many or django_field.one_to_many:
+            return FieldPlanEntry(
+                name=name,
+                field_type=FieldTypeEnum.TO_MANY,
+                related_model=django_field.related_model,
+                typed_dict_fields=cls._get_typed_dict_fields(type_hint),
+            )
+        return FieldPlanEntry(
+            name=name,
+            field_type=FieldTypeEnum.ATTRIBUTE,
+            concrete_field_names=(django_field.name,) if django_field.concrete else (),
+        )
+
+    @staticmethod
+    def _get_typed_dict_fields(type_hint):
+        """Get the field names of the typed dictionary in a type hint such as `List[TypedDict]`."""
+        # Strip `Annotated`, leaving for example `List[TypedDict]` or `Optional[TypedDict]`.
+        if hasattr(type_hint, "__metadata__"):
+            type_hint = type_hint.__origin__
+        type_arguments = get_args(type_hint)
+        inner_type = type_arguments[0] if type_arguments else type_hint
+        try:
+            return tuple(get_type_hints(inner_type))
+        except TypeError:
+            return ()
+
     @classmethod
     def _check_field(cls, name):
         """Check whether the given field name is defined on the diffsync (pydantic) model."""
@@ -80,6 +223,10 @@ class NautobotModel(DiffSyncModel):
 
     def delete(self):
         """Delete the ORM object corresponding to this diffsync object."""
+        if getattr(self.adapter, "bulk_operations", False):
+            # Protected objects can only be detected once the deletion is flushed, see `NautobotAdapter._bulk_delete`.
+            self.adapter.enqueue_delete(self._model, self.pk)
+            return super().delete()
         try:
             obj = self.get_from_db()
         except ObjectCrudException as error:
@@ -109,7 +256,7 @@ class NautobotModel(DiffSyncModel):
         return super().create(adapter, ids, attrs)
 
     @classmethod
-    def _handle_single_field(cls, field, obj, value, relationship_fields, adapter):  # pylint: disable=too-many-arguments,too-many-locals, too-many-branches
+    def _handle_single_field(cls, field, obj, value, relationship_fields, adapter):  # pylint: disable=too-many-arguments
         """Set a single field on a Django object to a given value, or, for relationship fields, prepare setting.
 
         :param field: The name of the field to set.
@@ -119,21 +266,13 @@ class NautobotModel(DiffSyncModel):
             This is mutated over the course of this function.
         :param adapter: The related diffsync adapter used for looking up things in the cache.
         """
-        # Use type hints at runtime to determine which fields are custom fields
-        type_hints = get_type_hints(cls, include_extras=True)
-
         cls._check_field(field)
+        field_plan_entry = cls._get_field_plan_entry(field)
 
         # Handle custom fields. See CustomFieldAnnotation docstring for more details.
-        custom_relationship_annotation = None
-        metadata_for_this_field = getattr(type_hints[field], "__metadata__", [])
-        for metadata in metadata_for_this_field:
-            if isinstance(metadata, CustomFieldAnnotation):
-                obj.cf[metadata.key] = value
-                return
-            if isinstance(metadata, CustomRelationshipAnnotation):
-                custom_relationship_annotation = metadata
-                break
+        if field_plan_entry.field_type == FieldTypeEnum.CUSTOM_FIELD:
+            obj.cf[field_plan_entry.custom_field_key] = value
+            return
 
         # Prepare handling of foreign keys and custom relationship foreign keys.
         # Example: If field is `tenant__group__name`, then
@@ -144,24 +283,22 @@ class NautobotModel(DiffSyncModel):
         # `foreign_keys["tenant"]["_model_class"] = nautobot.tenancy.models.Tenant
         # For custom relationship foreign keys, we add the annotation instead:
         # `custom_relationship_foreign_keys["tenant"]["_annotation"] = CustomRelationshipAnnotation(...)
-        if "__" in field:
-            related_model, lookup = field.split("__", maxsplit=1)
-            # Custom relationship foreign keys
-            if custom_relationship_annotation:
-                relationship_fields["custom_relationship_foreign_keys"][related_model][lookup] = value
-                relationship_fields["custom_relationship_foreign_keys"][related_model]["_annotation"] = (
-                    custom_relationship_annotation
-                )
-            # Normal foreign keys
-            else:
-                django_field = cls._model._meta.get_field(related_model)
-                relationship_fields["foreign_keys"][related_model][lookup] = value
-                # Add a special key to the dictionary to point to the related model's class
-                relationship_fields["foreign_keys"][related_model]["_model_class"] = django_field.related_model
+        related_field_name = field_plan_entry.related_field_name
+        if field_plan_entry.field_type == FieldTypeEnum.CUSTOM_RELATIONSHIP_FOREIGN_KEY:
+            relationship_fields["custom_relationship_foreign_keys"][related_field_name][field_plan_entry.lookup] = value
+            relationship_fields["custom_relationship_foreign_keys"][related_field_name]["_annotation"] = (
+                field_plan_entry.custom_relationship_annotation
+            )
+            return
+        if field_plan_entry.field_type == FieldTypeEnum.FOREIGN_KEY:
+            relationship_fields["foreign_keys"][related_field_name][field_plan_entry.lookup] = value
+            # Add a special key to the dictionary to point to the related model's class
+            relationship_fields["foreign_keys"][related_field_name]["_model_class"] = field_plan_entry.related_model
             return
 
         # Prepare handling of custom relationship many-to-many fields.
-        if custom_relationship_annotation:
+        if field_plan_entry.field_type == FieldTypeEnum.CUSTOM_RELATIONSHIP_TO_MANY:
+            custom_relationship_annotation = field_plan_entry.custom_relationship_annotation
             relationship = adapter.get_from_orm_cache({"label": custom_relationship_annotation.name}, Relationship)
             if custom_relationship_annotation.side == RelationshipSideEnum.DESTINATION:
                 related_object_content_type = relationship.source_type
@@ -184,22 +321,21 @@ class NautobotModel(DiffSyncModel):
 
             return
 
-        django_field = cls._model._meta.get_field(field)
-
         # Prepare handling of many-to-many fields. If we are dealing with a many-to-many field,
         # we get all the related objects here to later set them once the object has been saved.
-        if django_field.many_to_many or django_field.one_to_many:
+        if field_plan_entry.field_type == FieldTypeEnum.TO_MANY:
+            related_model = field_plan_entry.related_model
             try:
                 relationship_fields["many_to_many_fields"][field] = [
-                    adapter.get_from_orm_cache(parameters, django_field.related_model) for parameters in value
+                    adapter.get_from_orm_cache(parameters, related_model) for parameters in value
                 ]
-            except django_field.related_model.DoesNotExist as error:
+            except related_model.DoesNotExist as error:
                 raise ObjectCrudException(
-                    f"Unable to populate many to many relationship '{django_field.name}' with parameters {value}, at least one related object not found."
+                    f"Unable to populate many to many relationship '{field}' with parameters {value}, at least one related object not found."
                 ) from error
             except MultipleObjectsReturned as error:
                 raise ObjectCrudException(
-                    f"Unable to populate many to many relationship '{django_field.name}' with parameters {value}, at least one related object found twice."
+                    f"Unable to populate many to many relationship '{field}' with parameters {value}, at least one related object found twice."
                 ) from error
             return
 
@@ -225,12 +361,21 @@ class NautobotModel(DiffSyncModel):
         # Set foreign keys
         cls._lookup_and_set_foreign_keys(relationship_fields["foreign_keys"], obj, adapter)
 
+        if getattr(adapter, "bulk_operations", False):
+            cls._enqueue_obj_with_parameters(obj, parameters, relationship_fields, adapter)
+            return
+
         # Save the object to the database
         try:
             obj.validated_save()
         except ValidationError as error:
             raise ObjectCrudException(f"Validated save failed for Django object. Parameters: {parameters}") from error
 
+        cls._set_relationship_fields(relationship_fields, obj, adapter)
+
+    @classmethod
+    def _set_relationship_fields(cls, relationship_fields, obj, adapter):
+        """Set the relationship fields that require `obj` to already exist in the database."""
         # Handle relationship association creation. This needs to be after object creation, because relationship
         # association objects rely on both sides already existing.
         cls._lookup_and_set_custom_relationship_foreign_keys(
@@ -243,6 +388,50 @@ class NautobotModel(DiffSyncModel):
         # Set many-to-many fields after saving.
         cls._set_many_to_many_fields(relationship_fields["many_to_many_fields"], obj)
 
+    @classmethod
+    def _enqueue_obj_with_parameters(cls, obj, parameters, relationship_fields, adapter):
+        """Validate a Nautobot ORM object and queue it for a bulk write instead of saving it.
+
+        See `NautobotAdapter.bulk_operations` for more details.
+        """
+        # Foreign keys pointing to objects that are queued for creation themselves can't be validated yet.
+        pending_foreign_keys = [
+            field_name
+            for field_name in relationship_fields["foreign_keys"]
+            if getattr(obj, field_name) is not None and getattr(obj, field_name)._state.adding
+        ]
+        # Uniqueness is enforced by the database once the queue is flushed.
+        try:
+            obj.full_clean(exclude=pending_foreign_keys, validate_unique=False)
+        except ValidationError as error:
+            raise ObjectCrudException(f"Validated save failed for Django object. Parameters: {parameters}") from error
+
+        if obj._state.adding:
+            adapter.enqueue_create(obj)
+        else:
+            adapter.enqueue_update(obj, cls._get_concrete_field_names(parameters))
+
+        if any(
+            relationship_fields[key]
+            for key in (
+                "custom_relationship_foreign_keys",
+                "custom_relationship_many_to_many_fields",
+                "many_to_many_fields",
+            )
+        ):
+            adapter.enqueue_relationship_operation(
+                lambda: cls._set_relationship_fields(relationship_fields, obj, adapter)
+            )
+
+    @classmethod
+    def _get_concrete_field_names(cls, parameters):
+        """Map diffsync field names to the names of the database fields that are written when setting them."""
+        return {
+            field_name
+            for parameter_name in parameters
+            for field_name in cls._get_field_plan_entry(parameter_name).concrete_field_names
+        }
+
     @classmethod
     def _set_custom_relationship_to_many_fields(cls, custom_relationship_many_to_many_fields, obj, adapter):
         for _, dictionary in custom_relationship_many_to_many_fields.items():
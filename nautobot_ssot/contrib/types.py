@@ -5,7 +5,9 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple, Type
+
+from django.db.models import Model
 
 
 class RelationshipSideEnum(Enum):
@@ -89,3 +91,48 @@ class CustomFieldAnnotation:
                 self.key = self.name
             else:
                 raise ValueError("The 'key' field on CustomFieldAnnotation needs to be set.")
+
+
+class FieldTypeEnum(Enum):
+    """This details how a field on a `NautobotModel` maps to its Nautobot ORM model."""
+
+    # A plain attribute on the ORM model, e.g. `name`.
+    ATTRIBUTE = "ATTRIBUTE"
+    # A lookup on the object behind a (generic) foreign key, e.g. `tenant__group__name`.
+    FOREIGN_KEY = "FOREIGN_KEY"
+    # A custom field, see `CustomFieldAnnotation`.
+    CUSTOM_FIELD = "CUSTOM_FIELD"
+    # A one- or many-to-many relationship, e.g. `tags`.
+    TO_MANY = "TO_MANY"
+    # A lookup on the object behind a custom relationship, see `CustomRelationshipAnnotation`.
+    CUSTOM_RELATIONSHIP_FOREIGN_KEY = "CUSTOM_RELATIONSHIP_FOREIGN_KEY"
+    # A custom relationship with multiple objects on the other side, see `CustomRelationshipAnnotation`.
+    CUSTOM_RELATIONSHIP_TO_MANY = "CUSTOM_RELATIONSHIP_TO_MANY"
+
+
+@dataclass(frozen=True)
+class FieldPlanEntry:  # pylint: disable=too-many-instance-attributes
+    """Describe how to load and set a single field of a `NautobotModel`.
+
+    These are compiled once per model class from the type annotations, see `NautobotModel.get_field_plan`.
+    """
+
+    name: str
+    field_type: FieldTypeEnum
+
+    # For (custom relationship) foreign keys: `tenant__group__name` has the related field name `tenant` and the
+    # lookup `group__name`.
+    related_field_name: Optional[str] = None
+    lookup: Optional[str] = None
+    # For foreign keys and to-many relationships, the model class on the other side. This is `None` for generic
+    # foreign keys.
+    related_model: Optional[Type[Model]] = None
+
+    custom_field_key: Optional[str] = None
+    custom_relationship_annotation: Optional[CustomRelationshipAnnotation] = None
+
+    # For to-many relationships, the field names of the typed dictionary describing the related objects.
+    typed_dict_fields: Tuple[str, ...] = ()
+
+    # The database fields on the ORM model that are written when setting this field.
+    concrete_field_names: Tuple[str, ...] = ()
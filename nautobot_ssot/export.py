@@ -0,0 +1,124 @@
+"""Streaming export of the diff and log entries of Syncs to newline-delimited JSON or Parquet files."""
+
+import json
+import os
+from itertools import islice
+from typing import Dict, Iterable, Iterator
+
+from nautobot_ssot.models import DiffJSONEncoder
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+EXPORT_FORMATS = ("jsonl", "parquet")
+
+# Fields of SyncLogEntry that are exported, `synced_object_type` is exported as "<app_label>.<model>".
+_LOG_FIELDS = ("timestamp", "action", "status", "synced_object_id", "object_repr", "message", "diff")
+
+# Columns of the exported diff and log entry rows.
+DIFF_COLUMNS = ("model_type", "name", "diff")
+LOG_COLUMNS = (*_LOG_FIELDS[:3], "synced_object_type", *_LOG_FIELDS[3:])
+
+
+def iter_diff_rows(sync) -> Iterator[Dict]:
+    """Yield a row per top-level element of the diff of a Sync, decompressing one diff chunk at a time."""
+    for model_type, diffs in sync.iter_diff_chunks():
+        for name, diff in diffs.items():
+            yield {"model_type": model_type, "name": name, "diff": diff}
+
+
+def iter_log_rows(sync, chunk_size: int = 1000) -> Iterator[Dict]:
+    """Yield a row per log entry of a Sync, fetching `chunk_size` log entries from the database at a time."""
+    log_entries = (
+        sync.logs.order_by("timestamp")
+        .values_list(*_LOG_FIELDS, "synced_object_type__app_label", "synced_object_type__model")
+        .iterator(chunk_size=chunk_size)
+    )
+    for *values, app_label, model in log_entries:
+        row = dict(zip(_LOG_FIELDS, values))
+        row["synced_object_type"] = f"{app_label}.{model}" if app_label else None
+        yield row
+
+
+def write_jsonl(rows: Iterable[Dict], path: str) -> int:
+    """Write each row as a line of JSON to `path`, returning the number of rows written."""
+    count = 0
+    with open(path, "w", encoding="utf-8") as file:
+        for row in rows:
+            file.write(json.dumps(row, cls=DiffJSONEncoder))
+            file.write("\n")
+            count += 1
+    return count
+
+
+def _to_parquet_string(value):
+    """Convert a value to the string stored in a Parquet string column, nested values being stored as JSON."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, cls=DiffJSONEncoder)
+    return str(value)
+
+
+def write_parquet(rows: Iterable[Dict], path: str, columns: Iterable[str], batch_size: int = 1000) -> int:
+    """Write the rows to a Parquet file at `path` in row groups of `batch_size` rows, returning the number of rows.
+
+    The `timestamp` column is stored as a timestamp, all other `columns` as strings. This requires `pyarrow`.
+    """
+    if pyarrow is None:
+        raise RuntimeError("Exporting to Parquet requires the pyarrow package to be installed.")
+    schema = pyarrow.schema(
+        [
+            (column, pyarrow.timestamp("us", tz="UTC") if column == "timestamp" else pyarrow.string())
+            for column in columns
+        ]
+    )
+    rows = iter(rows)
+    count = 0
+    with pyarrow.parquet.ParquetWriter(path, schema) as writer:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            writer.write_batch(
+                pyarrow.record_batch(
+                    [
+                        [
+                            row[field.name] if field.name == "timestamp" else _to_parquet_string(row[field.name])
+                            for row in batch
+                        ]
+                        for field in schema
+                    ],
+                    schema=schema,
+                )
+            )
+            count += len(batch)
+    return count
+
+
+def export_sync(sync, directory: str, export_format: str = "jsonl", chunk_size: int = 1000) -> Dict[str, int]:
+    """Export the diff and the log entries of a Sync to `<pk>_diff.<format>` and `<pk>_logs.<format>` in `directory`.
+
+    The rows are streamed to the files, so that memory use doesn't depend on the number of log entries.
+
+    Returns:
+        dict: The number of rows written per file path.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {export_format!r}, expected one of {', '.join(EXPORT_FORMATS)}.")
+    os.makedirs(directory, exist_ok=True)
+    results = {}
+    exports = (
+        ("diff", iter_diff_rows(sync), DIFF_COLUMNS),
+        ("logs", iter_log_rows(sync, chunk_size=chunk_size), LOG_COLUMNS),
+    )
+    for name, rows, columns in exports:
+        path = os.path.join(directory, f"{sync.pk}_{name}.{export_format}")
+        if export_format == "parquet":
+            results[path] = write_parquet(rows, path, columns, batch_size=chunk_size)
+        else:
+            results[path] = write_jsonl(rows, path)
+    return results
@@ -2,7 +2,7 @@
 
 import django_filters
 from django.db.models import Q
-from nautobot.apps.filters import BaseFilterSet
+from nautobot.apps.filters import BaseFilterSet, ContentTypeFilter
 
 from .models import Sync, SyncLogEntry
 
@@ -14,13 +14,26 @@ class SyncFilterSet(BaseFilterSet):
         """Metaclass attributes of SyncFilter."""
 
         model = Sync
-        fields = ["dry_run", "job_result"]
+        fields = [
+            "source",
+            "target",
+            "dry_run",
+            "job_result",
+            "num_unchanged",
+            "num_created",
+            "num_updated",
+            "num_deleted",
+            "num_succeeded",
+            "num_failed",
+            "num_errored",
+        ]
 
 
 class SyncLogEntryFilterSet(BaseFilterSet):
     """Filter capabilities for SyncLogEntry instances."""
 
     q = django_filters.CharFilter(method="search", label="Search")
+    synced_object_type = ContentTypeFilter()
 
     class Meta:
         """Metaclass attributes of SyncLogEntryFilter."""
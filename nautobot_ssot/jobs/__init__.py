@@ -12,6 +12,7 @@ from nautobot.extras.models import Job
 from nautobot_ssot.integrations.utils import each_enabled_integration, each_enabled_integration_module
 from nautobot_ssot.jobs.base import DataSource, DataTarget
 from nautobot_ssot.jobs.examples import ExampleDataSource, ExampleDataTarget
+from nautobot_ssot.jobs.maintenance import jobs as maintenance_jobs
 
 logger = logging.getLogger("nautobot.ssot")
 
@@ -26,6 +27,7 @@ if is_truthy(hide_jobs_setting):
     jobs = []
 else:
     jobs = [ExampleDataSource, ExampleDataTarget]
+jobs.extend(maintenance_jobs)
 
 
 class JobException(Exception):
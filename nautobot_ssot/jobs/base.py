@@ -1,23 +1,45 @@
 """Base Job classes for sync workers."""
 
+import cProfile
+import gzip
+import json
+import threading
 import tracemalloc
-from collections import namedtuple
-from datetime import datetime
-from typing import Iterable, Optional
+import zlib
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import structlog
 
 # pylint-django doesn't understand classproperty, and complains unnecessarily. We disable this specific warning:
 # pylint: disable=no-self-argument
 from diffsync.enum import DiffSyncFlags
+from django import forms
+from django.core.files.base import ContentFile
+from django.db import connections, transaction
 from django.db.utils import OperationalError
 from django.templatetags.static import static
 from django.utils import timezone
 from django.utils.functional import classproperty
-from nautobot.extras.jobs import BooleanVar, DryRunVar, Job
-
-from nautobot_ssot.choices import SyncLogEntryActionChoices
-from nautobot_ssot.models import BaseModel, Sync, SyncLogEntry
+from nautobot.extras.choices import JobResultStatusChoices
+from nautobot.extras.jobs import BooleanVar, DryRunVar, Job, StringVar
+from nautobot.extras.models import JobResult
+
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices, SyncLogPolicyChoices
+from nautobot_ssot.jobs.syncer import BatchedTransactionSyncer, ModelTimingSyncer
+from nautobot_ssot.models import SYNC_RESULT_COUNTERS, BaseModel, DiffJSONEncoder, Sync, SyncLogEntry
+from nautobot_ssot.profiling import (
+    ModelStatistics,
+    dump_cpu_profiles,
+    get_cpu_statistics,
+    get_memory_statistics,
+    profile_cpu,
+    record_queries,
+    take_memory_snapshot,
+)
 
 DataMapping = namedtuple("DataMapping", ["source_name", "source_url", "target_name", "target_url"])
 """Entry in the list returned by a job's data_mappings() API.
@@ -32,6 +54,12 @@ and the other system acting as data source/target.
 * target_url: URL (if any) to hyperlink the target_name.
 """
 
+# Variables of jobs with a `shard_key`, set when enqueueing the child job for each shard.
+SHARD_VARS = {
+    "shard": StringVar(required=False, default="", widget=forms.HiddenInput),
+    "parent_sync": StringVar(required=False, default="", widget=forms.HiddenInput),
+}
+
 
 class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
     """Common base class for data synchronization jobs.
@@ -47,6 +75,33 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
 
     dryrun = DryRunVar(description="Perform a dry-run, making no actual changes to Nautobot data.", default=True)
     memory_profiling = BooleanVar(description="Perform a memory profiling analysis.", default=False)
+    cpu_profiling = BooleanVar(description="Perform a CPU profiling analysis of each sync phase.", default=False)
+    delta_sync = BooleanVar(
+        description="Only load data changed since the last sync. Deletions are only reconciled by full syncs.",
+        default=False,
+    )
+
+    # SyncLogEntry records are buffered and written to the database in chunks of this size, see `flush_sync_log`.
+    sync_log_batch_size = 1000
+
+    # Load both adapters at the same time, see `load_adapters_in_parallel`.
+    parallel_load = False
+
+    # When this is set, a snapshot of the loaded source adapter is stored with each sync and reused instead of loading
+    # the source adapter by later syncs of this job within this time, see `restore_source_snapshot`.
+    source_snapshot_ttl: Optional[timedelta] = None
+    # Version of the snapshot format, snapshots of other versions are ignored.
+    source_snapshot_schema_version = 1
+
+    # Number of entries kept for the rankings of the profiling statistics recorded per phase, such as the top statements.
+    profiling_top_n = 10
+
+    # When this is set, `execute_sync` commits the changes to the database in one transaction per this many operations
+    # rather than one per operation, see `BatchedTransactionSyncer`.
+    sync_transaction_batch_size: Optional[int] = None
+
+    # When this is set, the sync is split up into a child job per value returned by `get_shards`, see `enqueue_shards`.
+    shard_key: Optional[str] = None
 
     def load_source_adapter(self):
         """Method to instantiate and load the SOURCE adapter into `self.source_adapter`.
@@ -57,6 +112,30 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         """
         raise NotImplementedError
 
+    def get_shards(self) -> List[str]:
+        """Method to get the values of `shard_key` to sync separately, e.g. the names of all locations.
+
+        Each shard is synced by a child job, in which `self.shard` is set to its value. The adapters are expected to
+        only load the data of `self.shard` there. When `self.shard` is `None`, i.e. in the parent job, the adapters are
+        expected to only load the data shared by all shards, such as the objects referenced from several shards.
+        """
+        return []
+
+    def create_source_adapter(self):
+        """Method to instantiate the SOURCE adapter without loading it, to restore a snapshot into.
+
+        Returning `None` (the default) disables source snapshots, see `source_snapshot_ttl`.
+        """
+        return None
+
+    def source_checksum(self) -> Optional[str]:
+        """Method to cheaply compute a checksum of the SOURCE data, e.g. from a revision or last-modified timestamp.
+
+        A source snapshot is only reused if its checksum matches. Returning `None` (the default) reuses any snapshot
+        within `source_snapshot_ttl`.
+        """
+        return None
+
     def load_target_adapter(self):
         """Method to instantiate and load the TARGET adapter into `self.target_adapter`.
 
@@ -77,8 +156,7 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             self.sync.summary = self.diff.summary()
             self.sync.save()
             try:
-                self.sync.diff = self.diff.dict()
-                self.sync.save()
+                self.sync.store_diff(self.diff)
             except OperationalError:
                 self.logger.warning("Unable to save JSON diff to the database; likely the diff is too large.")
                 self.sync.refresh_from_db()
@@ -92,10 +170,51 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         This is a generic implementation that you could overwrite completely in your custom logic.
         """
         if self.source_adapter is not None and self.target_adapter is not None:
-            self.source_adapter.sync_to(self.target_adapter, flags=self.diffsync_flags)
+            if self.sync_transaction_batch_size:
+                self.execute_batched_sync()
+            else:
+                self.perform_sync(self.create_syncer(ModelTimingSyncer))
         else:
             self.logger.warning("Not both adapters were properly initialized prior to synchronization.")
 
+    def execute_batched_sync(self):
+        """Synchronize from SOURCE to TARGET adapter in transactions of `sync_transaction_batch_size` operations.
+
+        The amount of commits and the batch timings are recorded in `self.sync.transaction_statistics`. Buffered log
+        entries are only written after each commit, so that they aren't rolled back along with a batch.
+        """
+        syncer = self.create_syncer(
+            BatchedTransactionSyncer, batch_size=self.sync_transaction_batch_size, after_commit=self.flush_sync_log
+        )
+        # Log entries written while a batch is open would be rolled back along with it, see `_buffer_sync_log_entry`.
+        self._batched_syncer = syncer
+        try:
+            self.perform_sync(syncer)
+        finally:
+            self._batched_syncer = None
+            self.sync.transaction_statistics = syncer.get_statistics()
+
+    def create_syncer(self, syncer_class, **kwargs) -> ModelTimingSyncer:
+        """Create a syncer of `syncer_class` for the diff from SOURCE to TARGET adapter.
+
+        Like `Adapter.sync_to`, the diff is calculated anew. The syncer records the create, update and delete
+        operations in `self.model_statistics`.
+        """
+        diff = self.target_adapter.diff_from(self.source_adapter, flags=self.diffsync_flags)
+        return syncer_class(
+            diff=diff,
+            src_diffsync=self.source_adapter,
+            dst_diffsync=self.target_adapter,
+            flags=self.diffsync_flags,
+            model_statistics=self.model_statistics,
+            **kwargs,
+        )
+
+    def perform_sync(self, syncer: ModelTimingSyncer):
+        """Perform the sync of a syncer from `create_syncer` and let the TARGET adapter know if anything changed."""
+        if syncer.perform_sync():
+            self.target_adapter.sync_complete(self.source_adapter, syncer.diff, self.diffsync_flags, syncer.base_logger)
+
     def sync_data(self, memory_profiling):
         """Method to load data from adapters, calculate diffs and sync (if not dry-run).
 
@@ -123,11 +242,20 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
                     return "%.0f %s" % (size, unit)  # pylint: disable=consider-using-f-string
                 size /= 1024
 
+        previous_memory_snapshot = None
+
         def record_memory_trace(step: str):
-            """Helper function to record memory usage and reset tracemalloc stats."""
+            """Helper function to record memory usage and allocation sites and reset tracemalloc stats."""
+            nonlocal previous_memory_snapshot
             memory_final, memory_peak = tracemalloc.get_traced_memory()
             setattr(self.sync, f"{step}_memory_final", memory_final)
             setattr(self.sync, f"{step}_memory_peak", memory_peak)
+            # The traces are cleared after each step, so a snapshot holds the memory allocated and kept by its step.
+            memory_snapshot = take_memory_snapshot()
+            self.sync.memory_statistics[step] = get_memory_statistics(
+                memory_snapshot, previous_memory_snapshot, self.profiling_top_n
+            )
+            previous_memory_snapshot = memory_snapshot
             self.sync.save()
             self.logger.info(
                 "Traced memory for %s (Final, Peak): %s, %s",
@@ -142,32 +270,50 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
 
         if memory_profiling:
             tracemalloc.start()
+            self.sync.memory_statistics = {}
 
+        self.sync.query_statistics = {}
+        if self._cpu_profiles is not None:
+            self.sync.cpu_statistics = {}
         start_time = datetime.now()
 
-        self.logger.info("Loading current data from source adapter...")
-        self.load_source_adapter()
-        load_source_adapter_time = datetime.now()
-        self.sync.source_load_time = load_source_adapter_time - start_time
-        self.sync.save()
-        self.logger.info("Source Load Time from %s: %s", self.source_adapter, self.sync.source_load_time)
-        if memory_profiling:
-            record_memory_trace("source_load")
+        if self.parallel_load and not memory_profiling and self._cpu_profiles is None and self.delta_since is None:
+            self.load_adapters_in_parallel()
+            load_target_adapter_time = datetime.now()
+        else:
+            if self.parallel_load:
+                self.logger.info(
+                    "Loading adapters one after the other, as required for memory and CPU profiling and delta syncs."
+                )
+            self.logger.info("Loading current data from source adapter...")
+            with self.profile_phase("source_load"):
+                self.load_source_adapter_or_snapshot()
+            load_source_adapter_time = datetime.now()
+            self.sync.source_load_time = load_source_adapter_time - start_time
+            self.sync.save()
+            self.flush_sync_log()
+            self.logger.info("Source Load Time from %s: %s", self.source_adapter, self.sync.source_load_time)
+            if memory_profiling:
+                record_memory_trace("source_load")
 
-        self.logger.info("Loading current data from target adapter...")
-        self.load_target_adapter()
-        load_target_adapter_time = datetime.now()
-        self.sync.target_load_time = load_target_adapter_time - load_source_adapter_time
-        self.sync.save()
-        self.logger.info("Target Load Time from %s: %s", self.target_adapter, self.sync.target_load_time)
-        if memory_profiling:
-            record_memory_trace("target_load")
+            self.logger.info("Loading current data from target adapter...")
+            with self.profile_phase("target_load"):
+                self.load_target_adapter()
+            load_target_adapter_time = datetime.now()
+            self.sync.target_load_time = load_target_adapter_time - load_source_adapter_time
+            self.sync.save()
+            self.flush_sync_log()
+            self.logger.info("Target Load Time from %s: %s", self.target_adapter, self.sync.target_load_time)
+            if memory_profiling:
+                record_memory_trace("target_load")
 
         self.logger.info("Calculating diffs...")
-        self.calculate_diff()
+        with self.profile_phase("diff"):
+            self.calculate_diff()
         calculate_diff_time = datetime.now()
         self.sync.diff_time = calculate_diff_time - load_target_adapter_time
         self.sync.save()
+        self.flush_sync_log()
         self.logger.info("Diff Calculation Time: %s", self.sync.diff_time)
         if memory_profiling:
             record_memory_trace("diff")
@@ -176,15 +322,202 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             self.logger.info("As `dryrun` is set, skipping the actual data sync.")
         else:
             self.logger.info("Syncing from %s to %s...", self.source_adapter, self.target_adapter)
-            self.execute_sync()
+            with self.profile_phase("sync"):
+                self.execute_sync()
             execute_sync_time = datetime.now()
             self.sync.sync_time = execute_sync_time - calculate_diff_time
             self.sync.save()
+            self.flush_sync_log()
             self.logger.info("Sync complete")
             self.logger.info("Sync Time: %s", self.sync.sync_time)
             if memory_profiling:
                 record_memory_trace("sync")
 
+        self.record_cache_statistics()
+
+    @contextmanager
+    def profile_phase(self, phase: str):
+        """Profile a phase of `sync_data` and store the results on `self.sync`.
+
+        The database queries run by the phase on the current thread are recorded in `self.sync.query_statistics`.
+        With CPU profiling enabled, the functions taking the most time are recorded in `self.sync.cpu_statistics`.
+
+        Args:
+            phase: Name of the phase, one of "source_load", "target_load", "diff" and "sync".
+        """
+        with ExitStack() as stack:
+            queries = stack.enter_context(record_queries())
+            profiler = stack.enter_context(profile_cpu()) if self._cpu_profiles is not None else None
+            try:
+                yield
+            finally:
+                stack.close()
+                self.sync.query_statistics[phase] = queries.get_statistics(self.profiling_top_n)
+                self.sync.model_stats = self.model_statistics.as_dict()
+                if profiler is not None:
+                    self._cpu_profiles[phase] = profiler
+                    self.sync.cpu_statistics[phase] = get_cpu_statistics(profiler, self.profiling_top_n)
+
+    def store_cpu_profile(self):
+        """Store the CPU profiles of all phases as a single `.pstats` file on `self.sync`, see `profile_phase`."""
+        if not self._cpu_profiles:
+            return
+        content = dump_cpu_profiles(self._cpu_profiles.values())
+        self.sync.cpu_profile.save(f"{self.sync.pk}.pstats", ContentFile(content), save=False)
+        self.sync.save(update_fields=["cpu_profile", "cpu_statistics"])
+
+    def load_source_adapter_or_snapshot(self):
+        """Restore the source adapter from a recent snapshot if possible, otherwise load it and store a snapshot."""
+        if self.restore_source_snapshot():
+            return
+        self.load_source_adapter()
+        self.store_source_snapshot()
+
+    def _source_snapshots_enabled(self) -> bool:
+        """Check whether source snapshots are stored and restored by this sync."""
+        # Delta syncs only load part of the data, so their snapshots can't stand in for a full load.
+        return self.source_snapshot_ttl is not None and self.delta_since is None
+
+    @staticmethod
+    def _get_source_adapter_class_path(source_adapter) -> str:
+        """Get the class path of a source adapter, snapshots are only restored into adapters of the same class."""
+        return f"{type(source_adapter).__module__}.{type(source_adapter).__qualname__}"
+
+    def store_source_snapshot(self):
+        """Store the contents of the loaded source adapter as a gzip-compressed JSON file on `self.sync`."""
+        if not self._source_snapshots_enabled() or self.source_adapter is None:
+            return
+        snapshot = {
+            "schema_version": self.source_snapshot_schema_version,
+            "adapter": self._get_source_adapter_class_path(self.source_adapter),
+            "checksum": self.source_checksum(),
+            "data": self.source_adapter.dict(mode="json"),
+        }
+        content = gzip.compress(json.dumps(snapshot, cls=DiffJSONEncoder).encode())
+        self.sync.source_snapshot.save(f"{self.sync.pk}.json.gz", ContentFile(content), save=False)
+        self.sync.save(update_fields=["source_snapshot"])
+
+    def restore_source_snapshot(self) -> bool:
+        """Restore the source adapter from the snapshot of the latest sync of this job within `source_snapshot_ttl`.
+
+        Returns whether a snapshot was restored into `self.source_adapter`.
+        """
+        if not self._source_snapshots_enabled():
+            return False
+        source_adapter = self.create_source_adapter()
+        if source_adapter is None:
+            return False
+        previous_sync = (
+            Sync.objects.filter(
+                source=self.data_source,
+                target=self.data_target,
+                shard=self.sync.shard,
+                start_time__gte=self.sync.start_time - self.source_snapshot_ttl,
+            )
+            .exclude(pk=self.sync.pk)
+            .exclude(source_snapshot="")
+            .order_by("-start_time")
+            .first()
+        )
+        if previous_sync is None:
+            return False
+        try:
+            with previous_sync.source_snapshot.open("rb") as snapshot_file:
+                snapshot = json.loads(gzip.decompress(snapshot_file.read()))
+        except (OSError, ValueError) as error:
+            self.logger.warning("Unable to read the source snapshot of %s: %s", previous_sync, error)
+            return False
+        if snapshot.get("schema_version") != self.source_snapshot_schema_version:
+            return False
+        if snapshot.get("adapter") != self._get_source_adapter_class_path(source_adapter):
+            return False
+        checksum = self.source_checksum()
+        if checksum is not None and checksum != snapshot.get("checksum"):
+            self.logger.info("Source data changed since the snapshot of %s was taken.", previous_sync)
+            return False
+        source_adapter.load_from_dict(snapshot["data"])
+        self.source_adapter = source_adapter
+        self.logger.info("Restored source data from the snapshot of %s.", previous_sync)
+        return True
+
+    def load_adapters_in_parallel(self):
+        """Load the non-Nautobot adapter in a worker thread while the Nautobot adapter is loaded on this thread.
+
+        The load time of each adapter is recorded on `self.sync` individually.
+        """
+
+        def timed_load(side):
+            start_time = datetime.now()
+            with self.profile_phase(f"{side}_load"):
+                if side == "source":
+                    self.load_source_adapter_or_snapshot()
+                else:
+                    self.load_target_adapter()
+            setattr(self.sync, f"{side}_load_time", datetime.now() - start_time)
+
+        def worker_load(side):
+            try:
+                timed_load(side)
+            finally:
+                # Django opens separate database connections for the worker thread and doesn't close them itself.
+                connections.close_all()
+
+        nautobot_side, remote_side = ("source", "target") if self.data_source == "Nautobot" else ("target", "source")
+        self.logger.info("Loading current data from source and target adapters in parallel...")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            remote_load = executor.submit(worker_load, remote_side)
+            timed_load(nautobot_side)
+            remote_load.result()
+        self.sync.save()
+        self.flush_sync_log()
+        self.logger.info("Source Load Time from %s: %s", self.source_adapter, self.sync.source_load_time)
+        self.logger.info("Target Load Time from %s: %s", self.target_adapter, self.sync.target_load_time)
+
+    def record_cache_statistics(self):
+        """Store the ORM cache statistics of the adapters that provide them on `self.sync`.
+
+        This applies to adapters based on `nautobot_ssot.contrib.NautobotAdapter`, see its `get_cache_statistics`.
+        """
+        cache_statistics = {}
+        for side, adapter in (("source", self.source_adapter), ("target", self.target_adapter)):
+            if hasattr(adapter, "get_cache_statistics"):
+                cache_statistics[side] = adapter.get_cache_statistics()
+        if cache_statistics:
+            self.sync.cache_statistics = cache_statistics
+            self.sync.save()
+
+    def get_delta_watermark(self) -> Optional[datetime]:
+        """Get the high-water mark of the last completed sync of this job that wasn't a dry-run.
+
+        Returns `None` if there is none, in which case a delta sync loads all data. Syncs of other jobs with the same
+        `data_source` and `data_target` aren't taken into account.
+        """
+        return (
+            Sync.objects.filter(
+                source=self.data_source,
+                target=self.data_target,
+                shard=self.sync.shard,
+                job_result__job_model=self.job_result.job_model,
+                watermark__isnull=False,
+            )
+            .exclude(pk=self.sync.pk)
+            .order_by("-watermark")
+            .values_list("watermark", flat=True)
+            .first()
+        )
+
+    def get_delta_identifiers(self, model_name) -> List[dict]:
+        """Get the identifiers of the objects of a model the source reports as changed in a delta sync.
+
+        `nautobot_ssot.contrib.NautobotAdapter` loads the objects matching these identifiers in addition to the ones
+        updated since `delta_since`. By default, these are the identifiers of all the objects loaded by the source
+        adapter, unless Nautobot is the source. Source adapters are therefore expected to only load the records changed
+        since `delta_since` in a delta sync.
+        """
+        if self.source_adapter is None or self.data_source == "Nautobot":
+            return []
+        return [diffsync_object.get_identifiers() for diffsync_object in self.source_adapter.get_all(model_name)]
+
     def lookup_object(self, model_name, unique_id) -> Optional[BaseModel]:  # pylint: disable=unused-argument
         """Look up the Nautobot record, if any, identified by the args.
 
@@ -199,6 +532,21 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         """
         return None
 
+    def lookup_objects(self, model_name, unique_ids) -> Dict[str, Optional[BaseModel]]:
+        """Look up the Nautobot records, if any, identified by a model name and several unique ids.
+
+        Used to resolve the synced objects of buffered SyncLogEntry records with a single call per model. The default
+        implementation calls `lookup_object` for each unique id, override this to look them up with a single query.
+
+        Args:
+            model_name (str): DiffSyncModel class name or similar class/model label.
+            unique_ids (Iterable[str]): DiffSyncModel unique_ids or similar unique identifiers.
+
+        Returns:
+            Dict[str, Optional[BaseModel]]: Nautobot model instance (or None) by unique id
+        """
+        return {unique_id: self.lookup_object(model_name, unique_id) for unique_id in unique_ids}
+
     @classmethod
     def data_mappings(cls) -> Iterable[DataMapping]:
         """List the data mappings involved in this sync job."""
@@ -222,36 +570,136 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         synced_object=None,
         object_repr="",
     ):
-        """Log a action message as a SyncLogEntry."""
+        """Log a action message as a SyncLogEntry.
+
+        The entry is buffered and only written to the database by `flush_sync_log`.
+        """
         if synced_object and not object_repr:
             object_repr = repr(synced_object)
 
-        SyncLogEntry.objects.create(
-            sync=self.sync,
-            action=action,
-            status=status,
-            message=message,
-            diff=diff,
-            synced_object=synced_object,
-            object_repr=object_repr,
+        self._buffer_sync_log_entry(
+            SyncLogEntry(
+                sync=self.sync,
+                action=action,
+                status=status,
+                message=message,
+                diff=diff,
+                synced_object=synced_object,
+                object_repr=object_repr,
+            )
+        )
+
+    def _buffer_sync_log_entry(self, log_entry, model_name=None, unique_id=None):
+        """Buffer a SyncLogEntry, optionally along with the model name and unique id to look up its synced object.
+
+        Entries that aren't to be recorded according to `sync_log_policy` are only counted, see `_count_sync_log_entry`.
+        The buffer isn't flushed while the transaction of a batch is open, see `execute_batched_sync`.
+        """
+        sample_key = (
+            f"{model_name} {unique_id}" if model_name is not None else log_entry.object_repr or log_entry.message
         )
+        with self._sync_log_lock:
+            self._count_sync_result(log_entry)
+            if not self._should_record_sync_log_entry(log_entry, sample_key):
+                self._count_sync_log_entry(log_entry, model_name)
+                return
+            self._sync_log_buffer.append((log_entry, model_name, unique_id))
+            if len(self._sync_log_buffer) >= self.sync_log_batch_size and not (
+                self._batched_syncer is not None and self._batched_syncer.in_batch
+            ):
+                self.flush_sync_log()
+
+    def _should_record_sync_log_entry(self, log_entry, sample_key):
+        """Return whether a SyncLogEntry is to be recorded according to `sync_log_policy`.
+
+        Sampling of unchanged entries is deterministic, the same records are sampled on every run of the job.
+        """
+        if self.sync_log_policy == SyncLogPolicyChoices.POLICY_ALL:
+            return True
+        if self.sync_log_policy == SyncLogPolicyChoices.POLICY_SUMMARY_ONLY:
+            return False
+        if (
+            log_entry.action != SyncLogEntryActionChoices.ACTION_NO_CHANGE
+            or log_entry.status != SyncLogEntryStatusChoices.STATUS_SUCCESS
+        ):
+            return True
+        if self.sync_log_policy == SyncLogPolicyChoices.POLICY_SAMPLE_UNCHANGED:
+            return zlib.crc32(sample_key.encode()) % 100 < self.sync_log_sample_percentage
+        return False
+
+    def _count_sync_result(self, log_entry):
+        """Count a SyncLogEntry in the result counters of the Sync (`num_created` etc.), see `SYNC_RESULT_COUNTERS`."""
+        for field_name, (field, value) in SYNC_RESULT_COUNTERS.items():
+            if getattr(log_entry, field) == value:
+                self._sync_result_counters[field_name] += 1
+        self._sync_result_counters_changed = True
+
+    def _count_sync_log_entry(self, log_entry, model_name=None):
+        """Count a SyncLogEntry that isn't recorded, the counters are stored in `Sync.log_counters`."""
+        counters = self._sync_log_counters
+        counters["actions"][log_entry.action] += 1
+        counters["statuses"][log_entry.status] += 1
+        if model_name is not None:
+            counters["models"][model_name][log_entry.action] += 1
+        self._sync_log_counters_changed = True
+
+    def flush_sync_log(self):
+        """Write all buffered SyncLogEntry records to the database.
+
+        The synced objects of the buffered entries are looked up using `lookup_objects` once per model beforehand.
+        The result counters of the Sync and the counters of entries that weren't recorded due to `sync_log_policy` are
+        saved to the Sync as well.
+        """
+        with self._sync_log_lock:
+            update_fields = []
+            if self._sync_log_counters_changed:
+                self.sync.log_counters = self._sync_log_counters
+                update_fields.append("log_counters")
+                self._sync_log_counters_changed = False
+            if self._sync_result_counters_changed:
+                for field_name in SYNC_RESULT_COUNTERS:
+                    setattr(self.sync, field_name, self._sync_result_counters[field_name])
+                update_fields.extend(SYNC_RESULT_COUNTERS)
+                self._sync_result_counters_changed = False
+            if update_fields:
+                self.sync.save(update_fields=update_fields)
+            if not self._sync_log_buffer:
+                return
+            buffered_entries, self._sync_log_buffer = self._sync_log_buffer, []
+
+            unique_ids_by_model = defaultdict(set)
+            for _, model_name, unique_id in buffered_entries:
+                if model_name is not None:
+                    unique_ids_by_model[model_name].add(unique_id)
+            synced_objects_by_model = {
+                model_name: self.lookup_objects(model_name, unique_ids)
+                for model_name, unique_ids in unique_ids_by_model.items()
+            }
+
+            log_entries = []
+            for log_entry, model_name, unique_id in buffered_entries:
+                if model_name is not None:
+                    synced_object = synced_objects_by_model[model_name].get(unique_id)
+                    log_entry.synced_object = synced_object
+                    log_entry.object_repr = repr(synced_object) if synced_object else f"{model_name} {unique_id}"
+                log_entries.append(log_entry)
+            SyncLogEntry.objects.bulk_create(log_entries, batch_size=self.sync_log_batch_size)
 
     def _structlog_to_sync_log_entry(self, _logger, _log_method, event_dict):
         """Capture certain structlog messages from DiffSync into the Nautobot database."""
         if all(key in event_dict for key in ("src", "dst", "action", "model", "unique_id", "diffs", "status")):
             # The DiffSync log gives us a model name (string) and unique_id (string).
-            # Try to look up the actual Nautobot object that this describes.
-            synced_object = self.lookup_object(  # pylint: disable=assignment-from-none
-                event_dict["model"], event_dict["unique_id"]
-            )
-            object_repr = repr(synced_object) if synced_object else f"{event_dict['model']} {event_dict['unique_id']}"
-            self.sync_log(
-                action=event_dict["action"] or SyncLogEntryActionChoices.ACTION_NO_CHANGE,
-                diff=event_dict["diffs"] if event_dict["action"] else None,
-                status=event_dict["status"],
-                message=event_dict["event"],
-                synced_object=synced_object,
-                object_repr=object_repr,
+            # The actual Nautobot object that this describes is looked up when the buffer is flushed.
+            self._buffer_sync_log_entry(
+                SyncLogEntry(
+                    sync=self.sync,
+                    action=event_dict["action"] or SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+                    diff=event_dict["diffs"] if event_dict["action"] else None,
+                    status=event_dict["status"],
+                    message=event_dict["event"],
+                ),
+                model_name=event_dict["model"],
+                unique_id=event_dict["unique_id"],
             )
 
         return event_dict
@@ -268,6 +716,15 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
 
         if hasattr(cls, "memory_profiling"):
             got_vars["memory_profiling"] = cls.memory_profiling
+
+        if hasattr(cls, "cpu_profiling"):
+            got_vars["cpu_profiling"] = cls.cpu_profiling
+
+        if hasattr(cls, "delta_sync"):
+            got_vars["delta_sync"] = cls.delta_sync
+
+        if cls.shard_key:
+            got_vars.update(SHARD_VARS)
         return got_vars
 
     def __init__(self):
@@ -277,8 +734,34 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         self.diff = None
         self.source_adapter = None
         self.target_adapter = None
+        # Only data changed after this is loaded in a delta sync, see `get_delta_watermark`.
+        self.delta_since = None
+        # The shard synced by this job, see `get_shards`.
+        self.shard = None
+        # Count and duration of the operations per DiffSync model, stored in `self.sync.model_stats` by `sync_data`.
+        self.model_statistics = ModelStatistics()
+        # CPU profiles per phase when CPU profiling is enabled, see `profile_phase`.
+        self._cpu_profiles: Optional[Dict[str, cProfile.Profile]] = None
+        # The serialized variables this job was run with, see `before_start`.
+        self._job_kwargs = {}
+        # Buffered SyncLogEntry records along with the model name and unique id to look up their synced object by.
+        self._sync_log_buffer: List[Tuple[SyncLogEntry, Optional[str], Optional[str]]] = []
+        # Guards the buffer, as entries may also be logged from the worker thread of `load_adapters_in_parallel`.
+        self._sync_log_lock = threading.RLock()
+        # The syncer of `execute_batched_sync` while it runs.
+        self._batched_syncer: Optional[BatchedTransactionSyncer] = None
         # Default diffsync flags. You can overwrite them at any time.
         self.diffsync_flags = DiffSyncFlags.CONTINUE_ON_FAILURE | DiffSyncFlags.LOG_UNCHANGED_RECORDS
+        # Which log entries are recorded as SyncLogEntry records. You can overwrite it at any time.
+        self.sync_log_policy = SyncLogPolicyChoices.POLICY_ALL
+        # Percentage of unchanged records that are recorded with `SyncLogPolicyChoices.POLICY_SAMPLE_UNCHANGED`.
+        self.sync_log_sample_percentage = 10
+        # Counters of log entries per action, status and model that aren't recorded due to the logging policy.
+        self._sync_log_counters = {"actions": Counter(), "statuses": Counter(), "models": defaultdict(Counter)}
+        self._sync_log_counters_changed = False
+        # Result counters of all log entries, whether recorded or not, stored on the Sync by `flush_sync_log`.
+        self._sync_result_counters = Counter()
+        self._sync_result_counters_changed = False
 
     @classmethod
     def as_form(cls, data=None, files=None, initial=None, approval_view=False):
@@ -308,8 +791,18 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         """Icon corresponding to the data_target."""
         return getattr(cls.Meta, "data_target_icon", None)
 
-    def run(self, dryrun, memory_profiling, *args, **kwargs):  # pylint:disable=arguments-differ
+    def before_start(self, task_id, args, kwargs):
+        """Keep the serialized variables of this job to enqueue its shards with, see `enqueue_shards`."""
+        self._job_kwargs = kwargs
+        return super().before_start(task_id, args, kwargs)
+
+    def run(  # pylint:disable=arguments-differ
+        self, dryrun, memory_profiling, *args, cpu_profiling=False, delta_sync=False, shard="", parent_sync="", **kwargs
+    ):
         """Job entry point from Nautobot - do not override!"""
+        self.shard = shard or None
+        self._cpu_profiles = {} if cpu_profiling else None
+        self.model_statistics = ModelStatistics()
         self.sync = Sync.objects.create(
             source=self.data_source,
             target=self.data_target,
@@ -317,6 +810,8 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             job_result=self.job_result,
             start_time=timezone.now(),
             diff={},
+            parent_id=parent_sync or None,
+            shard=shard,
         )
 
         # Add _structlog_to_sync_log_entry as a processor for structlog calls from DiffSync
@@ -327,7 +822,66 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             wrapper_class=structlog.stdlib.BoundLogger,
             cache_logger_on_first_use=True,
         )
-        self.sync_data(memory_profiling)
+        self.delta_since = self.get_delta_watermark() if delta_sync else None
+        if self.delta_since is not None:
+            self.logger.info("Loading data changed since %s.", self.delta_since)
+            # Objects that weren't loaded on the source side must not be deleted.
+            self.diffsync_flags |= DiffSyncFlags.SKIP_UNMATCHED_DST
+        elif delta_sync:
+            self.logger.info("No previous sync to compute a delta from, loading all data.")
+
+        succeeded = False
+        try:
+            self.sync_data(memory_profiling)
+            succeeded = True
+        finally:
+            # Make sure the log entries and profiles of a failed job aren't lost.
+            self.flush_sync_log()
+            self.store_cpu_profile()
+            if self.sync.parent_id and not succeeded:
+                # The partial results of a failed shard are merged too, the parent Sync records that it failed.
+                self.merge_into_parent_sync(succeeded=False)
+
+        if not dryrun and (self.sync.num_failed or self.sync.num_errored):
+            # The source won't report the objects of failed operations as changed again, so the next delta sync starts
+            # from the previous watermark to retry them.
+            self.logger.warning("Not advancing the delta sync watermark, as some operations failed.")
+        elif not dryrun:
+            # Data changed after the sync started may not have been synced, so this is the next delta's starting point.
+            self.sync.watermark = self.sync.start_time
+            self.sync.save()
+
+        if self.sync.parent_id:
+            self.merge_into_parent_sync()
+        elif self.shard_key:
+            self.enqueue_shards()
+
+    def enqueue_shards(self):
+        """Enqueue a child job with the same variables for each of the shards returned by `get_shards`.
+
+        This runs after the data shared by all shards has been synced by this job.
+        """
+        shards = self.get_shards()
+        self.logger.info("Enqueueing %s shards by %s.", len(shards), self.shard_key)
+        # Shards stay pending until their results are merged, see `merge_into_parent_sync`.
+        self.sync.shard_status = {shard: JobResultStatusChoices.STATUS_PENDING for shard in shards}
+        self.sync.save(update_fields=["shard_status"])
+        for shard in shards:
+            JobResult.enqueue_job(
+                self.job_result.job_model,
+                self.job_result.user,
+                **{**self._job_kwargs, "shard": shard, "parent_sync": str(self.sync.pk)},
+            )
+
+    def merge_into_parent_sync(self, succeeded=True):
+        """Merge the results of this shard into the Sync of the parent job, recording whether this shard succeeded."""
+        with transaction.atomic():
+            parent_sync = Sync.objects.select_for_update().get(pk=self.sync.parent_id)
+            parent_sync.merge_shard(self.sync, succeeded=succeeded)
+        if succeeded:
+            self.logger.info("Merged the results of shard %s into %s.", self.shard, parent_sync)
+        else:
+            self.logger.warning("Merged the partial results of failed shard %s into %s.", self.shard, parent_sync)
 
 
 # pylint: disable=abstract-method
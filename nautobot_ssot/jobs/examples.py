@@ -909,6 +909,13 @@ class ExampleDataSource(DataSource):
                 pass
         return None
 
+    def lookup_objects(self, model_name, unique_ids):
+        """Look up several Nautobot objects based on the DiffSync model name and their unique IDs."""
+        if model_name == "tenant":
+            tenants = {tenant.name: tenant for tenant in Tenant.objects.filter(name__in=unique_ids)}
+            return {unique_id: tenants.get(unique_id) for unique_id in unique_ids}
+        return super().lookup_objects(model_name, unique_ids)
+
 
 class ExampleDataTarget(DataTarget):
     """Sync Region and Site data from the local Nautobot instance to a remote Nautobot instance."""
@@ -1018,3 +1025,10 @@ class ExampleDataTarget(DataTarget):
             except Tenant.DoesNotExist:
                 pass
         return None
+
+    def lookup_objects(self, model_name, unique_ids):
+        """Look up several Nautobot objects based on the DiffSync model name and their unique IDs."""
+        if model_name == "tenant":
+            tenants = {tenant.name: tenant for tenant in Tenant.objects.filter(name__in=unique_ids)}
+            return {unique_id: tenants.get(unique_id) for unique_id in unique_ids}
+        return super().lookup_objects(model_name, unique_ids)
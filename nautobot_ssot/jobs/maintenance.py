@@ -0,0 +1,128 @@
+"""Jobs for the maintenance of the Sync history."""
+
+import os
+import tempfile
+
+from django.conf import settings
+from django.core.files import File
+from django.db.models import Q
+from nautobot.apps.utils import get_settings_or_config
+from nautobot.extras.jobs import ChoiceVar, DryRunVar, IntegerVar, Job, ObjectVar
+from nautobot.extras.models import FileProxy
+from nautobot.extras.models import Job as JobModel
+
+from nautobot_ssot.export import export_sync
+from nautobot_ssot.models import Sync
+from nautobot_ssot.retention import get_expired_syncs, get_retention_policy, purge_syncs
+
+name = "SSoT Maintenance"  # pylint: disable=invalid-name
+
+
+class ExportSync(Job):
+    """Job exporting the diff and the log entries of a Sync to downloadable files."""
+
+    sync = ObjectVar(model=Sync, description="Sync to export")
+    export_format = ChoiceVar(
+        choices=(("jsonl", "Newline-delimited JSON"), ("parquet", "Parquet")),
+        default="jsonl",
+        description="Parquet requires the pyarrow package to be installed.",
+    )
+    chunk_size = IntegerVar(
+        default=1000, min_value=1, description="Number of log entries loaded from the database at a time."
+    )
+
+    class Meta:
+        """Metaclass attributes of ExportSync."""
+
+        name = "Export Sync"
+        description = "Export the diff and the log entries of a Sync to newline-delimited JSON or Parquet files."
+        has_sensitive_variables = False
+
+    def run(self, sync, export_format, chunk_size):  # pylint: disable=arguments-differ
+        """Stream the diff and the log entries to files on disk and attach these to the JobResult."""
+        max_size = get_settings_or_config("JOB_CREATE_FILE_MAX_SIZE")
+        with tempfile.TemporaryDirectory() as directory:
+            results = export_sync(sync, directory, export_format=export_format, chunk_size=chunk_size)
+            for path, count in results.items():
+                filename = os.path.basename(path)
+                size = os.path.getsize(path)
+                if size > max_size:
+                    raise ValueError(
+                        f"{filename} is {size} bytes, but JOB_CREATE_FILE_MAX_SIZE is {max_size}. "
+                        "Use the `nautobot-server export_sync` command to export large Syncs."
+                    )
+                # Unlike `create_file`, this copies the file to storage without reading it into memory at once.
+                with open(path, "rb") as file:
+                    file_proxy = FileProxy.objects.create(
+                        name=filename, job_result=self.job_result, file=File(file, name=filename)
+                    )
+                self.logger.info("Exported %s rows to [%s](%s)", count, filename, file_proxy.file.url)
+
+
+class PurgeSyncHistory(Job):
+    """Job deleting the Syncs that are expired by the retention policy of their Job, in bounded chunks."""
+
+    keep_last = IntegerVar(default=10, min_value=0, description="Number of latest Syncs of each Job to keep.")
+    keep_days = IntegerVar(default=30, min_value=0, description="Keep Syncs that started less than this many days ago.")
+    keep_failed_days = IntegerVar(
+        default=90,
+        min_value=0,
+        description="Keep Syncs with failures or errors that started less than this many days ago.",
+    )
+    chunk_size = IntegerVar(default=1000, min_value=1, description="Maximum number of rows deleted per transaction.")
+    dryrun = DryRunVar(description="Only report the number of Syncs that would be deleted.")
+
+    class Meta:
+        """Metaclass attributes of PurgeSyncHistory."""
+
+        name = "Purge Sync History"
+        description = (
+            "Delete the Syncs expired by the retention policy of their Job, along with their log entries, "
+            "in chunks of bounded size. Schedule this Job to keep the Sync history from growing without bound."
+        )
+        has_sensitive_variables = False
+
+    def run(  # pylint: disable=arguments-differ, too-many-arguments
+        self, keep_last, keep_days, keep_failed_days, chunk_size, dryrun
+    ):
+        """Determine the expired Syncs of each Job and delete them, reporting the rows deleted per chunk."""
+        overrides = settings.PLUGINS_CONFIG["nautobot_ssot"].get("sync_retention", {})
+        job_model_ids = set(Sync.objects.order_by().values_list("job_result__job_model", flat=True).distinct())
+        job_models = JobModel.objects.in_bulk(job_model_ids - {None})
+
+        expired_syncs = []
+        for job_model_id in job_model_ids:
+            job_model = job_models.get(job_model_id)
+            if job_model_id is None:
+                syncs = Sync.objects.filter(
+                    Q(job_result__isnull=True) | Q(job_result__job_model__isnull=True)  # pylint: disable=unsupported-binary-operation
+                )
+            else:
+                syncs = Sync.objects.filter(job_result__job_model_id=job_model_id)
+            policy = get_retention_policy(job_model, keep_last, keep_days, keep_failed_days, overrides)
+            expired = get_expired_syncs(syncs, **policy)
+            self.logger.info(
+                "%s expired Syncs of %s, keeping the last %s Syncs, the Syncs of the last %s days "
+                "and the failed Syncs of the last %s days.",
+                len(expired),
+                job_model or "Syncs without a Job",
+                policy["keep_last"],
+                policy["keep_days"],
+                policy["keep_failed_days"],
+            )
+            expired_syncs.extend(expired)
+
+        if dryrun:
+            self.logger.info("Dry run, %s Syncs would be deleted.", len(expired_syncs))
+            return
+
+        totals = {}
+        for result in purge_syncs(expired_syncs, chunk_size=chunk_size):
+            self.logger.info("Deleted %s %s rows in %s seconds.", result["deleted"], result["model"], result["time"])
+            totals[result["model"]] = totals.get(result["model"], 0) + result["deleted"]
+        self.logger.info(
+            "Deleted %s.", ", ".join(f"{count} {model} rows" for model, count in totals.items()) or "nothing"
+        )
+
+
+jobs = [ExportSync, PurgeSyncHistory]
@@ -0,0 +1,138 @@
+"""DiffSync syncers used by the sync of `DataSyncBaseJob`."""
+
+import sys
+import time
+from contextlib import ExitStack
+from typing import Callable, Dict, Optional
+
+from diffsync.helpers import DiffSyncSyncer
+from django.db import transaction
+
+from nautobot_ssot.profiling import ModelStatistics
+
+
+class ModelTimingSyncer(DiffSyncSyncer):
+    """DiffSyncSyncer recording the count and duration of the create, update and delete operations per model."""
+
+    def __init__(self, *args, model_statistics: Optional[ModelStatistics] = None, **kwargs):
+        """Create a ModelTimingSyncer recording into `model_statistics`."""
+        super().__init__(*args, **kwargs)
+        self.model_statistics = model_statistics
+
+    def sync_model(self, src_model, dst_model, ids, attrs):
+        """Create/update/delete the current DiffSyncModel and record the duration of the operation."""
+        if self.action is None or self.model_statistics is None:
+            return super().sync_model(src_model=src_model, dst_model=dst_model, ids=ids, attrs=attrs)
+
+        start_time = time.perf_counter()
+        try:
+            return super().sync_model(src_model=src_model, dst_model=dst_model, ids=ids, attrs=attrs)
+        finally:
+            self.model_statistics.record(self.model_class.get_type(), self.action, time.perf_counter() - start_time)
+
+
+class BatchedTransactionSyncer(ModelTimingSyncer):
+    """DiffSyncSyncer wrapping every `batch_size` operations in a single database transaction.
+
+    Each operation runs in its own savepoint within the transaction of its batch. An operation that fails is rolled
+    back to its savepoint, so that with `DiffSyncFlags.CONTINUE_ON_FAILURE` the rest of the batch is still committed.
+    Any other exception rolls back the current batch and is raised.
+
+    `after_commit` is called after each batch is committed, e.g. to write the log entries of the batch. Anything written
+    to the database while a batch is open is rolled back along with it.
+    """
+
+    def __init__(self, *args, batch_size: int, after_commit: Optional[Callable[[], None]] = None, **kwargs):
+        """Create a BatchedTransactionSyncer committing after every `batch_size` operations."""
+        super().__init__(*args, **kwargs)
+        self.batch_size = batch_size
+        self.after_commit = after_commit
+        self.commits = 0
+        self.operations = 0
+        self.rolled_back_operations = 0
+        self.batch_time_total = 0.0
+        self.batch_time_max = 0.0
+        self._batch: Optional[ExitStack] = None
+        self._batch_start_time = 0.0
+        self._batch_operations = 0
+
+    @property
+    def in_batch(self) -> bool:
+        """Whether the transaction of a batch is open, anything written to the database now may still be rolled back."""
+        return self._batch is not None
+
+    def _start_batch(self):
+        """Open the transaction of a new batch."""
+        self._batch = ExitStack()
+        self._batch.enter_context(transaction.atomic())
+        self._batch_start_time = time.monotonic()
+        self._batch_operations = 0
+
+    def _commit_batch(self):
+        """Commit the transaction of the current batch, record its timing and call `after_commit`."""
+        self._batch.close()
+        self._batch = None
+        batch_time = time.monotonic() - self._batch_start_time
+        self.commits += 1
+        self.batch_time_total += batch_time
+        self.batch_time_max = max(self.batch_time_max, batch_time)
+        if self.after_commit is not None:
+            self.after_commit()
+
+    def perform_sync(self) -> bool:
+        """Perform data synchronization based on the provided diff, committing in batches."""
+        try:
+            changed = super().perform_sync()
+        except BaseException:
+            if self._batch is not None:
+                # Leaving the transaction with an exception rolls back the current batch.
+                self._batch.__exit__(*sys.exc_info())
+                self._batch = None
+            raise
+        if self._batch is not None:
+            self._commit_batch()
+        return changed
+
+    def sync_model(self, src_model, dst_model, ids, attrs):
+        """Create/update/delete the current DiffSyncModel within a savepoint of the current batch.
+
+        The transaction of a batch is only opened by its first operation, so unchanged records in between batches are
+        logged outside of any transaction.
+        """
+        if self.action is None:
+            return super().sync_model(src_model=src_model, dst_model=dst_model, ids=ids, attrs=attrs)
+
+        if self._batch is None:
+            self._start_batch()
+        savepoint = transaction.savepoint()
+        try:
+            changed, modified_model = super().sync_model(src_model=src_model, dst_model=dst_model, ids=ids, attrs=attrs)
+        except BaseException:
+            transaction.savepoint_rollback(savepoint)
+            raise
+        if modified_model is None:
+            # The operation failed and `CONTINUE_ON_FAILURE` is set, only its own changes are rolled back. A database
+            # error caught by the operation marked the batch for rollback, which the savepoint rollback undoes.
+            transaction.savepoint_rollback(savepoint)
+            transaction.set_rollback(False)
+            self.rolled_back_operations += 1
+        else:
+            transaction.savepoint_commit(savepoint)
+
+        self.operations += 1
+        self._batch_operations += 1
+        if self._batch_operations >= self.batch_size:
+            self._commit_batch()
+        return changed, modified_model
+
+    def get_statistics(self) -> Dict:
+        """Get the amount of commits and operations as well as the batch timings of this sync."""
+        return {
+            "batch_size": self.batch_size,
+            "commits": self.commits,
+            "operations": self.operations,
+            "rolled_back_operations": self.rolled_back_operations,
+            "batch_time_total": round(self.batch_time_total, 3),
+            "batch_time_max": round(self.batch_time_max, 3),
+            "batch_time_mean": round(self.batch_time_total / self.commits, 3) if self.commits else 0,
+        }
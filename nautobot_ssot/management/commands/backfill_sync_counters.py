@@ -0,0 +1,44 @@
+"""Django Management command to backfill the result counters of Syncs."""
+
+from django.core.management.base import BaseCommand
+
+from nautobot_ssot.models import SYNC_RESULT_COUNTERS, Sync
+
+
+class Command(BaseCommand):
+    """MGMT command to store the result counters (created, updated, deleted etc.) of historic Syncs on the Sync."""
+
+    help = (
+        "Count the log entries of Syncs run before their result counters were stored on the Sync, "
+        "and store the counters on the Sync."
+    )
+
+    def add_arguments(self, parser):  # noqa: D102
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recount all Syncs, rather than only the ones without any results counted yet.",
+        )
+
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of Syncs loaded from the database at a time.",
+        )
+
+    def handle(self, *args, **options):  # noqa: D102
+        syncs = Sync.objects.only("pk", "log_counters")
+        if not options["all"]:
+            syncs = syncs.filter(**{field_name: 0 for field_name in SYNC_RESULT_COUNTERS})
+
+        count = 0
+        for sync in syncs.iterator(chunk_size=options["batch_size"]):
+            counts = sync.count_results()
+            if not any(counts.values()) and not options["all"]:
+                # The counters are already zero.
+                continue
+            Sync.objects.filter(pk=sync.pk).update(**counts)
+            count += 1
+
+        self.stdout.write(f"Backfilled the result counters of {count} syncs.")
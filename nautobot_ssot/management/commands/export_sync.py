@@ -0,0 +1,54 @@
+"""Django Management command to export the diff and log entries of Syncs."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot_ssot.export import EXPORT_FORMATS, export_sync
+from nautobot_ssot.models import Sync
+
+
+class Command(BaseCommand):
+    """MGMT command to stream the diff and log entries of Syncs to newline-delimited JSON or Parquet files."""
+
+    help = (
+        "Export the diff and the log entries of Syncs to a <sync id>_diff and a <sync id>_logs file per Sync, "
+        "in newline-delimited JSON or Parquet format."
+    )
+
+    def add_arguments(self, parser):  # noqa: D102
+        parser.add_argument("sync_ids", nargs="+", help="IDs of the Syncs to export.")
+
+        parser.add_argument(
+            "--format",
+            choices=EXPORT_FORMATS,
+            default="jsonl",
+            help="File format to export to, Parquet requires the pyarrow package.",
+        )
+
+        parser.add_argument(
+            "--output-dir",
+            default=".",
+            help="Directory to write the files to.",
+        )
+
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of log entries loaded from the database at a time.",
+        )
+
+    def handle(self, *args, **options):  # noqa: D102
+        syncs = Sync.objects.defer("diff").filter(pk__in=options["sync_ids"])
+        if syncs.count() != len(set(options["sync_ids"])):
+            missing = set(options["sync_ids"]) - {str(pk) for pk in syncs.values_list("pk", flat=True)}
+            raise CommandError(f"Syncs not found: {', '.join(sorted(missing))}")
+
+        for sync in syncs.iterator():
+            try:
+                results = export_sync(
+                    sync, options["output_dir"], export_format=options["format"], chunk_size=options["chunk_size"]
+                )
+            except RuntimeError as err:
+                raise CommandError(str(err)) from err
+            for path, count in results.items():
+                self.stdout.write(f"Exported {count} rows to {path}")
@@ -1,16 +1,95 @@
 """Nautobot SSoT framework level metrics."""
 
+import threading
+import time
+from collections import Counter
+
 from django.conf import settings
+from django.db.models import Count, OuterRef, Subquery
 from nautobot.extras.choices import JobResultStatusChoices
 from nautobot.extras.models.jobs import Job
 from prometheus_client.core import GaugeMetricFamily
 
-from nautobot_ssot.jobs import get_data_jobs
 from nautobot_ssot.jobs.base import DataSource, DataTarget
 from nautobot_ssot.models import Sync
 
 PLUGIN_SETTINGS = settings.PLUGINS_CONFIG.get("nautobot_ssot", {})
 
+# Fields of the Sync model read by the metrics, all other fields (especially the diff) aren't loaded.
+_SYNC_METRIC_FIELDS = (
+    "source_load_time",
+    "target_load_time",
+    "diff_time",
+    "sync_time",
+    "start_time",
+    "summary",
+    "query_statistics",
+    "model_stats",
+    "job_result__status",
+    "job_result__date_done",
+)
+
+# The data of the last scrape, shared by the collectors of a scrape and reused until it expires.
+_metrics_data_cache = {"expires": 0.0, "data": None}
+_metrics_data_lock = threading.Lock()
+
+
+def _latest_sync_pk(**filters):
+    """Subquery for the primary key of the latest Sync of the Job in the outer query that matches `filters`."""
+    return Subquery(
+        Sync.objects.filter(job_result__job_model_id=OuterRef("pk"), **filters).order_by("-start_time").values("pk")[:1]
+    )
+
+
+def _query_metrics_data():
+    """Query the latest Syncs of each SSoT Job and the number of Syncs per status.
+
+    This runs a fixed number of queries, no matter the number of Jobs and Syncs.
+
+    Returns:
+        dict: The latest Syncs per SSoT Job name, along with the total and per status numbers of Syncs.
+    """
+    jobs = Job.objects.annotate(
+        last_sync_pk=_latest_sync_pk(),
+        last_memory_sync_pk=_latest_sync_pk(source_load_memory_final__isnull=False),
+        last_query_sync_pk=_latest_sync_pk(query_statistics__isnull=False),
+        last_model_sync_pk=_latest_sync_pk(model_stats__isnull=False),
+    )
+    # Skip any jobs that aren't SSoT jobs
+    ssot_jobs = [
+        job for job in jobs if job.job_class is not None and issubclass(job.job_class, (DataSource, DataTarget))
+    ]
+    kinds = ("last_sync", "last_memory_sync", "last_query_sync", "last_model_sync")
+    sync_pks = {getattr(job, f"{kind}_pk") for job in ssot_jobs for kind in kinds} - {None}
+    syncs = Sync.objects.select_related("job_result").only(*_SYNC_METRIC_FIELDS).in_bulk(sync_pks)
+
+    status_counts = Counter()
+    for status, count in Sync.objects.order_by().values_list("job_result__status").annotate(count=Count("pk")):
+        status_counts[(status or "").lower()] += count
+    return {
+        "jobs": [
+            (
+                ".".join(job.natural_key()),
+                {kind: syncs.get(getattr(job, f"{kind}_pk")) for kind in kinds},
+            )
+            for job in ssot_jobs
+        ],
+        "total_syncs": sum(status_counts.values()),
+        "status_counts": status_counts,
+    }
+
+
+def get_metrics_data():
+    """Get the data of all SSoT metrics, cached for `metrics_cache_ttl` seconds (30 by default).
+
+    All collectors of a scrape share the data, so that each scrape only queries the database once.
+    """
+    with _metrics_data_lock:
+        if _metrics_data_cache["data"] is None or time.monotonic() >= _metrics_data_cache["expires"]:
+            _metrics_data_cache["data"] = _query_metrics_data()
+            _metrics_data_cache["expires"] = time.monotonic() + PLUGIN_SETTINGS.get("metrics_cache_ttl", 30)
+        return _metrics_data_cache["data"]
+
 
 def metric_ssot_jobs():
     """Extracts duration of latest SSoT Job run.
@@ -24,44 +103,40 @@ def metric_ssot_jobs():
         labels=["phase", "job"],
     )
 
-    for job in Job.objects.all():
-        # Skip any jobs that aren't SSoT jobs
-        if job.job_class is None or not issubclass(job.job_class, (DataSource, DataTarget)):
-            continue
-
-        last_job_sync = Sync.objects.filter(job_result__job_model_id=job.id).last()
+    for job_name, syncs in get_metrics_data()["jobs"]:
+        last_job_sync = syncs["last_sync"]
         if not last_job_sync:
             continue
 
         if last_job_sync.source_load_time:
             ssot_job_durations.add_metric(
-                labels=["source_load_time", ".".join(job.natural_key())],
+                labels=["source_load_time", job_name],
                 value=((last_job_sync.source_load_time.seconds * 100000) + last_job_sync.source_load_time.microseconds)
                 / 1000,
             )
 
         if last_job_sync.target_load_time:
             ssot_job_durations.add_metric(
-                labels=["target_load_time", ".".join(job.natural_key())],
+                labels=["target_load_time", job_name],
                 value=((last_job_sync.target_load_time.seconds * 1000000) + last_job_sync.target_load_time.microseconds)
                 / 1000,
             )
 
         if last_job_sync.diff_time:
             ssot_job_durations.add_metric(
-                labels=["diff_time", ".".join(job.natural_key())],
+                labels=["diff_time", job_name],
                 value=((last_job_sync.diff_time.seconds * 1000000) + last_job_sync.diff_time.microseconds) / 1000,
             )
 
         if last_job_sync.sync_time:
             ssot_job_durations.add_metric(
-                labels=["sync_time", ".".join(job.natural_key())],
+                labels=["sync_time", job_name],
                 value=((last_job_sync.sync_time.seconds * 1000000) + last_job_sync.sync_time.microseconds) / 1000,
             )
 
         if last_job_sync.duration:
             ssot_job_durations.add_metric(
-                labels=["sync_duration", ".".join(job.natural_key())],
+                labels=["sync_duration", job_name],
                 value=((last_job_sync.duration.seconds * 1000000) + last_job_sync.duration.microseconds) / 1000,
             )
 
@@ -76,12 +151,11 @@ def metric_syncs():
     """
     sync_gauge = GaugeMetricFamily("nautobot_ssot_sync_total", "Nautobot SSoT Sync Totals", labels=["sync_type"])
 
-    sync_gauge.add_metric(labels=["total_syncs"], value=Sync.objects.all().count())
+    metrics_data = get_metrics_data()
+    sync_gauge.add_metric(labels=["total_syncs"], value=metrics_data["total_syncs"])
 
     for status_type in [x[1].lower() for x in JobResultStatusChoices]:
-        sync_gauge.add_metric(
-            labels=[f"{status_type}_syncs"], value=Sync.objects.filter(job_result__status=status_type).count()
-        )
+        sync_gauge.add_metric(labels=[f"{status_type}_syncs"], value=metrics_data["status_counts"].get(status_type, 0))
 
     yield sync_gauge
 
@@ -96,20 +170,16 @@ def metric_sync_operations():
         "nautobot_ssot_operation_total", "Nautobot SSoT operations by Job", labels=["job", "operation"]
     )
 
-    for job in Job.objects.all():
-        # Skip any jobs that aren't SSoT jobs
-        if job.job_class is None or not issubclass(job.job_class, (DataSource, DataTarget)):
-            continue
-
-        last_job_sync = Sync.objects.filter(job_result__job_model_id=job.id).last()
+    ssot_jobs = get_metrics_data()["jobs"]
+    for job_name, syncs in ssot_jobs:
+        last_job_sync = syncs["last_sync"]
         if last_job_sync and last_job_sync.summary:
             for operation, value in last_job_sync.summary.items():
                 sync_ops.add_metric(
-                    labels=[".".join(job.natural_key()), operation],
+                    labels=[job_name, operation],
                     value=value,
                 )
-    data_sources, data_targets = get_data_jobs()
-    if len(data_sources + data_targets) == 0:
+    if not ssot_jobs:
         sync_ops.add_metric(labels=["", ""], value=0)
 
     yield sync_ops
@@ -125,17 +195,12 @@ def metric_memory_usage():
         "nautobot_ssot_sync_memory_usage_bytes", "Nautobot SSoT Sync Memory Usage", labels=["phase", "job"]
     )
 
-    for job in Job.objects.all():
-        # Skip any jobs that aren't SSoT jobs
-        if job.job_class is None or not issubclass(job.job_class, (DataSource, DataTarget)):
-            continue
-        last_job_sync = Sync.objects.filter(
-            job_result__job_model_id=job.id, source_load_memory_final__isnull=False
-        ).last()
+    for job_name, syncs in get_metrics_data()["jobs"]:
+        last_job_sync = syncs["last_memory_sync"]
         if last_job_sync and last_job_sync.summary:
             for operation, value in last_job_sync.summary.items():
                 memory_gauge.add_metric(
-                    labels=[operation, ".".join(job.natural_key())],
+                    labels=[operation, job_name],
                     value=value,
                 )
         else:
@@ -144,4 +209,71 @@ def metric_memory_usage():
     yield memory_gauge
 
 
-metrics = [metric_ssot_jobs, metric_syncs, metric_sync_operations, metric_memory_usage]
+def metric_sync_queries():
+    """Extracts the database query count and time per phase of each Job's last Sync.
+
+    Yields:
+        GaugeMetricFamily: Prometheus Metrics
+    """
+    query_count_gauge = GaugeMetricFamily(
+        "nautobot_ssot_sync_database_queries", "Nautobot SSoT Sync Database Queries", labels=["phase", "job"]
+    )
+    query_time_gauge = GaugeMetricFamily(
+        "nautobot_ssot_sync_database_query_seconds",
+        "Nautobot SSoT Sync Database Query Time in seconds",
+        labels=["phase", "job"],
+    )
+
+    for job_name, syncs in get_metrics_data()["jobs"]:
+        last_job_sync = syncs["last_query_sync"]
+        if not last_job_sync:
+            continue
+
+        for phase, statistics in last_job_sync.query_statistics.items():
+            query_count_gauge.add_metric(labels=[phase, job_name], value=statistics["count"])
+            query_time_gauge.add_metric(labels=[phase, job_name], value=statistics["time"])
+
+    yield query_count_gauge
+    yield query_time_gauge
+
+
+def metric_sync_model_stats():
+    """Extracts the count and duration of the operations per model of each Job's last Sync.
+
+    Yields:
+        GaugeMetricFamily: Prometheus Metrics
+    """
+    model_count_gauge = GaugeMetricFamily(
+        "nautobot_ssot_sync_model_objects",
+        "Nautobot SSoT Sync Objects per Model and Operation",
+        labels=["job", "model", "operation"],
+    )
+    model_time_gauge = GaugeMetricFamily(
+        "nautobot_ssot_sync_model_seconds",
+        "Nautobot SSoT Sync Duration per Model and Operation in seconds",
+        labels=["job", "model", "operation"],
+    )
+
+    for job_name, syncs in get_metrics_data()["jobs"]:
+        last_job_sync = syncs["last_model_sync"]
+        if not last_job_sync:
+            continue
+
+        for model_name, operations in last_job_sync.model_stats.items():
+            for operation, statistics in operations.items():
+                labels = [job_name, model_name, operation]
+                model_count_gauge.add_metric(labels=labels, value=statistics["count"])
+                model_time_gauge.add_metric(labels=labels, value=statistics["time"])
+
+    yield model_count_gauge
+    yield model_time_gauge
+
+
+metrics = [
+    metric_ssot_jobs,
+    metric_syncs,
+    metric_sync_operations,
+    metric_memory_usage,
+    metric_sync_queries,
+    metric_sync_model_stats,
+]
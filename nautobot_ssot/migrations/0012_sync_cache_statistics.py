@@ -0,0 +1,19 @@
+# Generated by Django 3.2.25 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0011_alter_sync_job_result"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="cache_statistics",
+            field=models.JSONField(
+                blank=True, help_text="ORM cache hits, misses and evictions per adapter and model", null=True
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-17 10:03
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0012_sync_cache_statistics"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="synclogentry",
+            name="timestamp",
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-17 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0013_alter_synclogentry_timestamp"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="log_counters",
+            field=models.JSONField(
+                blank=True,
+                help_text="Number of log entries per action, status and model that weren't recorded due to the logging policy",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 3.2.25 on 2026-10-17 11:47
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0014_sync_log_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncDiffChunk",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("model_type", models.CharField(max_length=255)),
+                ("index", models.PositiveIntegerField(help_text="Position of this chunk within the diff")),
+                (
+                    "offset",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Number of diff elements of the same model type in the preceding chunks"
+                    ),
+                ),
+                (
+                    "num_elements",
+                    models.PositiveIntegerField(help_text="Number of top-level diff elements in this chunk"),
+                ),
+                ("data", models.BinaryField()),
+                (
+                    "sync",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="diff_chunks",
+                        related_query_name="diff_chunk",
+                        to="nautobot_ssot.sync",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["sync", "index"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="syncdiffchunk",
+            index=models.Index(fields=["sync", "model_type", "offset"], name="ssot_diffchunk_model_idx"),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 3.2.25 on 2026-10-17 12:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0015_syncdiffchunk"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="watermark",
+            field=models.DateTimeField(
+                blank=True, help_text="Data changed after this time is loaded by the next delta sync", null=True
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-17 13:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0016_sync_watermark"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="source_snapshot",
+            field=models.FileField(
+                blank=True,
+                help_text="Snapshot of the loaded source data, which can be reused by later syncs of the same job",
+                upload_to="nautobot_ssot/snapshots/",
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 3.2.25 on 2026-10-17 13:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0017_sync_source_snapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="parent",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Sync the results of this shard were merged into",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="shards",
+                to="nautobot_ssot.sync",
+            ),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="shard",
+            field=models.CharField(blank=True, default="", help_text="Shard of the data synced", max_length=255),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 3.2.25 on 2026-10-17 14:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0018_sync_parent_shard"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="transaction_statistics",
+            field=models.JSONField(
+                blank=True, help_text="Commits, operations and transaction batch timings of the sync", null=True
+            ),
+        ),
+    ]
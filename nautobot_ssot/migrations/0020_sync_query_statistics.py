@@ -0,0 +1,19 @@
+# Generated by Django 3.2.25 on 2026-10-17 15:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0019_sync_transaction_statistics"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="query_statistics",
+            field=models.JSONField(
+                blank=True, help_text="Database query count, time and most frequent statements per phase", null=True
+            ),
+        ),
+    ]
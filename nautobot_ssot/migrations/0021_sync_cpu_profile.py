@@ -0,0 +1,28 @@
+# Generated by Django 3.2.25 on 2026-10-17 15:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0020_sync_query_statistics"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="cpu_statistics",
+            field=models.JSONField(
+                blank=True, help_text="Total CPU time and functions by cumulative time per phase", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="cpu_profile",
+            field=models.FileField(
+                blank=True,
+                help_text="CPU profile of all phases in the pstats format",
+                upload_to="nautobot_ssot/profiles/",
+            ),
+        ),
+    ]
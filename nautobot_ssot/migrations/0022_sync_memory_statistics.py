@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-17 16:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0021_sync_cpu_profile"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="memory_statistics",
+            field=models.JSONField(
+                blank=True,
+                help_text="Top allocation sites per phase and their difference to the previous phase",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-17 17:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0022_sync_memory_statistics"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="model_stats",
+            field=models.JSONField(
+                blank=True,
+                help_text="Count and duration of the load, create, update and delete operations per model",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 3.2.25 on 2026-10-17 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0023_sync_model_stats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="num_unchanged",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_created",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_updated",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_deleted",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_succeeded",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_failed",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="sync",
+            name="num_errored",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.25 on 2026-10-17 18:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0024_sync_result_counters"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="synclogentry",
+            index=models.Index(fields=["sync", "timestamp"], name="ssot_log_sync_timestamp_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="synclogentry",
+            index=models.Index(fields=["sync", "action", "timestamp"], name="ssot_log_sync_action_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="synclogentry",
+            index=models.Index(fields=["sync", "status", "timestamp"], name="ssot_log_sync_status_idx"),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-17 19:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0025_synclogentry_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="shard_status",
+            field=models.JSONField(
+                blank=True,
+                help_text="Status of each shard enqueued by this sync, as the status of its JobResult",
+                null=True,
+            ),
+        ),
+    ]
@@ -15,15 +15,19 @@ The interaction between these models and Nautobot's native JobResult model deser
     which have a different set of content requirements, but is used for high-level status reporting.
 
 JobResult 1<->1 Sync 1-->n SyncLogEntry
+                    1-->n SyncDiffChunk
 """
 
+import gzip
+import json
 from datetime import timedelta
+from itertools import groupby, islice
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
+from django.db import models, transaction
 from django.urls import reverse
 from django.utils.formats import date_format
 from django.utils.timezone import now
@@ -49,6 +53,34 @@ class DiffJSONEncoder(DjangoJSONEncoder):
         return super().default(o)
 
 
+def _merge_counts(counts, other_counts):
+    """Recursively add up two (possibly nested) dictionaries of counts."""
+    merged = dict(counts or {})
+    for key, value in (other_counts or {}).items():
+        if isinstance(value, dict):
+            merged[key] = _merge_counts(merged.get(key), value)
+        else:
+            merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+# Result counters stored on each Sync, by field name and the SyncLogEntry field and value they count.
+SYNC_RESULT_COUNTERS = {
+    "num_unchanged": ("action", SyncLogEntryActionChoices.ACTION_NO_CHANGE),
+    "num_created": ("action", SyncLogEntryActionChoices.ACTION_CREATE),
+    "num_updated": ("action", SyncLogEntryActionChoices.ACTION_UPDATE),
+    "num_deleted": ("action", SyncLogEntryActionChoices.ACTION_DELETE),
+    "num_succeeded": ("status", SyncLogEntryStatusChoices.STATUS_SUCCESS),
+    "num_failed": ("status", SyncLogEntryStatusChoices.STATUS_FAILURE),
+    "num_errored": ("status", SyncLogEntryStatusChoices.STATUS_ERROR),
+}
+# Groups of `Sync.log_counters` by the SyncLogEntry field they count.
+_LOG_COUNTER_GROUPS = {"action": "actions", "status": "statuses"}
+
+# Maximum number of top-level diff elements per SyncDiffChunk, see `Sync.store_diff`.
+DIFF_CHUNK_SIZE = 1000
+
+
 @extras_features(
     "custom_links",
 )
@@ -79,10 +111,75 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
     dry_run = models.BooleanField(
         default=False, help_text="Report what data would be synced but do not make any changes"
     )
+    # Diffs stored with `store_diff` are kept in `diff_chunks` instead, use `get_diff` or `iter_diff` to access either.
     diff = models.JSONField(blank=True, encoder=DiffJSONEncoder)
     summary = models.JSONField(blank=True, null=True)
+    cache_statistics = models.JSONField(
+        blank=True, null=True, help_text="ORM cache hits, misses and evictions per adapter and model"
+    )
+    memory_statistics = models.JSONField(
+        blank=True, null=True, help_text="Top allocation sites per phase and their difference to the previous phase"
+    )
+    query_statistics = models.JSONField(
+        blank=True, null=True, help_text="Database query count, time and most frequent statements per phase"
+    )
+    model_stats = models.JSONField(
+        blank=True,
+        null=True,
+        help_text="Count and duration of the load, create, update and delete operations per model",
+    )
+    cpu_statistics = models.JSONField(
+        blank=True, null=True, help_text="Total CPU time and functions by cumulative time per phase"
+    )
+    cpu_profile = models.FileField(
+        upload_to="nautobot_ssot/profiles/",
+        blank=True,
+        help_text="CPU profile of all phases in the pstats format",
+    )
+    watermark = models.DateTimeField(
+        blank=True, null=True, help_text="Data changed after this time is loaded by the next delta sync"
+    )
+    source_snapshot = models.FileField(
+        upload_to="nautobot_ssot/snapshots/",
+        blank=True,
+        help_text="Snapshot of the loaded source data, which can be reused by later syncs of the same job",
+    )
+    transaction_statistics = models.JSONField(
+        blank=True, null=True, help_text="Commits, operations and transaction batch timings of the sync"
+    )
+    log_counters = models.JSONField(
+        blank=True,
+        null=True,
+        help_text="Number of log entries per action, status and model that weren't recorded due to the logging policy",
+    )
+
+    # Totals of the log entries of this Sync, including the ones counted in `log_counters`, see `count_results`.
+    num_unchanged = models.PositiveIntegerField(default=0)
+    num_created = models.PositiveIntegerField(default=0)
+    num_updated = models.PositiveIntegerField(default=0)
+    num_deleted = models.PositiveIntegerField(default=0)
+    num_succeeded = models.PositiveIntegerField(default=0)
+    num_failed = models.PositiveIntegerField(default=0)
+    num_errored = models.PositiveIntegerField(default=0)
 
     job_result = models.ForeignKey(to=JobResult, on_delete=models.CASCADE, blank=True, null=True)
+    parent = models.ForeignKey(
+        to="self",
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+        related_name="shards",
+        help_text="Sync the results of this shard were merged into",
+    )
+    shard = models.CharField(max_length=255, blank=True, default="", help_text="Shard of the data synced")
+    shard_status = models.JSONField(
+        blank=True,
+        null=True,
+        help_text="Status of each shard enqueued by this sync, as the status of its JobResult",
+    )
+
+    # The diff assembled from `diff_chunks`, see `get_diff`.
+    _chunked_diff = None
 
     class Meta:
         """Metaclass attributes of Sync model."""
@@ -99,26 +196,200 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
 
     @classmethod
     def annotated_queryset(cls):
-        """Construct an efficient queryset for this model and related data."""
-        return (
-            cls.objects.defer("diff")
-            .select_related("job_result")
-            .prefetch_related("logs")
-            .annotate(
-                num_unchanged=models.Count(
-                    "log", filter=models.Q(log__action=SyncLogEntryActionChoices.ACTION_NO_CHANGE)
-                ),
-                num_created=models.Count("log", filter=models.Q(log__action=SyncLogEntryActionChoices.ACTION_CREATE)),
-                num_updated=models.Count("log", filter=models.Q(log__action=SyncLogEntryActionChoices.ACTION_UPDATE)),
-                num_deleted=models.Count("log", filter=models.Q(log__action=SyncLogEntryActionChoices.ACTION_DELETE)),
-                num_succeeded=models.Count(
-                    "log", filter=models.Q(log__status=SyncLogEntryStatusChoices.STATUS_SUCCESS)
-                ),
-                num_failed=models.Count("log", filter=models.Q(log__status=SyncLogEntryStatusChoices.STATUS_FAILURE)),
-                num_errored=models.Count("log", filter=models.Q(log__status=SyncLogEntryStatusChoices.STATUS_ERROR)),
-            )
+        """Construct an efficient queryset for this model and related data.
+
+        The result counters (`num_created` etc.) are stored on the Sync itself, so no aggregation is needed for these.
+        """
+        return cls.objects.defer("diff").select_related("job_result")
+
+    def count_results(self):
+        """Count the results of this Sync from its SyncLogEntry records and `log_counters`.
+
+        Syncs keep their result counters up to date while running, this is used to backfill Syncs from before these
+        were stored, see the `backfill_sync_counters` management command.
+
+        Returns:
+            dict: The count per field name of `SYNC_RESULT_COUNTERS`.
+        """
+        counts = self.logs.aggregate(
+            **{
+                field_name: models.Count("pk", filter=models.Q(**{field: value}))
+                for field_name, (field, value) in SYNC_RESULT_COUNTERS.items()
+            }
+        )
+        for field_name, (field, value) in SYNC_RESULT_COUNTERS.items():
+            counts[field_name] += (self.log_counters or {}).get(_LOG_COUNTER_GROUPS[field], {}).get(value, 0)
+        return counts
+
+    def get_diff(self):
+        """Get the diff of this Sync, assembled from its `diff_chunks` on first access if it was stored in chunks.
+
+        Returns:
+            dict: The diffs per element name per model type.
+        """
+        if self.diff or self._state.adding:
+            return self.diff
+        if self._chunked_diff is None:
+            self._chunked_diff = dict(self.iter_diff())
+        return self._chunked_diff
+
+    def iter_diff(self):
+        """Yield `(model_type, diffs)` tuples of the diff of this Sync, decompressing one model type at a time."""
+        if self.diff:
+            yield from self.diff.items()
+            return
+        for model_type, chunks in groupby(self.iter_diff_chunks(), key=lambda chunk: chunk[0]):
+            diffs = {}
+            for _, chunk_diffs in chunks:
+                diffs.update(chunk_diffs)
+            yield model_type, diffs
+
+    def iter_diff_chunks(self):
+        """Yield `(model_type, diffs)` tuples of the diff of this Sync, decompressing one chunk at a time.
+
+        Unlike `iter_diff`, the diff elements of a model type may be split up across several consecutive tuples.
+        """
+        if self.diff:
+            yield from self.diff.items()
+            return
+        for chunk in self.diff_chunks.order_by("index").iterator():
+            yield chunk.model_type, chunk.load()
+
+    def get_diff_model_counts(self):
+        """Get the number of top-level diff elements per model type, without loading chunked diffs.
+
+        Returns:
+            dict: The number of diff elements per model type, in the order of the diff.
+        """
+        if self.diff:
+            return {model_type: len(diffs) for model_type, diffs in self.diff.items()}
+        return dict(
+            self.diff_chunks.values("model_type")
+            .annotate(count=models.Sum("num_elements"), first_index=models.Min("index"))
+            .order_by("first_index")
+            .values_list("model_type", "count")
         )
 
+    def iter_model_diff(self, model_type, offset=0, limit=None):
+        """Yield `(name, diff)` tuples of the top-level diff elements of a single model type.
+
+        Only the chunks holding the elements from `offset` up to `offset + limit` are decompressed.
+        """
+        if self.diff:
+            yield from islice(self.diff.get(model_type, {}).items(), offset, None if limit is None else offset + limit)
+            return
+        chunks = self.diff_chunks.filter(model_type=model_type).annotate(
+            end=models.F("offset") + models.F("num_elements")
+        )
+        chunks = chunks.filter(end__gt=offset)
+        if limit is not None:
+            if not limit:
+                return
+            chunks = chunks.filter(offset__lt=offset + limit)
+        for chunk in chunks.order_by("offset").iterator():
+            start = max(offset - chunk.offset, 0)
+            stop = None if limit is None else offset + limit - chunk.offset
+            yield from islice(chunk.load().items(), start, stop)
+
+    def get_model_diff(self, model_type):
+        """Get the top-level diff elements of a single model type, only decompressing the chunks of that model type.
+
+        Returns:
+            dict: The diffs per element name, empty if the diff doesn't contain `model_type`.
+        """
+        return dict(self.iter_model_diff(model_type))
+
+    def store_diff(self, diff, chunk_size=DIFF_CHUNK_SIZE):
+        """Store a DiffSync `Diff` in compressed `diff_chunks` of up to `chunk_size` elements of a model type each.
+
+        Only the diff elements of a single chunk are held as JSON in memory at any time. The chunks are stored in a
+        single transaction, so that a failure doesn't leave a partial diff behind.
+        """
+        with transaction.atomic():
+            self.diff_chunks.all().delete()
+            index = 0
+            for model_type in diff.groups():
+                elements = (
+                    element
+                    for element in diff.children[model_type].values()
+                    if element.has_diffs(include_children=True)
+                )
+                offset = 0
+                while True:
+                    diffs = {element.name: element.dict() for element in islice(elements, chunk_size)}
+                    if not diffs:
+                        break
+                    self.diff_chunks.create(
+                        model_type=model_type,
+                        index=index,
+                        offset=offset,
+                        num_elements=len(diffs),
+                        data=SyncDiffChunk.compress(diffs),
+                    )
+                    index += 1
+                    offset += len(diffs)
+        self._chunked_diff = None
+
+    def merge_shard(self, shard_sync, succeeded=True):
+        """Merge the timings, summary, diff and log entries of the Sync of a shard into this Sync.
+
+        The results of a shard that failed are merged as well, its status is recorded in `shard_status`. The diff chunks
+        of the shard are appended to the ones of the same model type of this Sync, without loading them. As shards
+        finish concurrently, this Sync should be locked using `select_for_update` beforehand.
+        """
+        self.shard_status = {
+            **(self.shard_status or {}),
+            shard_sync.shard: JobResultStatusChoices.STATUS_SUCCESS
+            if succeeded
+            else JobResultStatusChoices.STATUS_FAILURE,
+        }
+        for field_name in ("source_load_time", "target_load_time", "diff_time", "sync_time"):
+            shard_time = getattr(shard_sync, field_name)
+            if shard_time is not None:
+                setattr(self, field_name, (getattr(self, field_name) or timedelta()) + shard_time)
+        self.summary = _merge_counts(self.summary, shard_sync.summary)
+        for field_name in SYNC_RESULT_COUNTERS:
+            setattr(self, field_name, getattr(self, field_name) + getattr(shard_sync, field_name))
+        self.log_counters = _merge_counts(self.log_counters, shard_sync.log_counters) or None
+        model_counts = self.get_diff_model_counts()
+        next_index = (self.diff_chunks.aggregate(max_index=models.Max("index"))["max_index"] or 0) + 1
+        for chunk in shard_sync.diff_chunks.order_by("index"):
+            chunk.sync = self
+            chunk.index = next_index
+            chunk.offset = model_counts.get(chunk.model_type, 0)
+            chunk.save()
+            next_index += 1
+            model_counts[chunk.model_type] = chunk.offset + chunk.num_elements
+        self._chunked_diff = None
+        shard_sync.logs.update(sync=self)
+        self.save()
+
+    def get_shards_by_status(self):
+        """Get the names of the shards enqueued by this Sync per status, see `shard_status`.
+
+        Returns:
+            dict: The sorted shard names per JobResult status, pending and failed shards first.
+        """
+        shards_by_status = {}
+        for status in (
+            JobResultStatusChoices.STATUS_PENDING,
+            JobResultStatusChoices.STATUS_FAILURE,
+            JobResultStatusChoices.STATUS_SUCCESS,
+        ):
+            shards = sorted(
+                shard for shard, shard_status in (self.shard_status or {}).items() if shard_status == status
+            )
+            if shards:
+                shards_by_status[status] = shards
+        return shards_by_status
+
+    @property
+    def num_unlogged(self):
+        """Total number of log entries that weren't recorded as SyncLogEntry records due to the logging policy."""
+        if not self.log_counters:
+            return 0
+        return sum(self.log_counters.get("actions", {}).values())
+
     @property
     def duration(self):  # pylint: disable=inconsistent-return-statements
         """Total execution time of this Sync."""
@@ -148,6 +419,40 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
         )
 
 
+class SyncDiffChunk(BaseModel):
+    """Gzip-compressed part of the diff of a Sync, covering up to `DIFF_CHUNK_SIZE` elements of a top-level model type."""
+
+    sync = models.ForeignKey(
+        to=Sync, on_delete=models.CASCADE, related_name="diff_chunks", related_query_name="diff_chunk"
+    )
+    model_type = models.CharField(max_length=255)
+    index = models.PositiveIntegerField(help_text="Position of this chunk within the diff")
+    offset = models.PositiveIntegerField(
+        default=0, help_text="Number of diff elements of the same model type in the preceding chunks"
+    )
+    num_elements = models.PositiveIntegerField(help_text="Number of top-level diff elements in this chunk")
+    data = models.BinaryField()
+
+    class Meta:
+        """Metaclass attributes of SyncDiffChunk."""
+
+        ordering = ["sync", "index"]
+        indexes = [models.Index(fields=["sync", "model_type", "offset"], name="ssot_diffchunk_model_idx")]
+
+    def __str__(self):
+        """String representation of a SyncDiffChunk instance."""
+        return f"{self.sync}: {self.model_type}"
+
+    @staticmethod
+    def compress(diffs):
+        """Serialize and compress the diffs of a single model type."""
+        return gzip.compress(json.dumps(diffs, cls=DiffJSONEncoder).encode())
+
+    def load(self):
+        """Decompress and deserialize the diffs of this chunk."""
+        return json.loads(gzip.decompress(bytes(self.data)))
+
+
 class SyncLogEntry(BaseModel):  # pylint: disable=nb-string-field-blank-null
     """Record of a single event during a data sync operation.
 
@@ -164,7 +469,8 @@ class SyncLogEntry(BaseModel):  # pylint: disable=nb-string-field-blank-null
     """
 
     sync = models.ForeignKey(to=Sync, on_delete=models.CASCADE, related_name="logs", related_query_name="log")
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Entries are written in batches, so this is set when the entry is instantiated rather than when it is saved.
+    timestamp = models.DateTimeField(default=now, editable=False)
 
     action = models.CharField(max_length=32, choices=SyncLogEntryActionChoices)
     status = models.CharField(max_length=32, choices=SyncLogEntryStatusChoices)
@@ -188,6 +494,12 @@ class SyncLogEntry(BaseModel):  # pylint: disable=nb-string-field-blank-null
 
         verbose_name_plural = "sync log entries"
         ordering = ["sync", "timestamp"]
+        # The log entries are mostly listed per Sync, filtered by action or status and ordered by timestamp.
+        indexes = [
+            models.Index(fields=["sync", "timestamp"], name="ssot_log_sync_timestamp_idx"),
+            models.Index(fields=["sync", "action", "timestamp"], name="ssot_log_sync_action_idx"),
+            models.Index(fields=["sync", "status", "timestamp"], name="ssot_log_sync_status_idx"),
+        ]
 
     def get_action_class(self):
         """Map self.action to a Bootstrap label class."""
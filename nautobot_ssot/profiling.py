@@ -0,0 +1,246 @@
+"""Instrumentation for profiling the phases of a sync."""
+
+import cProfile
+import functools
+import marshal
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional
+
+from django.db import connection
+
+# Literals and parameter lists that are replaced to group statements differing only in their values.
+_SQL_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_SQL_PARAMETER_LISTS = re.compile(r"\((?:\s*(?:%s|\?)\s*,)+\s*(?:%s|\?)\s*\)")
+_SQL_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """Normalize an SQL statement so that statements only differing in their values are grouped together.
+
+    Examples:
+        >>> normalize_sql("SELECT * FROM tenant WHERE id IN (%s, %s, %s) LIMIT 21")
+        'SELECT * FROM tenant WHERE id IN (...) LIMIT ?'
+    """
+    sql = _SQL_LITERALS.sub("?", sql)
+    sql = _SQL_PARAMETER_LISTS.sub("(...)", sql)
+    return _SQL_WHITESPACE.sub(" ", sql).strip()
+
+
+class QueryRecorder:
+    """Database execute wrapper recording the count and duration of the queries run on a connection.
+
+    See https://docs.djangoproject.com/en/stable/topics/db/instrumentation/ for database instrumentation.
+    """
+
+    def __init__(self):
+        """Create an empty QueryRecorder."""
+        self.count = 0
+        self.time = 0.0
+        self.statements = Counter()
+        self.statement_times = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        """Run the query and record it."""
+        start_time = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start_time
+            self.count += 1
+            self.time += duration
+            # Statements are only normalized in `get_statistics`, to keep the overhead per query low.
+            self.statements[sql] += 1
+            self.statement_times[sql] += duration
+
+    def get_statistics(self, top_n: int = 10) -> Dict:
+        """Get the query count, total query time and the `top_n` most frequent normalized statements."""
+        statements = Counter()
+        statement_times = Counter()
+        for sql, count in self.statements.items():
+            normalized = normalize_sql(sql)
+            statements[normalized] += count
+            statement_times[normalized] += self.statement_times[sql]
+        return {
+            "count": self.count,
+            "time": round(self.time, 3),
+            "top_statements": [
+                {"sql": sql, "count": count, "time": round(statement_times[sql], 3)}
+                for sql, count in statements.most_common(top_n)
+            ],
+        }
+
+
+@contextmanager
+def record_queries():
+    """Record the queries run on the default database connection of the current thread.
+
+    Yields:
+        QueryRecorder: The recorder of the queries.
+    """
+    recorder = QueryRecorder()
+    with connection.execute_wrapper(recorder):
+        yield recorder
+
+
+@contextmanager
+def profile_cpu():
+    """Profile the CPU time of the function calls on the current thread with cProfile.
+
+    Yields:
+        cProfile.Profile: The profiler, which is disabled again on exit.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+
+
+def get_cpu_statistics(profiler: cProfile.Profile, top_n: int = 10) -> Dict:
+    """Get the total time and the `top_n` functions by cumulative time of a CPU profile."""
+    stats = pstats.Stats(profiler)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    top_functions = []
+    for function in stats.fcn_list[:top_n]:
+        _, calls, total_time, cumulative_time, _ = stats.stats[function]
+        top_functions.append(
+            {
+                "function": pstats.func_std_string(function),
+                "calls": calls,
+                "total_time": round(total_time, 3),
+                "cumulative_time": round(cumulative_time, 3),
+            }
+        )
+    return {"total_time": round(stats.total_tt, 3), "top_functions": top_functions}
+
+
+def dump_cpu_profiles(profilers: Iterable[cProfile.Profile]) -> bytes:
+    """Combine CPU profiles into the `.pstats` file format, as read by `pstats.Stats` and tools like snakeviz."""
+    stats = pstats.Stats(*profilers)
+    # This is what `pstats.Stats.dump_stats` writes to a file.
+    return marshal.dumps(stats.stats)
+
+
+def take_memory_snapshot() -> tracemalloc.Snapshot:
+    """Take a snapshot of the memory blocks traced by tracemalloc, leaving out the ones allocated by the import system."""
+    return tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        )
+    )
+
+
+def _format_location(statistic) -> str:
+    """Format the location of a `tracemalloc.Statistic` or `tracemalloc.StatisticDiff` as file:line."""
+    frame = statistic.traceback[0]
+    return f"{frame.filename}:{frame.lineno}"
+
+
+def get_memory_statistics(
+    snapshot: tracemalloc.Snapshot, previous_snapshot: Optional[tracemalloc.Snapshot] = None, top_n: int = 10
+) -> Dict:
+    """Get the `top_n` allocation sites by size of a memory snapshot, grouped by file:line.
+
+    If `previous_snapshot` is given, the `top_n` allocation sites by size difference to it are included as well.
+    """
+    statistics = {
+        "top_allocations": [
+            {"location": _format_location(statistic), "size": statistic.size, "count": statistic.count}
+            for statistic in snapshot.statistics("lineno")[:top_n]
+        ],
+    }
+    if previous_snapshot is not None:
+        statistics["compared_to_previous"] = [
+            {
+                "location": _format_location(statistic),
+                "size": statistic.size,
+                "size_diff": statistic.size_diff,
+                "count_diff": statistic.count_diff,
+            }
+            for statistic in snapshot.compare_to(previous_snapshot, "lineno")[:top_n]
+        ]
+    return statistics
+
+
+class ModelStatistics:
+    """Count and duration of the load, create, update and delete operations per DiffSync model.
+
+    Jobs based on `DataSyncBaseJob` collect these in `job.model_statistics`. Adapters can time the loading of a model
+    with `time_load` or `timed_load`, whereas the create, update and delete operations are timed during the sync.
+    """
+
+    def __init__(self):
+        """Create empty ModelStatistics."""
+        self._statistics = defaultdict(lambda: defaultdict(lambda: {"count": 0, "time": 0.0}))
+        # Adapters may be loaded in parallel, see `DataSyncBaseJob.load_adapters_in_parallel`.
+        self._lock = threading.Lock()
+
+    def record(self, model_name: str, operation: str, duration: float, count: int = 1):
+        """Record that an operation on `count` objects of a model took `duration` seconds."""
+        with self._lock:
+            statistics = self._statistics[model_name][operation]
+            statistics["count"] += count
+            statistics["time"] += duration
+
+    def as_dict(self) -> Dict:
+        """Get the count and time in seconds of each operation per model, as stored in `Sync.model_stats`."""
+        with self._lock:
+            return {
+                model_name: {
+                    operation: {"count": statistics["count"], "time": round(statistics["time"], 3)}
+                    for operation, statistics in operations.items()
+                }
+                for model_name, operations in self._statistics.items()
+            }
+
+
+@contextmanager
+def time_load(adapter, model_name: str):
+    """Time loading the objects of a DiffSync model into an adapter, counting the objects added to it.
+
+    The timing is recorded in the `model_statistics` of the adapter's job, if any.
+
+    Examples:
+        >>> with time_load(self, "interface"):
+        ...     for interface in self.client.get_interfaces():
+        ...         self.add(self.interface(**interface))
+    """
+    model_statistics = getattr(getattr(adapter, "job", None), "model_statistics", None)
+    if not isinstance(model_statistics, ModelStatistics):
+        yield
+        return
+    count = adapter.count(model_name)
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        model_statistics.record(model_name, "load", time.perf_counter() - start_time, adapter.count(model_name) - count)
+
+
+def timed_load(model_name: str):
+    """Decorator timing an adapter method loading the objects of a DiffSync model, see `time_load`.
+
+    Examples:
+        >>> @timed_load("interface")
+        ... def load_interfaces(self):
+        ...     ...
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(adapter, *args, **kwargs):
+            with time_load(adapter, model_name):
+                return method(adapter, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,122 @@
+"""Retention of the Sync history, purging Syncs in bounded chunks."""
+
+import time
+from datetime import timedelta
+from typing import Dict, Iterator, List, Optional
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils.timezone import now
+from nautobot.extras.choices import JobResultStatusChoices
+
+from nautobot_ssot.models import Sync, SyncDiffChunk, SyncLogEntry
+
+# Settings of a retention policy that can be overridden per Job in the `sync_retention` app setting.
+RETENTION_POLICY_SETTINGS = ("keep_last", "keep_days", "keep_failed_days")
+
+
+def get_expired_syncs(syncs, keep_last: int, keep_days: int, keep_failed_days: int, current_time=None) -> List:
+    """Get the primary keys of the `syncs` of a single Job that aren't kept by any rule of a retention policy.
+
+    A Sync is kept if it's one of the last `keep_last` Syncs, if it started less than `keep_days` days ago, or if it
+    failed or had failed or errored operations and started less than `keep_failed_days` days ago. Shards of a Sync are
+    expired along with it, so only Syncs that aren't shards are considered.
+    """
+    current_time = current_time or now()
+    syncs = syncs.filter(parent__isnull=True)
+    # Evaluated rather than used as a subquery, as MySQL doesn't support LIMIT in subqueries used with IN.
+    last_syncs = list(syncs.order_by("-start_time").values_list("pk", flat=True)[:keep_last]) if keep_last else []
+    failed = (
+        Q(job_result__status=JobResultStatusChoices.STATUS_FAILURE)  # pylint: disable=unsupported-binary-operation
+        | Q(num_failed__gt=0)
+        | Q(num_errored__gt=0)
+    )
+    return list(
+        syncs.filter(start_time__lt=current_time - timedelta(days=keep_days))
+        .exclude(pk__in=last_syncs)
+        .exclude(failed, start_time__gte=current_time - timedelta(days=keep_failed_days))
+        .values_list("pk", flat=True)
+    )
+
+
+def _raw_delete(model, pks: List) -> int:
+    """Delete the rows of `model` with the given primary keys with a single DELETE statement, without cascading."""
+    pk_field = model._meta.pk
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {connection.ops.quote_name(model._meta.db_table)} "  # noqa: S608
+            f"WHERE {connection.ops.quote_name(pk_field.column)} IN ({', '.join(['%s'] * len(pks))})",
+            [pk_field.get_db_prep_value(pk, connection) for pk in pks],
+        )
+        return cursor.rowcount
+
+
+def _timed(model, delete, *args) -> Dict:
+    """Run a delete function in its own transaction, returning the model, rows deleted and time taken."""
+    start_time = time.monotonic()
+    with transaction.atomic():
+        deleted = delete(*args)
+    return {"model": model._meta.label, "deleted": deleted, "time": round(time.monotonic() - start_time, 3)}
+
+
+def _delete_related_chunk(model, sync_pks: List, chunk_size: int) -> int:
+    """Delete up to `chunk_size` rows of `model` belonging to the given Syncs, returning the number of rows deleted.
+
+    The primary keys are selected first, as MySQL doesn't support LIMIT in subqueries of DELETE statements.
+    """
+    pks = list(model.objects.filter(sync__in=sync_pks).values_list("pk", flat=True)[:chunk_size])
+    return _raw_delete(model, pks) if pks else 0
+
+
+def _delete_syncs(sync_pks: List) -> int:
+    """Delete Syncs along with the files of their `source_snapshot` and `cpu_profile`."""
+    file_fields = [Sync._meta.get_field("source_snapshot"), Sync._meta.get_field("cpu_profile")]
+    files = list(Sync.objects.filter(pk__in=sync_pks).values_list(*(field.name for field in file_fields)))
+    deleted = _raw_delete(Sync, sync_pks)
+    # The database only deletes the rows, the files are removed from storage once the rows are.
+    transaction.on_commit(
+        lambda: [field.storage.delete(name) for names in files for field, name in zip(file_fields, names) if name]
+    )
+    return deleted
+
+
+def purge_syncs(sync_pks: List, chunk_size: int = 1000) -> Iterator[Dict]:
+    """Delete Syncs along with their shards, log entries, diff chunks and files, one bounded chunk at a time.
+
+    Log entries and diff chunks are deleted with raw SQL in chunks of `chunk_size` rows, before the Syncs themselves
+    are deleted in chunks of `chunk_size` Syncs. Each chunk is committed on its own, so unlike a cascading delete
+    through the ORM no chunk loads or locks more than `chunk_size` rows.
+
+    Yields:
+        dict: The model, number of rows deleted and time taken in seconds of each chunk.
+    """
+    # Shards are deleted before the Syncs they were merged into, as these are referenced by the shards.
+    shard_pks = list(Sync.objects.filter(parent__in=sync_pks).values_list("pk", flat=True))
+    sync_chunks = [
+        pks[index : index + chunk_size]
+        for pks in (shard_pks, list(sync_pks))
+        for index in range(0, len(pks), chunk_size)
+    ]
+    for model in (SyncLogEntry, SyncDiffChunk):
+        for sync_chunk in sync_chunks:
+            while True:
+                result = _timed(model, _delete_related_chunk, model, sync_chunk, chunk_size)
+                if not result["deleted"]:
+                    break
+                yield result
+    for sync_chunk in sync_chunks:
+        yield _timed(Sync, _delete_syncs, sync_chunk)
+
+
+def get_retention_policy(job_model, keep_last: int, keep_days: int, keep_failed_days: int, overrides: Optional[Dict]):
+    """Get the retention policy of a Job, overriding the given settings with the Job's entry in `overrides`."""
+    policy = {"keep_last": keep_last, "keep_days": keep_days, "keep_failed_days": keep_failed_days}
+    if job_model is not None and overrides:
+        policy.update(
+            {
+                setting: value
+                for setting, value in overrides.get(job_model.class_path, {}).items()
+                if setting in RETENTION_POLICY_SETTINGS
+            }
+        )
+    return policy
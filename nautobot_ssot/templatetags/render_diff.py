@@ -1,15 +1,51 @@
 """Template tag for rendering a DiffSync diff dictionary in a more human-readable form."""
 
 from django import template
-from django.utils.html import format_html
+from django.utils.html import conditional_escape
 from django.utils.safestring import mark_safe
 
 register = template.Library()
 
 
+def _get_diff_class(child_diffs):
+    """Get the CSS class of a diff element, depending on whether it was added, subtracted, changed or unchanged."""
+    if "+" in child_diffs and "-" not in child_diffs:
+        return "diff-added"
+    if "-" in child_diffs and "+" not in child_diffs:
+        return "diff-subtracted"
+    if not child_diffs.get("+") and not child_diffs.get("-"):
+        return "diff-unchanged"
+    return "diff-changed"
+
+
+def render_diff_elements(children, parts):
+    """Render the diff elements of a single record type to list elements, appending the HTML to `parts`.
+
+    The diff isn't modified. Each part is escaped already, so the joined parts are safe to mark as such.
+    """
+    for child, child_diffs in children.items():
+        parts.append(f'<li class="{_get_diff_class(child_diffs)}">{conditional_escape(child)}<ul>')
+        for attr, value in child_diffs.get("+", {}).items():
+            parts.append(f'<li class="diff-added">{conditional_escape(attr)}: {conditional_escape(value)}</li>')
+        for attr, value in child_diffs.get("-", {}).items():
+            parts.append(f'<li class="diff-subtracted">{conditional_escape(attr)}: {conditional_escape(value)}</li>')
+        render_diff_parts({key: value for key, value in child_diffs.items() if key not in ("+", "-")}, parts)
+        parts.append("</ul></li>")
+
+
+def render_diff_parts(diff, parts):
+    """Render a DiffSync diff dictionary representation to nested list elements, appending the HTML to `parts`."""
+    for record_type, children in diff.items():
+        parts.append(f"<li>{conditional_escape(record_type)}<ul>")
+        render_diff_elements(children, parts)
+        parts.append("</ul></li>")
+
+
 def render_diff_recursive(diff):
     """Recursively render a DiffSync diff dictionary representation to nested list elements.
 
+    The HTML is built in a single pass by joining its parts, without modifying the diff.
+
     Example:
         {
             location:
@@ -30,36 +66,12 @@ def render_diff_recursive(diff):
             * device
               + ams01
     """
-    result = ""
-    for record_type, children in diff.items():
-        child_result = ""
-        for child, child_diffs in children.items():
-            if "+" in child_diffs and "-" not in child_diffs:
-                child_class = "diff-added"
-            elif "-" in child_diffs and "+" not in child_diffs:
-                child_class = "diff-subtracted"
-            elif not child_diffs.get("+") and not child_diffs.get("-"):
-                child_class = "diff-unchanged"
-            else:
-                child_class = "diff-changed"
-            child_result += format_html('<li class="{}">{}<ul>', child_class, child)
-
-            for attr, value in child_diffs.pop("+", {}).items():
-                child_result += format_html('<li class="diff-added">{}: {}</li>', attr, value)
-
-            for attr, value in child_diffs.pop("-", {}).items():
-                child_result += format_html('<li class="diff-subtracted">{}: {}</li>', attr, value)
-
-            if child_diffs:
-                child_result += render_diff_recursive(child_diffs)
-
-            child_result += "</ul></li>"
-        result += format_html("<li>{}<ul>{}</ul></li>", record_type, mark_safe(child_result))  # noqa: S308
-    return result
+    parts = []
+    render_diff_parts(diff, parts)
+    return mark_safe("".join(parts))  # noqa: S308
 
 
 @register.simple_tag
 def render_diff(diff):
     """Render a DiffSync diff dict to HTML."""
-    html_text = render_diff_recursive(diff)
-    return format_html("<ul>{}</ul>", mark_safe(html_text))  # noqa: S308
+    return mark_safe(f"<ul>{render_diff_recursive(diff)}</ul>")  # noqa: S308
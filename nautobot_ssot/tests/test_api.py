@@ -1,12 +1,20 @@
 """Unit tests for nautobot_ssot."""
 
+import json
+from datetime import timedelta
+
 from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
 from django.urls import reverse
+from django.utils import timezone
 from nautobot.core.testing import TestCase
+from nautobot.extras.models import JobResult
 from nautobot.users.models import Token
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from nautobot_ssot.models import Sync
+
 User = get_user_model()
 
 
@@ -26,3 +34,92 @@ class PlaceholderAPITest(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["count"], 0)
+
+
+class SyncAPITest(TestCase):
+    """Test the Sync and SyncLogEntry API endpoints."""
+
+    def setUp(self):
+        """Create a superuser and token for API calls, as well as a few Syncs."""
+        self.user = User.objects.create(username="testuser", is_superuser=True)
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+        for i in range(3):
+            sync = Sync.objects.create(
+                source="Example Data Source",
+                target="Nautobot",
+                start_time=timezone.now() - timedelta(minutes=i),
+                dry_run=False,
+                diff={"tenant": {f"Tenant {j}": {"+": {"description": ""}} for j in range(3)}},
+                job_result=JobResult.objects.create(
+                    name="ExampleDataSource",
+                    task_name="nautobot_ssot.jobs.examples.ExampleDataSource",
+                    worker="default",
+                ),
+                num_failed=i,
+            )
+            sync.logs.create(action="create", status="success", message="Created")
+            sync.logs.create(
+                action="update",
+                status="failure",
+                message="Failed",
+                synced_object_type=ContentType.objects.get(app_label="tenancy", model="tenant"),
+            )
+        self.sync = Sync.objects.order_by("-start_time").first()
+
+    def test_list_syncs(self):
+        """Verify that Syncs are listed latest first in pages, without their diff."""
+        url = reverse("plugins-api:nautobot_ssot-api:sync-list")
+        response = self.client.get(url, {"limit": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(2, len(response.data["results"]))
+        self.assertEqual(str(self.sync.pk), response.data["results"][0]["id"])
+        self.assertNotIn("diff", response.data["results"][0])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(1, len(response.data["results"]))
+        self.assertIsNone(response.data["next"])
+
+        response = self.client.get(url, {"num_failed__gt": 0})
+        self.assertEqual(2, len(response.data["results"]))
+
+    def test_retrieve_sync_with_diff(self):
+        """Verify that the diff of a Sync is only included when requested."""
+        url = reverse("plugins-api:nautobot_ssot-api:sync-detail", kwargs={"pk": self.sync.pk})
+        response = self.client.get(url, {"include": "diff"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.sync.diff, response.data["diff"])
+
+    def test_sync_diff(self):
+        """Verify that the diff of a single model type of a Sync is streamed, sliced by offset and limit."""
+        url = reverse("plugins-api:nautobot_ssot-api:sync-diff", kwargs={"pk": self.sync.pk})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(url, {"model_type": "tenant", "offset": 1, "limit": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {
+                "model_type": "tenant",
+                "count": 3,
+                "results": [{"name": "Tenant 1", "diff": {"+": {"description": ""}}}],
+            },
+            json.loads(b"".join(response.streaming_content)),
+        )
+
+        response = self.client.get(url, {"model_type": "location"})
+        self.assertEqual(
+            {"model_type": "location", "count": 0, "results": []}, json.loads(b"".join(response.streaming_content))
+        )
+
+    def test_list_sync_log_entries(self):
+        """Verify that SyncLogEntries can be filtered by action, status and synced object type."""
+        url = reverse("plugins-api:nautobot_ssot-api:synclogentry-list")
+        response = self.client.get(url, {"sync": self.sync.pk, "status": "failure"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(1, len(response.data["results"]))
+        self.assertEqual("tenancy.tenant", response.data["results"][0]["synced_object_type"])
+
+        response = self.client.get(url, {"action": "update", "synced_object_type": "tenancy.tenant"})
+        self.assertEqual(3, len(response.data["results"]))
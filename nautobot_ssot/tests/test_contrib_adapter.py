@@ -1,14 +1,18 @@
 """Tests for contrib.NautobotAdapter."""
 
-from typing import List
+from datetime import timedelta
+from typing import List, Optional
 from unittest import skip
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from diffsync import ObjectNotFound
+from diffsync.enum import DiffSyncFlags
+from diffsync.exceptions import ObjectCrudException
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db import connection
 from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
 from nautobot.circuits import models as circuits_models
 from nautobot.core.testing import TestCase
 from nautobot.dcim import models as dcim_models
@@ -18,7 +22,9 @@ from nautobot.ipam import models as ipam_models
 from nautobot.tenancy import models as tenancy_models
 from typing_extensions import Annotated, TypedDict
 
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
 from nautobot_ssot.contrib import CustomFieldAnnotation, NautobotAdapter, NautobotModel
+from nautobot_ssot.profiling import ModelStatistics
 from nautobot_ssot.tests.contrib_base_classes import (
     NautobotCable,
     NautobotDevice,
@@ -300,6 +306,79 @@ class CacheTests(TestCase):
             self.assertEqual(6, len(tenant_group_queries))
 
 
+class CacheWarmingTests(TestCase):
+    """Tests for warming, indexing and bounding the ORM cache of the nautobot adapter."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tenant_group = tenancy_models.TenantGroup.objects.create(name="Test Group")
+        cls.tenants = [
+            tenancy_models.Tenant.objects.create(name=f"Tenant {i}", tenant_group=cls.tenant_group) for i in range(3)
+        ]
+
+    def setUp(self):
+        # Make sure the content type lookups used for the cache keys don't count towards the amount of queries.
+        ContentType.objects.get_for_model(tenancy_models.Tenant)
+
+    def test_warm_cache(self):
+        adapter = TestAdapter(job=None)
+        with self.assertNumQueries(1):
+            adapter.warm_cache(
+                tenancy_models.Tenant,
+                key_fields=["name", ("name", "tenant_group__name")],
+                queryset=tenancy_models.Tenant.objects.select_related("tenant_group"),
+            )
+        with self.assertNumQueries(0):
+            for tenant in self.tenants:
+                self.assertEqual(tenant, adapter.get_from_orm_cache({"name": tenant.name}, tenancy_models.Tenant))
+                self.assertEqual(tenant, adapter.get_from_orm_cache({"pk": tenant.pk}, tenancy_models.Tenant))
+                self.assertEqual(
+                    tenant,
+                    adapter.get_from_orm_cache(
+                        {"name": tenant.name, "tenant_group__name": self.tenant_group.name}, tenancy_models.Tenant
+                    ),
+                )
+        self.assertEqual(
+            {"tenancy.tenant": {"hits": 9, "misses": 0, "evictions": 0, "size": 9}}, adapter.get_cache_statistics()
+        )
+
+    def test_warm_cache_ambiguous_key(self):
+        adapter = TestAdapter(job=None)
+        adapter.warm_cache(tenancy_models.Tenant, key_fields=["tenant_group"])
+        with self.assertRaises(tenancy_models.Tenant.MultipleObjectsReturned):
+            adapter.get_from_orm_cache({"tenant_group": self.tenant_group}, tenancy_models.Tenant)
+        # Objects fetched lazily later on, e.g. after being evicted, aren't indexed under the ambiguous key either.
+        adapter.invalidate_cache()
+        adapter.get_from_orm_cache({"pk": self.tenants[0].pk}, tenancy_models.Tenant)
+        with self.assertRaises(tenancy_models.Tenant.MultipleObjectsReturned):
+            adapter.get_from_orm_cache({"tenant_group": self.tenant_group}, tenancy_models.Tenant)
+
+    def test_lazily_fetched_objects_are_indexed_by_pk(self):
+        adapter = TestAdapter(job=None)
+        tenant = adapter.get_from_orm_cache({"name": self.tenants[0].name}, tenancy_models.Tenant)
+        with self.assertNumQueries(0):
+            self.assertEqual(tenant, adapter.get_from_orm_cache({"pk": tenant.pk}, tenancy_models.Tenant))
+
+    def test_cache_max_size(self):
+        class BoundedAdapter(TestAdapter):
+            """Adapter with a bounded ORM cache."""
+
+            cache_max_size = 4
+
+        adapter = BoundedAdapter(job=None)
+        for tenant in self.tenants:
+            adapter.get_from_orm_cache({"name": tenant.name}, tenancy_models.Tenant)
+        # Each tenant is cached under its name and its primary key.
+        self.assertEqual(
+            {"tenancy.tenant": {"hits": 0, "misses": 3, "evictions": 2, "size": 4}}, adapter.get_cache_statistics()
+        )
+        # The least recently used tenant was evicted.
+        with self.assertNumQueries(1):
+            adapter.get_from_orm_cache({"name": self.tenants[0].name}, tenancy_models.Tenant)
+        with self.assertNumQueries(0):
+            adapter.get_from_orm_cache({"name": self.tenants[2].name}, tenancy_models.Tenant)
+
+
 class TestNestedRelationships(TestCase):
     """Tests for nested relationships."""
 
@@ -353,3 +432,385 @@ class TestNestedRelationships(TestCase):
         self.assertEqual(amount_of_vlans, len(diffsync_vlan_group.vlans))
         for vlan in diffsync_vlan_group.vlans:
             self.assertEqual(location.name, vlan["location__name"])
+
+
+class LoadQueryCountTests(TestCase):
+    """Tests that loading runs a constant amount of queries regardless of the amount of objects."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.relationship = extras_models.Relationship.objects.create(
+            label="Test Relationship",
+            source_type=ContentType.objects.get_for_model(circuits_models.Provider),
+            destination_type=ContentType.objects.get_for_model(tenancy_models.Tenant),
+            type=RelationshipTypeChoices.TYPE_ONE_TO_MANY,
+        )
+        cls.tags = [extras_models.Tag.objects.create(name=f"Tag {i}") for i in range(2)]
+        for tag in cls.tags:
+            tag.content_types.set([ContentType.objects.get_for_model(tenancy_models.Tenant)])
+
+    def _create_objects(self, amount):
+        for _ in range(amount):
+            index = tenancy_models.Tenant.objects.count()
+            tenant = tenancy_models.Tenant.objects.create(name=f"Tenant {index}")
+            tenant.tags.set(self.tags)
+            provider = circuits_models.Provider.objects.create(name=f"Provider {index}")
+            extras_models.RelationshipAssociation.objects.create(
+                relationship=self.relationship, source=provider, destination=tenant
+            )
+
+    @staticmethod
+    def _count_load_queries(adapter_class):
+        adapter = adapter_class(job=MagicMock())
+        with CaptureQueriesContext(connection) as ctx:
+            adapter.load()
+        return len(ctx.captured_queries)
+
+    def _assert_constant_query_count(self, adapter_class):
+        self._create_objects(1)
+        queries_for_one = self._count_load_queries(adapter_class)
+        self._create_objects(4)
+        self.assertEqual(queries_for_one, self._count_load_queries(adapter_class))
+
+    def test_to_many_relationship(self):
+        class Adapter(NautobotAdapter):
+            """Test adapter loading tenants with their tags."""
+
+            top_level = ("tenant",)
+            tenant = NautobotTenant
+
+        self._assert_constant_query_count(Adapter)
+
+    def test_custom_relationship_foreign_key(self):
+        self._assert_constant_query_count(CustomRelationShipTestAdapterSource)
+
+    def test_children(self):
+        def create_tenant_groups(amount):
+            for _ in range(amount):
+                index = tenancy_models.TenantGroup.objects.count()
+                tenant_group = tenancy_models.TenantGroup.objects.create(name=f"Tenant Group {index}")
+                for tenant_index in range(2):
+                    tenant = tenancy_models.Tenant.objects.create(
+                        name=f"Tenant {index}.{tenant_index}", tenant_group=tenant_group
+                    )
+                    tenant.tags.set(self.tags)
+
+        create_tenant_groups(1)
+        queries_for_one = self._count_load_queries(TestAdapter)
+        create_tenant_groups(4)
+        self.assertEqual(queries_for_one, self._count_load_queries(TestAdapter))
+
+        adapter = TestAdapter(job=MagicMock())
+        adapter.load()
+        self.assertEqual(10, len(adapter.get_all("tenant")))
+        for diffsync_tenant in adapter.get_all("tenant"):
+            self.assertEqual(len(self.tags), len(diffsync_tenant.tags))
+
+    def test_custom_relationship_to_many(self):
+        self._assert_constant_query_count(CustomRelationShipTestAdapterDestination)
+
+
+class ValuesTenant(NautobotModel):
+    """Tenant model that can be loaded from `values_list` rows."""
+
+    _model = tenancy_models.Tenant
+    _modelname = "tenant"
+    _identifiers = ("name",)
+    _attributes = ("description", "tenant_group__name", "custom_field")
+
+    name: str
+    description: Optional[str] = None
+    tenant_group__name: Optional[str] = None
+    custom_field: Annotated[Optional[str], CustomFieldAnnotation(key="test_custom_field")] = None
+
+
+class ValuesTenantGroup(NautobotModel):
+    """Tenant group model that can be loaded from `values_list` rows."""
+
+    _model = tenancy_models.TenantGroup
+    _modelname = "tenant_group"
+    _identifiers = ("name",)
+    _attributes = ("description",)
+    _children = {"tenant": "tenants"}
+
+    name: str
+    description: str
+    tenants: List[ValuesTenant] = []
+
+
+class InstanceLoadingAdapter(NautobotAdapter):
+    """Adapter loading tenant groups and tenants from model instances."""
+
+    top_level = ("tenant_group",)
+    tenant_group = ValuesTenantGroup
+    tenant = ValuesTenant
+
+
+class ValuesLoadingAdapter(InstanceLoadingAdapter):
+    """Adapter loading tenant groups and tenants from `values_list` rows."""
+
+    values_loading = True
+
+
+class ValuesLoadingTests(TestCase):
+    """Tests for loading from `values_list` rows, see `NautobotAdapter.values_loading`."""
+
+    @classmethod
+    def setUpTestData(cls):
+        custom_field = extras_models.CustomField.objects.create(key="test_custom_field", label="Test Custom Field")
+        custom_field.content_types.set([ContentType.objects.get_for_model(tenancy_models.Tenant)])
+        tag = extras_models.Tag.objects.create(name="Test Tag")
+        tag.content_types.set([ContentType.objects.get_for_model(tenancy_models.Tenant)])
+        for group_index in range(3):
+            tenant_group = tenancy_models.TenantGroup.objects.create(
+                name=f"Group {group_index}", description=f"Description {group_index}"
+            )
+            for tenant_index in range(3):
+                tenant = tenancy_models.Tenant.objects.create(
+                    name=f"Tenant {group_index}.{tenant_index}",
+                    tenant_group=tenant_group,
+                    _custom_field_data={"test_custom_field": f"Value {tenant_index}"} if tenant_index else {},
+                )
+                tenant.tags.add(tag)
+        tenancy_models.Tenant.objects.create(name="Tenant without group")
+
+    def test_values_loading_matches_instance_loading(self):
+        instance_adapter = InstanceLoadingAdapter(job=MagicMock())
+        instance_adapter.load()
+        values_adapter = ValuesLoadingAdapter(job=MagicMock())
+        with self.assertNumQueries(2):
+            values_adapter.load()
+
+        self.assertEqual(9, len(values_adapter.get_all("tenant")))
+        self.assertEqual(instance_adapter.dict(), values_adapter.dict())
+
+    def test_children_are_filtered_by_parent(self):
+        class FilteredTenantGroup(ValuesTenantGroup):
+            """Tenant group model only loading the first two tenant groups."""
+
+            @classmethod
+            def get_queryset(cls):
+                return super().get_queryset().filter(name__in=["Group 0", "Group 1"])
+
+        class Adapter(ValuesLoadingAdapter):
+            """Adapter loading the tenants of the first two tenant groups from `values_list` rows."""
+
+            tenant_group = FilteredTenantGroup
+
+        adapter = Adapter(job=MagicMock())
+        # The tenants are queried for one chunk of parents at a time.
+        with patch("nautobot_ssot.contrib.adapter._CHILDREN_PARENT_PKS_CHUNK_SIZE", 1):
+            with self.assertNumQueries(3):
+                adapter.load()
+        self.assertEqual(
+            {f"Tenant {group_index}.{tenant_index}" for group_index in range(2) for tenant_index in range(3)},
+            {tenant.name for tenant in adapter.get_all("tenant")},
+        )
+
+    def test_fallback_for_fields_requiring_instances(self):
+        class Adapter(TestAdapter):
+            """Adapter with a to-many relationship field on the tenant model."""
+
+            values_loading = True
+
+        adapter = Adapter(job=MagicMock())
+        self.assertFalse(adapter._can_load_with_values(NautobotTenantGroup))  # pylint: disable=protected-access
+        adapter.load()
+        for diffsync_tenant in adapter.get_all("tenant"):
+            self.assertEqual([{"name": "Test Tag"}], diffsync_tenant.tags)
+
+
+class DeltaTenantAdapter(NautobotAdapter):
+    """Adapter loading tenants as top-level objects from `values_list` rows."""
+
+    top_level = ("tenant",)
+    tenant = ValuesTenant
+    values_loading = True
+
+
+class DeltaLoadingTests(TestCase):
+    """Tests for loading only changed objects, see `NautobotAdapter.delta_since`."""
+
+    @classmethod
+    def setUpTestData(cls):
+        for group_index in range(2):
+            tenant_group = tenancy_models.TenantGroup.objects.create(name=f"Group {group_index}")
+            for tenant_index in range(2):
+                tenancy_models.Tenant.objects.create(
+                    name=f"Tenant {group_index}.{tenant_index}", tenant_group=tenant_group
+                )
+        cls.watermark = now()
+        tenancy_models.Tenant.objects.filter(name="Tenant 1.0").update(last_updated=now() + timedelta(minutes=1))
+
+    def test_only_changed_objects_are_loaded(self):
+        job = MagicMock(delta_since=self.watermark)
+        job.get_delta_identifiers.return_value = []
+        adapter = DeltaTenantAdapter(job=job)
+        adapter.load()
+        self.assertEqual(["Tenant 1.0"], [tenant.name for tenant in adapter.get_all("tenant")])
+
+    def test_parents_of_changed_children_are_loaded(self):
+        job = MagicMock(delta_since=self.watermark)
+        job.get_delta_identifiers.return_value = []
+        adapter = TestAdapter(job=job)
+        adapter.load()
+        self.assertEqual(["Group 1"], [group.name for group in adapter.get_all("tenant_group")])
+        self.assertEqual({"Tenant 1.0", "Tenant 1.1"}, {tenant.name for tenant in adapter.get_all("tenant")})
+
+    def test_objects_reported_by_job_are_loaded(self):
+        job = MagicMock(delta_since=self.watermark)
+        job.get_delta_identifiers.side_effect = lambda model_name: [{"name": "Tenant 0.1"}]
+        adapter = DeltaTenantAdapter(job=job)
+        adapter.load()
+        self.assertEqual({"Tenant 0.1", "Tenant 1.0"}, {tenant.name for tenant in adapter.get_all("tenant")})
+
+    def test_all_objects_are_loaded_above_identifiers_max(self):
+        job = MagicMock(delta_since=self.watermark)
+        job.get_delta_identifiers.side_effect = lambda model_name: [{"name": "Tenant 0.1"}, {"name": "Tenant 0.0"}]
+        adapter = DeltaTenantAdapter(job=job)
+        adapter.delta_identifiers_max = 1
+        adapter.load()
+        self.assertEqual(tenancy_models.Tenant.objects.count(), len(adapter.get_all("tenant")))
+
+
+class ModelStatisticsLoadingTests(TestCase):
+    """Tests for timing the load of each top-level model, see `nautobot_ssot.profiling.time_load`."""
+
+    def test_load_is_timed_per_model(self):
+        for index in range(3):
+            tenancy_models.Tenant.objects.create(name=f"Tenant {index}")
+        job = MagicMock(delta_since=None, model_statistics=ModelStatistics())
+        adapter = DeltaTenantAdapter(job=job)
+        adapter.load()
+        load_statistics = job.model_statistics.as_dict()["tenant"]["load"]
+        self.assertEqual(tenancy_models.Tenant.objects.count(), load_statistics["count"])
+        self.assertGreaterEqual(load_statistics["time"], 0)
+
+
+class BulkTestAdapter(TestAdapter):
+    """Adapter for testing the deferred bulk write mode."""
+
+    bulk_operations = True
+    bulk_batch_size = 100
+
+
+class BulkOperationsTests(TestCase):
+    """Tests for the deferred bulk write mode of the 'NautobotAdapter' class."""
+
+    def test_create_is_deferred_until_flush(self):
+        adapter = BulkTestAdapter(job=MagicMock())
+        NautobotTenantGroup.create(adapter=adapter, ids={"name": "Bulk Group"}, attrs={"description": "Bulk"})
+        NautobotTenant.create(adapter=adapter, ids={"name": "Bulk Tenant"}, attrs={"tenant_group__name": "Bulk Group"})
+        self.assertFalse(tenancy_models.Tenant.objects.filter(name="Bulk Tenant").exists())
+        self.assertEqual(2, adapter.pending_bulk_operations)
+
+        adapter.flush_bulk_operations()
+
+        tenant = tenancy_models.Tenant.objects.get(name="Bulk Tenant")
+        self.assertEqual("Bulk Group", tenant.tenant_group.name)
+        self.assertEqual(0, adapter.pending_bulk_operations)
+
+    def test_pending_objects_are_found_after_first_lookup(self):
+        adapter = BulkTestAdapter(job=MagicMock())
+        for name in ("A", "B"):
+            NautobotTenantGroup.create(adapter=adapter, ids={"name": f"Bulk Group {name}"}, attrs={})
+            NautobotTenant.create(
+                adapter=adapter, ids={"name": f"Bulk Tenant {name}"}, attrs={"tenant_group__name": f"Bulk Group {name}"}
+            )
+
+        adapter.flush_bulk_operations()
+
+        for name in ("A", "B"):
+            tenant = tenancy_models.Tenant.objects.get(name=f"Bulk Tenant {name}")
+            self.assertEqual(f"Bulk Group {name}", tenant.tenant_group.name)
+
+    def test_many_to_many_is_deferred_until_parent_is_flushed(self):
+        tag = extras_models.Tag.objects.create(name="Bulk Tag")
+        tag.content_types.set([ContentType.objects.get_for_model(tenancy_models.Tenant)])
+        adapter = BulkTestAdapter(job=MagicMock())
+        NautobotTenant.create(adapter=adapter, ids={"name": "Bulk Tenant"}, attrs={"tags": [{"name": tag.name}]})
+
+        adapter.flush_bulk_operations()
+
+        self.assertEqual([tag], list(tenancy_models.Tenant.objects.get(name="Bulk Tenant").tags.all()))
+
+    def test_failed_bulk_write_falls_back_to_single_writes(self):
+        job = MagicMock(diffsync_flags=DiffSyncFlags.CONTINUE_ON_FAILURE)
+        adapter = BulkTestAdapter(job=job)
+        NautobotTenant.create(adapter=adapter, ids={"name": "Bulk Tenant"}, attrs={})
+        NautobotTenant.create(adapter=adapter, ids={"name": "Bulk Tenant"}, attrs={})
+
+        adapter.flush_bulk_operations()
+
+        # Only the write violating the unique name is lost, it's logged as failed.
+        self.assertEqual(1, tenancy_models.Tenant.objects.filter(name="Bulk Tenant").count())
+        job.sync_log.assert_called_once()
+        self.assertEqual(SyncLogEntryStatusChoices.STATUS_FAILURE, job.sync_log.call_args.kwargs["status"])
+        self.assertEqual(SyncLogEntryActionChoices.ACTION_CREATE, job.sync_log.call_args.kwargs["action"])
+
+    def test_failed_bulk_write_raises_without_continue_on_failure(self):
+        adapter = BulkTestAdapter(job=MagicMock(diffsync_flags=DiffSyncFlags.NONE))
+        NautobotTenant.create(adapter=adapter, ids={"name": "Bulk Tenant"}, attrs={})
+        NautobotTenant.create(adapter=adapter, ids={"name": "Bulk Tenant"}, attrs={})
+
+        with self.assertRaises(ObjectCrudException):
+            adapter.flush_bulk_operations()
+
+    def test_update_and_delete(self):
+        tenant_to_update = tenancy_models.Tenant.objects.create(name="Tenant 1")
+        tenant_to_delete = tenancy_models.Tenant.objects.create(name="Tenant 2")
+        adapter = BulkTestAdapter(job=MagicMock())
+        diffsync_tenant_to_update = NautobotTenant(name=tenant_to_update.name, pk=tenant_to_update.pk)
+        diffsync_tenant_to_update.adapter = adapter
+        diffsync_tenant_to_delete = NautobotTenant(name=tenant_to_delete.name, pk=tenant_to_delete.pk)
+        diffsync_tenant_to_delete.adapter = adapter
+
+        diffsync_tenant_to_update.update(attrs={"description": "Updated"})
+        diffsync_tenant_to_delete.delete()
+        tenant_to_update.refresh_from_db()
+        self.assertEqual("", tenant_to_update.description)
+        self.assertTrue(tenancy_models.Tenant.objects.filter(pk=tenant_to_delete.pk).exists())
+
+        adapter.flush_bulk_operations()
+
+        tenant_to_update.refresh_from_db()
+        self.assertEqual("Updated", tenant_to_update.description)
+        self.assertFalse(tenancy_models.Tenant.objects.filter(pk=tenant_to_delete.pk).exists())
+
+    def test_protected_delete_is_logged_as_failed(self):
+        location_type = dcim_models.LocationType.objects.create(name="Bulk Location Type")
+        dcim_models.Location.objects.create(
+            name="Bulk Location",
+            location_type=location_type,
+            status=extras_models.Status.objects.get(name="Active"),
+        )
+        job = MagicMock(diffsync_flags=DiffSyncFlags.CONTINUE_ON_FAILURE)
+        adapter = BulkTestAdapter(job=job)
+        adapter.enqueue_delete(dcim_models.LocationType, location_type.pk)
+
+        adapter.flush_bulk_operations()
+
+        self.assertTrue(dcim_models.LocationType.objects.filter(pk=location_type.pk).exists())
+        job.sync_log.assert_called_once()
+        self.assertEqual(SyncLogEntryStatusChoices.STATUS_FAILURE, job.sync_log.call_args.kwargs["status"])
+        self.assertEqual(SyncLogEntryActionChoices.ACTION_DELETE, job.sync_log.call_args.kwargs["action"])
+        self.assertEqual(location_type, job.sync_log.call_args.kwargs["synced_object"])
+
+        job.diffsync_flags = DiffSyncFlags.NONE
+        adapter.enqueue_delete(dcim_models.LocationType, location_type.pk)
+        with self.assertRaises(ObjectCrudException):
+            adapter.flush_bulk_operations()
+
+    def test_flush_on_batch_size(self):
+        adapter = BulkTestAdapter(job=MagicMock())
+        adapter.bulk_batch_size = 5
+        for i in range(7):
+            NautobotTenant.create(adapter=adapter, ids={"name": f"Bulk Tenant {i}"}, attrs={})
+        self.assertEqual(5, tenancy_models.Tenant.objects.filter(name__startswith="Bulk Tenant").count())
+        self.assertEqual(2, adapter.pending_bulk_operations)
+
+    def test_flush_on_sync_complete(self):
+        adapter = BulkTestAdapter(job=MagicMock())
+        NautobotTenant.create(adapter=adapter, ids={"name": "Bulk Tenant"}, attrs={})
+        adapter.sync_complete(source=MagicMock(), diff=MagicMock())
+        self.assertTrue(tenancy_models.Tenant.objects.filter(name="Bulk Tenant").exists())
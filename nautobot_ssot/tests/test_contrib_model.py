@@ -1,7 +1,7 @@
 """Tests for contrib.NautobotModel."""
 
 from typing import List, Optional
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from django.contrib.contenttypes.models import ContentType
 from nautobot.circuits import models as circuits_models
@@ -11,14 +11,17 @@ from nautobot.dcim.choices import InterfaceTypeChoices
 from nautobot.extras import models as extras_models
 from nautobot.extras.choices import RelationshipTypeChoices
 from nautobot.tenancy import models as tenancy_models
+from typing_extensions import get_type_hints
 
-from nautobot_ssot.contrib import NautobotAdapter, NautobotModel
+from nautobot_ssot.contrib import FieldTypeEnum, NautobotAdapter, NautobotModel
 from nautobot_ssot.tests.contrib_base_classes import (
     NautobotTenant,
+    NautobotTenantGroup,
     ProviderModelCustomRelationship,
     TagDict,
     TagModel,
     TenantModelCustomRelationship,
+    TestAdapter,
     TestCaseWithDeviceData,
 )
 from nautobot_ssot.tests.test_contrib_adapter import (
@@ -287,3 +290,63 @@ class AnnotationsSubclassingTest(TestCase):
                 self.fail("Don't use `Klass.__annotations__`, prefer `typing.get_type_hints`.")
             else:
                 raise error
+
+
+class FieldPlanTests(TestCase):
+    """Tests for the field plan compiled by `NautobotModel.get_field_plan`."""
+
+    def test_field_types(self):
+        field_plan = NautobotTenant.get_field_plan()
+        self.assertEqual(list(field_plan), ["name", "description", "tenant_group__name", "tags"])
+        self.assertEqual(field_plan["name"].field_type, FieldTypeEnum.ATTRIBUTE)
+        self.assertEqual(field_plan["name"].concrete_field_names, ("name",))
+        self.assertEqual(field_plan["tenant_group__name"].field_type, FieldTypeEnum.FOREIGN_KEY)
+        self.assertEqual(field_plan["tenant_group__name"].related_field_name, "tenant_group")
+        self.assertEqual(field_plan["tenant_group__name"].lookup, "name")
+        self.assertEqual(field_plan["tenant_group__name"].related_model, tenancy_models.TenantGroup)
+        self.assertEqual(field_plan["tags"].field_type, FieldTypeEnum.TO_MANY)
+        self.assertEqual(field_plan["tags"].typed_dict_fields, ("name",))
+        self.assertEqual(field_plan["tags"].concrete_field_names, ())
+
+    def test_prefetch_related_lookups_span_relation_path(self):
+        class LocationModel(NautobotModel):
+            """Location model with a foreign key lookup spanning two relations."""
+
+            _model = dcim_models.Location
+            _modelname = "location"
+            _identifiers = ("name",)
+            _attributes = ("tenant__name", "tenant__tenant_group__name")
+
+            name: str
+            tenant__name: Optional[str] = None
+            tenant__tenant_group__name: Optional[str] = None
+
+        self.assertEqual(
+            ["tenant", "tenant__tenant_group"],
+            LocationModel._get_prefetch_related_lookups(),  # pylint: disable=protected-access
+        )
+
+    def test_custom_relationship_field_types(self):
+        foreign_key = TenantModelCustomRelationship.get_field_plan()["provider__name"]
+        self.assertEqual(foreign_key.field_type, FieldTypeEnum.CUSTOM_RELATIONSHIP_FOREIGN_KEY)
+        self.assertEqual(foreign_key.custom_relationship_annotation.name, "Test Relationship")
+        to_many = ProviderModelCustomRelationship.get_field_plan()["tenants"]
+        self.assertEqual(to_many.field_type, FieldTypeEnum.CUSTOM_RELATIONSHIP_TO_MANY)
+        self.assertEqual(to_many.typed_dict_fields, ("name",))
+
+    def test_plan_is_compiled_once(self):
+        group = tenancy_models.TenantGroup.objects.create(name="Test Group")
+        for index in range(5):
+            tenancy_models.Tenant.objects.create(name=f"Test Tenant {index}", tenant_group=group)
+        NautobotModel._field_plans.pop(NautobotTenant, None)
+        NautobotModel._field_plans.pop(NautobotTenantGroup, None)
+
+        with patch("nautobot_ssot.contrib.model.get_type_hints", wraps=get_type_hints) as mock_get_type_hints:
+            for _ in range(2):
+                adapter = TestAdapter(job=MagicMock())
+                adapter.load()
+
+        self.assertEqual(len(adapter.get_all("tenant")), 5)
+        compiled_models = [call.args[0] for call in mock_get_type_hints.call_args_list if call.kwargs]
+        self.assertEqual(compiled_models.count(NautobotTenant), 1)
+        self.assertEqual(compiled_models.count(NautobotTenantGroup), 1)
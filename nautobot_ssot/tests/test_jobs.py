@@ -1,18 +1,67 @@
 """Test the Job classes in nautobot_ssot."""
 
 import os.path
-from unittest.mock import Mock, call
+import pstats
+import tempfile
+import threading
+from datetime import timedelta
+from unittest.mock import Mock, patch
 
+from diffsync import Adapter, DiffSyncModel
+from diffsync.enum import DiffSyncFlags
+from diffsync.exceptions import ObjectNotCreated
 from django.db.utils import IntegrityError, OperationalError
 from django.test import override_settings
 from nautobot.core.testing import TransactionTestCase
-from nautobot.extras.models import JobResult
+from nautobot.extras.choices import JobResultStatusChoices
+from nautobot.extras.models import Job, JobResult
+from nautobot.tenancy.models import Tenant
 
-from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
-from nautobot_ssot.models import SyncLogEntry
+from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices, SyncLogPolicyChoices
+from nautobot_ssot.models import Sync, SyncLogEntry
 from nautobot_ssot.tests.jobs import DataSource, DataSyncBaseJob, DataTarget
 
 
+class SnapshotTenant(DiffSyncModel):
+    """Tenant model for testing source snapshots."""
+
+    _modelname = "tenant"
+    _identifiers = ("name",)
+    _attributes = ("description",)
+
+    name: str
+    description: str = ""
+
+
+class SnapshotAdapter(Adapter):
+    """Adapter for testing source snapshots."""
+
+    tenant = SnapshotTenant
+    top_level = ("tenant",)
+
+
+class BatchTenant(SnapshotTenant):
+    """Tenant model writing to the database for testing batched transactions."""
+
+    @classmethod
+    def create(cls, adapter, ids, attrs):
+        """Create the tenant in the database, failing for tenants named "fail" after the write."""
+        try:
+            Tenant.objects.create(name=ids["name"], description=attrs.get("description", ""))
+        except IntegrityError as error:
+            raise ObjectNotCreated(str(error)) from error
+        if ids["name"] == "fail":
+            raise ObjectNotCreated("Failing on purpose.")
+        return super().create(adapter, ids, attrs)
+
+
+class BatchAdapter(Adapter):
+    """Adapter for testing batched transactions."""
+
+    tenant = BatchTenant
+    top_level = ("tenant",)
+
+
 @override_settings(JOBS_ROOT=os.path.join(os.path.dirname(__file__), "jobs"))
 class BaseJobTestCase(TransactionTestCase):
     """Test the DataSyncBaseJob class."""
@@ -56,8 +105,126 @@ class BaseJobTestCase(TransactionTestCase):
             object_repr="Nothing to delete",
         )
 
+        # Entries are buffered until they are flushed.
+        self.assertEqual(0, SyncLogEntry.objects.count())
+        self.job.flush_sync_log()
         self.assertEqual(2, SyncLogEntry.objects.count())
 
+    def test_sync_log_batch_size(self):
+        """Test that buffered SyncLogEntry records are flushed once the batch size is reached."""
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.job.sync_log_batch_size = 3
+        for _ in range(4):
+            self.job.sync_log(
+                action=SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+                status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+            )
+        self.assertEqual(3, SyncLogEntry.objects.count())
+        self.job.flush_sync_log()
+        self.assertEqual(4, SyncLogEntry.objects.count())
+
+    def test_structlog_to_sync_log_entry(self):
+        """Test that synced objects of DiffSync log events are looked up once per model when flushing."""
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.job.lookup_objects = Mock(side_effect=lambda model_name, unique_ids: {})
+        for unique_id in ("one", "two", "three"):
+            self.job._structlog_to_sync_log_entry(  # pylint: disable=protected-access
+                None,
+                "info",
+                {
+                    "src": "source",
+                    "dst": "target",
+                    "action": None,
+                    "model": "tenant",
+                    "unique_id": unique_id,
+                    "diffs": {},
+                    "status": SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                    "event": "No changes to apply",
+                },
+            )
+        self.job.flush_sync_log()
+        self.job.lookup_objects.assert_called_once_with("tenant", {"one", "two", "three"})
+        self.assertEqual(
+            {"tenant one", "tenant two", "tenant three"},
+            set(SyncLogEntry.objects.values_list("object_repr", flat=True)),
+        )
+
+    def test_sync_log_flushed_on_failure(self):
+        """Test that buffered SyncLogEntry records are written when the job fails."""
+
+        def load_target_adapter():
+            self.job.sync_log(
+                action=SyncLogEntryActionChoices.ACTION_CREATE,
+                status=SyncLogEntryStatusChoices.STATUS_ERROR,
+            )
+            raise ValueError("Failure")
+
+        self.job.load_target_adapter = load_target_adapter
+        with self.assertRaises(ValueError):
+            self.job.run(dryrun=True, memory_profiling=False)
+        self.assertEqual(1, SyncLogEntry.objects.count())
+
+    def _log_policy_entries(self):
+        """Log one unchanged entry for each of 100 tenants, plus a created and a failed tenant."""
+        for index in range(100):
+            self.job.sync_log(
+                action=SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+                status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                object_repr=f"tenant {index}",
+            )
+        self.job.sync_log(
+            action=SyncLogEntryActionChoices.ACTION_CREATE,
+            status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+            object_repr="tenant created",
+        )
+        self.job.sync_log(
+            action=SyncLogEntryActionChoices.ACTION_UPDATE,
+            status=SyncLogEntryStatusChoices.STATUS_FAILURE,
+            object_repr="tenant failed",
+        )
+        self.job.flush_sync_log()
+
+    def assert_policy_totals(self):
+        """Assert that the annotated totals of the sync are correct regardless of the logging policy."""
+        sync = Sync.annotated_queryset().get(pk=self.job.sync.pk)
+        self.assertEqual(100, sync.num_unchanged)
+        self.assertEqual(1, sync.num_created)
+        self.assertEqual(1, sync.num_updated)
+        self.assertEqual(0, sync.num_deleted)
+        self.assertEqual(101, sync.num_succeeded)
+        self.assertEqual(1, sync.num_failed)
+        self.assertEqual(102, SyncLogEntry.objects.count() + sync.num_unlogged)
+
+    def test_sync_log_policy_changes_and_failures(self):
+        """Test that only changes and failures are recorded with the changes-and-failures policy."""
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.job.sync_log_policy = SyncLogPolicyChoices.POLICY_CHANGES_AND_FAILURES
+        self._log_policy_entries()
+        self.assertEqual(
+            {"tenant created", "tenant failed"},
+            set(SyncLogEntry.objects.values_list("object_repr", flat=True)),
+        )
+        self.assert_policy_totals()
+
+    def test_sync_log_policy_sample_unchanged(self):
+        """Test that a deterministic sample of unchanged entries is recorded with the sample-unchanged policy."""
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.job.sync_log_policy = SyncLogPolicyChoices.POLICY_SAMPLE_UNCHANGED
+        self.job.sync_log_sample_percentage = 50
+        self._log_policy_entries()
+        num_sampled = SyncLogEntry.objects.filter(action=SyncLogEntryActionChoices.ACTION_NO_CHANGE).count()
+        self.assertGreater(num_sampled, 0)
+        self.assertLess(num_sampled, 100)
+        self.assert_policy_totals()
+
+    def test_sync_log_policy_summary_only(self):
+        """Test that only counters are kept with the summary-only policy."""
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.job.sync_log_policy = SyncLogPolicyChoices.POLICY_SUMMARY_ONLY
+        self._log_policy_entries()
+        self.assertEqual(0, SyncLogEntry.objects.count())
+        self.assert_policy_totals()
+
     def test_as_form(self):
         """Test the as_form() method."""
         form = self.job.as_form()
@@ -93,25 +260,326 @@ class BaseJobTestCase(TransactionTestCase):
         self.assertTrue(self.job.dryrun)
         self.assertEqual(self.job.job_result, self.job.sync.job_result)
 
+    def test_run_query_statistics(self):
+        """Test that the database queries of each phase are recorded on the Sync."""
+        self.job.load_target_adapter = lambda *x, **y: [list(Tenant.objects.filter(name=name)) for name in ("a", "b")]
+        self.job.run(dryrun=True, memory_profiling=False)
+        query_statistics = Sync.objects.get(pk=self.job.sync.pk).query_statistics
+        self.assertEqual({"source_load", "target_load", "diff"}, set(query_statistics))
+        self.assertEqual(0, query_statistics["source_load"]["count"])
+        self.assertEqual(2, query_statistics["target_load"]["count"])
+        self.assertEqual(2, query_statistics["target_load"]["top_statements"][0]["count"])
+
+    def test_run_memory_profiling(self):
+        """Test that memory profiling stores the top allocation sites per phase on the Sync."""
+        self.job.load_target_adapter = lambda *x, **y: setattr(self.job, "target_adapter", ["x" * 1000] * 1000)
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.assertIsNone(self.job.sync.memory_statistics)
+
+        self.job.run(dryrun=True, memory_profiling=True)
+        memory_statistics = Sync.objects.get(pk=self.job.sync.pk).memory_statistics
+        self.assertEqual({"source_load", "target_load", "diff"}, set(memory_statistics))
+        self.assertNotIn("compared_to_previous", memory_statistics["source_load"])
+        self.assertIn("compared_to_previous", memory_statistics["target_load"])
+        self.assertLessEqual(len(memory_statistics["target_load"]["top_allocations"]), self.job.profiling_top_n)
+
+    @override_settings(MEDIA_ROOT=tempfile.gettempdir())
+    def test_run_cpu_profiling(self):
+        """Test that CPU profiling stores the top functions per phase and a pstats file on the Sync."""
+        self.job.run(dryrun=True, memory_profiling=False, cpu_profiling=True)
+        sync = Sync.objects.get(pk=self.job.sync.pk)
+        self.assertEqual({"source_load", "target_load", "diff"}, set(sync.cpu_statistics))
+        self.assertIn("top_functions", sync.cpu_statistics["diff"])
+        with tempfile.NamedTemporaryFile(suffix=".pstats") as pstats_file:
+            with sync.cpu_profile.open("rb") as cpu_profile:
+                pstats_file.write(cpu_profile.read())
+            pstats_file.flush()
+            self.assertTrue(pstats.Stats(pstats_file.name).total_calls)
+
+    def _load_snapshot_source_adapter(self):
+        """Load a source adapter with a single tenant."""
+        self.job.source_adapter = SnapshotAdapter()
+        self.job.source_adapter.add(SnapshotTenant(name="Tenant A", description="Loaded"))
+
+    @override_settings(MEDIA_ROOT=tempfile.gettempdir())
+    def test_source_snapshot(self):
+        """Test that a later run restores the source adapter from the snapshot of a previous run."""
+        self.job.source_snapshot_ttl = timedelta(hours=1)
+        self.job.create_source_adapter = SnapshotAdapter
+        self.job.load_source_adapter = Mock(side_effect=self._load_snapshot_source_adapter)
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.assertTrue(Sync.objects.get(pk=self.job.sync.pk).source_snapshot)
+        loaded = self.job.source_adapter.dict()
+
+        self.job.run(dryrun=False, memory_profiling=False)
+        self.job.load_source_adapter.assert_called_once()
+        self.assertEqual(loaded, self.job.source_adapter.dict())
+
+        self.job.source_checksum = lambda: "changed"
+        self.job.run(dryrun=False, memory_profiling=False)
+        self.assertEqual(2, self.job.load_source_adapter.call_count)
+
+    def test_run_shards(self):
+        """Test that a job with a shard key enqueues a child job per shard after syncing the shared data."""
+        self.job.shard_key = "location"
+        self.job.get_shards = lambda: ["Location A", "Location B"]
+        with patch("nautobot_ssot.jobs.base.JobResult.enqueue_job") as enqueue_job:
+            self.job.run(dryrun=True, memory_profiling=False)
+        self.assertIsNone(self.job.shard)
+        self.assertEqual(2, enqueue_job.call_count)
+        self.assertEqual({"Location A", "Location B"}, {call.kwargs["shard"] for call in enqueue_job.call_args_list})
+        self.assertEqual({str(self.job.sync.pk)}, {call.kwargs["parent_sync"] for call in enqueue_job.call_args_list})
+
+    def test_run_shard(self):
+        """Test that a shard's results are merged into the parent Sync."""
+        self.job.run(dryrun=True, memory_profiling=False)
+        parent_sync = self.job.sync
+        self.job.load_source_adapter = lambda: self.job.sync_log(
+            action=SyncLogEntryActionChoices.ACTION_CREATE, status=SyncLogEntryStatusChoices.STATUS_SUCCESS
+        )
+        self.job.run(dryrun=True, memory_profiling=False, shard="Location A", parent_sync=str(parent_sync.pk))
+        self.assertEqual("Location A", self.job.shard)
+        self.assertEqual(parent_sync, self.job.sync.parent)
+        self.assertEqual(1, SyncLogEntry.objects.filter(sync=parent_sync).count())
+
+    def test_run_shard_failure(self):
+        """Test that the partial results of a failed shard are merged into the parent Sync, which records the failure."""
+        self.job.shard_key = "location"
+        self.job.get_shards = lambda: ["Location A", "Location B"]
+        with patch("nautobot_ssot.jobs.base.JobResult.enqueue_job"):
+            self.job.run(dryrun=True, memory_profiling=False)
+        parent_sync = self.job.sync
+        self.assertEqual(
+            {"Location A": JobResultStatusChoices.STATUS_PENDING, "Location B": JobResultStatusChoices.STATUS_PENDING},
+            Sync.objects.get(pk=parent_sync.pk).shard_status,
+        )
+
+        def load_source_adapter():
+            self.job.sync_log(
+                action=SyncLogEntryActionChoices.ACTION_CREATE, status=SyncLogEntryStatusChoices.STATUS_SUCCESS
+            )
+            raise ValueError("Failure")
+
+        self.job.load_source_adapter = load_source_adapter
+        with self.assertRaises(ValueError):
+            self.job.run(dryrun=True, memory_profiling=False, shard="Location A", parent_sync=str(parent_sync.pk))
+
+        parent_sync.refresh_from_db()
+        self.assertEqual(
+            {"Location A": JobResultStatusChoices.STATUS_FAILURE, "Location B": JobResultStatusChoices.STATUS_PENDING},
+            parent_sync.shard_status,
+        )
+        self.assertEqual(1, parent_sync.num_created)
+        self.assertEqual(1, SyncLogEntry.objects.filter(sync=parent_sync).count())
+
+    def test_run_parallel_load(self):
+        """Test that the adapter that isn't Nautobot is loaded in a worker thread with parallel_load."""
+        load_threads = {}
+        self.job.load_source_adapter = lambda: load_threads.update(source=threading.get_ident())
+        self.job.load_target_adapter = lambda: load_threads.update(target=threading.get_ident())
+        self.job.parallel_load = True
+        self.job.run(dryrun=True, memory_profiling=False)
+        nautobot_side, remote_side = (
+            ("source", "target") if self.job.data_source == "Nautobot" else ("target", "source")
+        )
+        self.assertEqual(threading.get_ident(), load_threads[nautobot_side])
+        self.assertNotEqual(threading.get_ident(), load_threads[remote_side])
+        self.job.sync.refresh_from_db()
+        self.assertIsNotNone(self.job.sync.source_load_time)
+        self.assertIsNotNone(self.job.sync.target_load_time)
+        self.assertIsNotNone(self.job.sync.diff_time)
+
+    def test_run_delta_sync(self):
+        """Test that a delta sync loads data changed since the watermark of the last completed sync."""
+        self.job.run(dryrun=False, memory_profiling=False)
+        self.job.sync.refresh_from_db()
+        self.assertEqual(self.job.sync.start_time, self.job.sync.watermark)
+        watermark = self.job.sync.watermark
+
+        self.job.run(dryrun=True, memory_profiling=False, delta_sync=True)
+        self.assertEqual(watermark, self.job.delta_since)
+        self.assertTrue(self.job.diffsync_flags & DiffSyncFlags.SKIP_UNMATCHED_DST)
+        self.job.sync.refresh_from_db()
+        self.assertIsNone(self.job.sync.watermark)
+
+    def test_run_delta_sync_watermark_per_job(self):
+        """Test that a delta sync ignores the watermark of another job with the same data source and target."""
+        self.job.job_result.job_model = Job.objects.get(
+            module_name="nautobot_ssot.jobs.examples", job_class_name="ExampleDataSource"
+        )
+        self.job.job_result.save()
+        self.job.run(dryrun=False, memory_profiling=False)
+        self.job.sync.refresh_from_db()
+        watermark = self.job.sync.watermark
+        Sync.objects.create(
+            source=self.job.data_source,
+            target=self.job.data_target,
+            diff={},
+            watermark=watermark + timedelta(days=1),
+            job_result=JobResult.objects.create(
+                name="other job",
+                task_name="other job",
+                worker="default",
+                job_model=Job.objects.get(
+                    module_name="nautobot_ssot.jobs.examples", job_class_name="ExampleDataTarget"
+                ),
+            ),
+        )
+
+        self.job.run(dryrun=True, memory_profiling=False, delta_sync=True)
+        self.assertEqual(watermark, self.job.delta_since)
+
+    def test_run_watermark_not_advanced_on_failure(self):
+        """Test that a sync with failed operations doesn't advance the watermark, so that these are retried."""
+        self.job.load_source_adapter = lambda: self.job.sync_log(
+            action=SyncLogEntryActionChoices.ACTION_UPDATE, status=SyncLogEntryStatusChoices.STATUS_FAILURE
+        )
+        self.job.run(dryrun=False, memory_profiling=False)
+        self.job.sync.refresh_from_db()
+        self.assertEqual(1, self.job.sync.num_failed)
+        self.assertIsNone(self.job.sync.watermark)
+
+    def test_get_delta_identifiers(self):
+        """Test that the identifiers of the objects loaded by the source adapter are reported as changed."""
+        self.job.source_adapter = Mock()
+        self.job.source_adapter.get_all.return_value = [Mock(**{"get_identifiers.return_value": {"name": "one"}})]
+        expected = [] if self.job.data_source == "Nautobot" else [{"name": "one"}]
+        self.assertEqual(expected, self.job.get_delta_identifiers("tenant"))
+
+    def test_record_cache_statistics(self):
+        """Test the record_cache_statistics() method."""
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.assertIsNone(self.job.sync.cache_statistics)
+        cache_statistics = {"tenancy.tenant": {"hits": 2, "misses": 1, "evictions": 0, "size": 2}}
+        self.job.target_adapter = Mock()
+        self.job.target_adapter.get_cache_statistics.return_value = cache_statistics
+        self.job.record_cache_statistics()
+        self.job.sync.refresh_from_db()
+        self.assertEqual({"target": cache_statistics}, self.job.sync.cache_statistics)
+
+    def test_execute_sync_batched_transactions(self):
+        """Test execute_sync() commits the operations in batches of sync_transaction_batch_size."""
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.job.sync_transaction_batch_size = 2
+        self.job.diffsync_flags = DiffSyncFlags.CONTINUE_ON_FAILURE
+        self.job.source_adapter = BatchAdapter()
+        for name in ("tenant 1", "tenant 2", "fail", "tenant 3", "tenant 4"):
+            self.job.source_adapter.add(BatchTenant(name=name))
+        self.job.target_adapter = BatchAdapter()
+        self.job.execute_sync()
+
+        statistics = self.job.sync.transaction_statistics
+        self.assertEqual(2, statistics["batch_size"])
+        self.assertEqual(3, statistics["commits"])
+        self.assertEqual(5, statistics["operations"])
+        self.assertEqual(1, statistics["rolled_back_operations"])
+        self.assertEqual(5, self.job.model_statistics.as_dict()["tenant"]["create"]["count"])
+        # The failed operation is rolled back on its own, the rest of its batch is committed.
+        self.assertEqual(
+            {"tenant 1", "tenant 2", "tenant 3", "tenant 4"},
+            set(Tenant.objects.filter(description="").values_list("name", flat=True)),
+        )
+
+    def test_execute_sync_batched_transactions_database_error(self):
+        """Test that a database error caught by an operation doesn't prevent the rest of its batch from committing."""
+        Tenant.objects.create(name="tenant 2", description="Existing")
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.job.sync_transaction_batch_size = 3
+        self.job.diffsync_flags = DiffSyncFlags.CONTINUE_ON_FAILURE
+        self.job.source_adapter = BatchAdapter()
+        for name in ("tenant 1", "tenant 2", "tenant 3"):
+            self.job.source_adapter.add(BatchTenant(name=name))
+        self.job.target_adapter = BatchAdapter()
+        self.job.execute_sync()
+
+        self.assertEqual(1, self.job.sync.transaction_statistics["commits"])
+        self.assertEqual(1, self.job.sync.transaction_statistics["rolled_back_operations"])
+        self.assertEqual(
+            {"tenant 1", "tenant 3"}, set(Tenant.objects.filter(description="").values_list("name", flat=True))
+        )
+
+    def test_execute_sync_batched_transactions_sync_log(self):
+        """Test that log entries aren't flushed within a batch, where a rollback would discard them."""
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.job.sync_transaction_batch_size = 2
+        self.job.sync_log_batch_size = 1
+        self.job.diffsync_flags = DiffSyncFlags.CONTINUE_ON_FAILURE
+        self.job.source_adapter = BatchAdapter()
+        for name in ("tenant 1", "fail", "tenant 2"):
+            self.job.source_adapter.add(BatchTenant(name=name))
+        self.job.target_adapter = BatchAdapter()
+        self.job.execute_sync()
+
+        # The entry of the failed operation reaches the batch size, but is only flushed once its batch is committed.
+        self.assertEqual(3, SyncLogEntry.objects.filter(sync=self.job.sync).count())
+        self.assertEqual(
+            1,
+            SyncLogEntry.objects.filter(sync=self.job.sync)
+            .exclude(status=SyncLogEntryStatusChoices.STATUS_SUCCESS)
+            .count(),
+        )
+
+        # Without `CONTINUE_ON_FAILURE` the last batch is rolled back, the entries of its operations are kept.
+        self.job.diffsync_flags = DiffSyncFlags.NONE
+        self.job.source_adapter = BatchAdapter()
+        for name in ("tenant 3", "tenant 4", "tenant 5", "fail"):
+            self.job.source_adapter.add(BatchTenant(name=name))
+        with self.assertRaises(ObjectNotCreated):
+            self.job.execute_sync()
+        self.job.flush_sync_log()
+        self.assertTrue(SyncLogEntry.objects.filter(sync=self.job.sync, object_repr="tenant tenant 5").exists())
+
+    def test_execute_sync_model_statistics(self):
+        """Test execute_sync() records the count and duration of the operations per model."""
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.job.source_adapter = SnapshotAdapter()
+        self.job.source_adapter.add(SnapshotTenant(name="Tenant A", description="Changed"))
+        self.job.source_adapter.add(SnapshotTenant(name="Tenant B"))
+        self.job.target_adapter = SnapshotAdapter()
+        self.job.target_adapter.add(SnapshotTenant(name="Tenant A"))
+        self.job.target_adapter.add(SnapshotTenant(name="Tenant C"))
+        self.job.execute_sync()
+
+        model_statistics = self.job.model_statistics.as_dict()
+        self.assertEqual({"create", "update", "delete"}, set(model_statistics["tenant"]))
+        for operation in ("create", "update", "delete"):
+            self.assertEqual(1, model_statistics["tenant"][operation]["count"])
+        self.assertIsNone(self.job.sync.transaction_statistics)
+
+    def test_execute_sync_batched_transactions_failure(self):
+        """Test execute_sync() rolls back only the current batch when an operation fails."""
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.job.sync_transaction_batch_size = 2
+        self.job.source_adapter = BatchAdapter()
+        for name in ("tenant 1", "tenant 2", "tenant 3", "fail"):
+            self.job.source_adapter.add(BatchTenant(name=name))
+        self.job.target_adapter = BatchAdapter()
+        with self.assertRaises(ObjectNotCreated):
+            self.job.execute_sync()
+
+        self.assertEqual(1, self.job.sync.transaction_statistics["commits"])
+        self.assertEqual(
+            {"tenant 1", "tenant 2"}, set(Tenant.objects.filter(description="").values_list("name", flat=True))
+        )
+
     def test_calculate_diff(self):
         """Test calculate_diff() method."""
         self.job.sync = Mock()
         self.job.source_adapter = Mock()
         self.job.target_adapter = Mock()
-        self.job.source_adapter.diff_to().dict.return_value = {}
         self.job.calculate_diff()
         self.job.source_adapter.diff_to.assert_called()
-        self.job.sync.save.assert_has_calls([call(), call()])
+        self.job.sync.save.assert_called_once_with()
+        self.job.sync.store_diff.assert_called_once_with(self.job.diff)
 
     def test_calculate_diff_fail_diff_save_too_large(self):
         """Test calculate_diff() method logs failure."""
         self.job.sync = Mock()
-        self.job.sync.save.side_effect = [None, OperationalError("Fail")]
+        self.job.sync.store_diff.side_effect = OperationalError("Fail")
         self.job.source_adapter = Mock()
         self.job.target_adapter = Mock()
         self.job.logger.info = Mock()
         self.job.logger.warning = Mock()
-        self.job.source_adapter.diff_to().dict.return_value = {}
         self.job.calculate_diff()
         self.job.logger.warning.assert_any_call(
             "Unable to save JSON diff to the database; likely the diff is too large."
@@ -120,12 +588,11 @@ class BaseJobTestCase(TransactionTestCase):
     def test_calculate_diff_fail_diff_save_generic(self):
         """Test calculate_diff() method logs failure."""
         self.job.sync = Mock()
-        self.job.sync.save.side_effect = [None, IntegrityError("Fail")]
+        self.job.sync.store_diff.side_effect = IntegrityError("Fail")
         self.job.source_adapter = Mock()
         self.job.target_adapter = Mock()
         self.job.logger.info = Mock()
         self.job.logger.warning = Mock()
-        self.job.source_adapter.diff_to().dict.return_value = {}
         with self.assertRaises(IntegrityError):
             self.job.calculate_diff()
 
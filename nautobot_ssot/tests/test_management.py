@@ -1,6 +1,10 @@
 """Test cases for custom Django MGMT commands."""
 
+import json
+import os
+import tempfile
 from io import StringIO
+from unittest import skipIf
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.management import call_command
@@ -15,6 +19,9 @@ from nautobot.dcim.models import (
 )
 from nautobot.extras.models import CustomField, Role, Status
 
+from nautobot_ssot import export
+from nautobot_ssot.models import Sync
+
 
 class TestElongateInterfaceNames(TestCase):
     """Unittests for elongate_interface_names command."""
@@ -187,3 +194,98 @@ class TestElongateInterfaceNames(TestCase):
             stdout=out,
         )
         self.assertEqual(out.getvalue().strip(), "Updating ssot_test_1.ge2 >> GigabitEthernet2")
+
+
+class TestBackfillSyncCounters(TestCase):
+    """Unittests for backfill_sync_counters command."""
+
+    def setUp(self):
+        """Per-test setup."""
+        self.sync = Sync.objects.create(source="Some other system", target="Nautobot", start_time=None, diff={})
+        self.sync.logs.create(action="create", status="success")
+        self.sync.logs.create(action="delete", status="error")
+        self.counted_sync = Sync.objects.create(
+            source="Some other system", target="Nautobot", start_time=None, diff={}, num_created=3
+        )
+
+    def test_backfill(self):
+        out = StringIO()
+        call_command("backfill_sync_counters", "--no-color", "--skip-checks", stdout=out)
+        self.assertEqual(out.getvalue().strip(), "Backfilled the result counters of 1 syncs.")
+        self.sync.refresh_from_db()
+        self.assertEqual(1, self.sync.num_created)
+        self.assertEqual(1, self.sync.num_deleted)
+        self.assertEqual(1, self.sync.num_succeeded)
+        self.assertEqual(1, self.sync.num_errored)
+        self.counted_sync.refresh_from_db()
+        self.assertEqual(3, self.counted_sync.num_created)
+
+    def test_backfill_all(self):
+        out = StringIO()
+        call_command("backfill_sync_counters", "--no-color", "--skip-checks", "--all", stdout=out)
+        self.assertEqual(out.getvalue().strip(), "Backfilled the result counters of 2 syncs.")
+        self.counted_sync.refresh_from_db()
+        self.assertEqual(0, self.counted_sync.num_created)
+
+
+class TestExportSync(TestCase):
+    """Unittests for export_sync command."""
+
+    def setUp(self):
+        """Per-test setup."""
+        self.sync = Sync.objects.create(
+            source="Some other system",
+            target="Nautobot",
+            start_time=None,
+            diff={"tenant": {"Tenant A": {"+": {"description": "new"}}, "Tenant B": {"-": {"description": "old"}}}},
+        )
+        self.sync.logs.create(action="create", status="success", message="Created Tenant A")
+        self.sync.logs.create(
+            action="delete",
+            status="error",
+            message="Failed to delete Tenant B",
+            synced_object_type=ContentType.objects.get(app_label="tenancy", model="tenant"),
+        )
+        self.output_dir = tempfile.mkdtemp()
+
+    def test_export_jsonl(self):
+        out = StringIO()
+        call_command(
+            "export_sync", str(self.sync.pk), "--output-dir", self.output_dir, "--no-color", "--skip-checks", stdout=out
+        )
+        diff_path = os.path.join(self.output_dir, f"{self.sync.pk}_diff.jsonl")
+        logs_path = os.path.join(self.output_dir, f"{self.sync.pk}_logs.jsonl")
+        self.assertEqual(
+            out.getvalue().strip().splitlines(), [f"Exported 2 rows to {diff_path}", f"Exported 2 rows to {logs_path}"]
+        )
+        with open(diff_path, encoding="utf-8") as file:
+            self.assertEqual(
+                [
+                    {"model_type": "tenant", "name": "Tenant A", "diff": {"+": {"description": "new"}}},
+                    {"model_type": "tenant", "name": "Tenant B", "diff": {"-": {"description": "old"}}},
+                ],
+                [json.loads(line) for line in file],
+            )
+        with open(logs_path, encoding="utf-8") as file:
+            logs = [json.loads(line) for line in file]
+        self.assertEqual(["create", "delete"], [log["action"] for log in logs])
+        self.assertEqual([None, "tenancy.tenant"], [log["synced_object_type"] for log in logs])
+
+    @skipIf(export.pyarrow is None, "pyarrow is not installed")
+    def test_export_parquet(self):
+        call_command(
+            "export_sync",
+            str(self.sync.pk),
+            "--format",
+            "parquet",
+            "--output-dir",
+            self.output_dir,
+            "--chunk-size",
+            "1",
+            "--no-color",
+            "--skip-checks",
+            stdout=StringIO(),
+        )
+        table = export.pyarrow.parquet.read_table(os.path.join(self.output_dir, f"{self.sync.pk}_logs.parquet"))
+        self.assertEqual(list(export.LOG_COLUMNS), table.column_names)
+        self.assertEqual(["Created Tenant A", "Failed to delete Tenant B"], table.column("message").to_pylist())
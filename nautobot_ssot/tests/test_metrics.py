@@ -0,0 +1,75 @@
+"""Unit tests for the Prometheus metrics of nautobot_ssot."""
+
+from datetime import timedelta
+
+from django.utils.timezone import now
+from nautobot.core.testing import TestCase
+from nautobot.extras.choices import JobResultStatusChoices
+from nautobot.extras.models import Job, JobResult
+
+from nautobot_ssot import metrics
+from nautobot_ssot.models import Sync
+
+
+class MetricsTestCase(TestCase):
+    """Test the collectors in nautobot_ssot.metrics."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create two Syncs of the example data source, the latest of which failed."""
+        cls.job = Job.objects.get(module_name="nautobot_ssot.jobs.examples", job_class_name="ExampleDataSource")
+        for index, status in enumerate((JobResultStatusChoices.STATUS_SUCCESS, JobResultStatusChoices.STATUS_FAILURE)):
+            job_result = JobResult.objects.create(
+                name=cls.job.name,
+                job_model=cls.job,
+                task_name="nautobot_ssot.jobs.examples.ExampleDataSource",
+                worker="default",
+                status=status,
+            )
+            Sync.objects.create(
+                source="Example Data Source",
+                target="Nautobot",
+                start_time=now() + timedelta(minutes=index),
+                source_load_time=timedelta(seconds=index),
+                dry_run=False,
+                diff={},
+                summary={"create": index},
+                job_result=job_result,
+            )
+
+    def setUp(self):
+        """Clear the cached metrics data."""
+        super().setUp()
+        metrics._metrics_data_cache["data"] = None  # pylint: disable=protected-access
+
+    def _collect(self):
+        """Collect all metrics by name and labels."""
+        return {
+            (metric.name, tuple(sample.labels.values())): sample.value
+            for collector in metrics.metrics
+            for metric in collector()
+            for sample in metric.samples
+        }
+
+    def test_metrics(self):
+        """Test that the metrics are taken from the latest Sync of each job and the syncs per status."""
+        collected = self._collect()
+        job_name = ".".join(self.job.natural_key())
+        self.assertEqual(2, collected[("nautobot_ssot_sync_total", ("total_syncs",))])
+        self.assertEqual(1, collected[("nautobot_ssot_sync_total", ("success_syncs",))])
+        self.assertEqual(1, collected[("nautobot_ssot_sync_total", ("failure_syncs",))])
+        self.assertEqual(1, collected[("nautobot_ssot_operation_total", (job_name, "create"))])
+
+    def test_metrics_queries(self):
+        """Test that a scrape runs a fixed number of queries and later scrapes are served from the cache."""
+        with self.assertNumQueries(3):
+            self._collect()
+        with self.assertNumQueries(0):
+            self._collect()
+
+    def test_metrics_cache_expiry(self):
+        """Test that the data is queried again once the cache expired."""
+        metrics.get_metrics_data()
+        Sync.objects.all().delete()
+        metrics._metrics_data_cache["expires"] = 0  # pylint: disable=protected-access
+        self.assertEqual(0, metrics.get_metrics_data()["total_syncs"])
@@ -3,13 +3,18 @@
 import datetime
 import time
 import uuid
+from unittest import skipUnless
+from unittest.mock import patch
 
+from diffsync.diff import Diff, DiffElement
+from django.db import connection
+from django.db.utils import OperationalError
 from django.test import TestCase
 from django.utils.timezone import now
 from nautobot.extras.choices import JobResultStatusChoices
 from nautobot.extras.models import Job, JobResult
 
-from nautobot_ssot.models import Sync
+from nautobot_ssot.models import Sync, SyncDiffChunk, SyncLogEntry
 
 
 class SyncTestCase(TestCase):
@@ -101,3 +106,175 @@ class SyncTestCase(TestCase):
         self.source_sync.refresh_from_db()
         actual = self.source_sync.diff["uuid"]
         self.assertEqual(actual, expected)
+
+    def test_store_diff(self):
+        """Test that a diff is stored in one compressed chunk per model type and read back through `diff`."""
+        diff = Diff()
+        for obj_type, name in (("tenant", "Tenant A"), ("tenant", "Tenant B"), ("location", "Location A")):
+            element = DiffElement(obj_type=obj_type, name=name, keys={"name": name})
+            element.add_attrs(source={"description": "new"}, dest={"description": "old"})
+            diff.add(element)
+        unchanged = DiffElement(obj_type="tenant_group", name="Group A", keys={"name": "Group A"})
+        unchanged.add_attrs(source={"description": "same"}, dest={"description": "same"})
+        diff.add(unchanged)
+
+        self.source_sync.store_diff(diff)
+
+        chunks = SyncDiffChunk.objects.filter(sync=self.source_sync)
+        self.assertEqual(
+            [("tenant", 2), ("location", 1)], list(chunks.order_by("index").values_list("model_type", "num_elements"))
+        )
+        self.assertEqual({}, Sync.objects.get(pk=self.source_sync.pk).diff)
+        self.assertEqual(diff.dict(), Sync.objects.get(pk=self.source_sync.pk).get_diff())
+        self.assertEqual({"tenant": 2, "location": 1}, self.source_sync.get_diff_model_counts())
+        self.assertEqual(diff.dict()["location"], self.source_sync.get_model_diff("location"))
+        self.assertEqual({}, self.source_sync.get_model_diff("tenant_group"))
+
+    def test_store_diff_chunk_size(self):
+        """Test that the diff elements of a model type are split up into chunks and paged through chunk by chunk."""
+        diff = Diff()
+        for index in range(5):
+            element = DiffElement(obj_type="tenant", name=f"Tenant {index}", keys={"name": f"Tenant {index}"})
+            element.add_attrs(source={"description": "new"}, dest={"description": "old"})
+            diff.add(element)
+
+        self.source_sync.store_diff(diff, chunk_size=2)
+
+        self.assertEqual(
+            [("tenant", 0, 2), ("tenant", 2, 2), ("tenant", 4, 1)],
+            list(self.source_sync.diff_chunks.order_by("index").values_list("model_type", "offset", "num_elements")),
+        )
+        self.assertEqual({"tenant": 5}, self.source_sync.get_diff_model_counts())
+        self.assertEqual(
+            ["Tenant 1", "Tenant 2", "Tenant 3"],
+            [name for name, _ in self.source_sync.iter_model_diff("tenant", offset=1, limit=3)],
+        )
+        self.assertEqual(["Tenant 4"], [name for name, _ in self.source_sync.iter_model_diff("tenant", offset=4)])
+        self.assertEqual(diff.dict(), Sync.objects.get(pk=self.source_sync.pk).get_diff())
+
+    def test_store_diff_failure(self):
+        """Test that no chunks are left behind when storing a diff fails halfway."""
+        diff = Diff()
+        for obj_type in ("tenant", "location"):
+            element = DiffElement(obj_type=obj_type, name="A", keys={"name": "A"})
+            element.add_attrs(source={"description": "new"}, dest={"description": "old"})
+            diff.add(element)
+
+        with patch.object(SyncDiffChunk, "compress", side_effect=[b"", OperationalError("Too large")]):
+            with self.assertRaises(OperationalError):
+                self.source_sync.store_diff(diff)
+        self.assertFalse(SyncDiffChunk.objects.filter(sync=self.source_sync).exists())
+
+    def test_inline_diff(self):
+        """Test that a diff set directly is stored inline rather than in chunks."""
+        self.source_sync.diff = {"tenant": {"Tenant A": {"+": {"description": "new"}}}}
+        self.source_sync.validated_save()
+        self.assertFalse(SyncDiffChunk.objects.filter(sync=self.source_sync).exists())
+        self.assertEqual(
+            {"tenant": {"Tenant A": {"+": {"description": "new"}}}}, Sync.objects.get(pk=self.source_sync.pk).diff
+        )
+
+    def test_count_results(self):
+        """Test that the results are counted from the log entries and the counters of entries that weren't logged."""
+        self.source_sync.logs.create(action="create", status="success")
+        self.source_sync.logs.create(action="update", status="failure")
+        self.source_sync.log_counters = {"actions": {"no-change": 5}, "statuses": {"success": 5}, "models": {}}
+        self.assertEqual(
+            {
+                "num_unchanged": 5,
+                "num_created": 1,
+                "num_updated": 1,
+                "num_deleted": 0,
+                "num_succeeded": 6,
+                "num_failed": 1,
+                "num_errored": 0,
+            },
+            self.source_sync.count_results(),
+        )
+
+    def test_merge_shard(self):
+        """Test that the results of a shard are merged into its parent Sync."""
+        self.source_sync.source_load_time = datetime.timedelta(seconds=1)
+        self.source_sync.summary = {"create": 1, "update": 0}
+        self.source_sync.save()
+        shard_sync = Sync.objects.create(
+            source="Some other system",
+            target="Nautobot",
+            dry_run=False,
+            start_time=None,
+            diff={},
+            parent=self.source_sync,
+            shard="Location A",
+            source_load_time=datetime.timedelta(seconds=2),
+            summary={"create": 2, "update": 1},
+            num_created=1,
+            num_succeeded=1,
+        )
+        shard_sync.diff_chunks.create(
+            model_type="tenant", index=0, num_elements=1, data=SyncDiffChunk.compress({"Tenant A": {}})
+        )
+        shard_sync.logs.create(action="create", status="success")
+
+        self.source_sync.merge_shard(shard_sync)
+
+        self.source_sync.refresh_from_db()
+        self.assertEqual(datetime.timedelta(seconds=3), self.source_sync.source_load_time)
+        self.assertEqual({"create": 3, "update": 1}, self.source_sync.summary)
+        self.assertEqual({"tenant": {"Tenant A": {}}}, self.source_sync.get_diff())
+        self.assertEqual(1, self.source_sync.logs.count())
+        self.assertEqual(1, self.source_sync.num_created)
+        self.assertEqual(1, self.source_sync.num_succeeded)
+        self.assertEqual({"Location A": JobResultStatusChoices.STATUS_SUCCESS}, self.source_sync.shard_status)
+
+
+@skipUnless(connection.vendor == "postgresql", "The query plans are only checked on PostgreSQL")
+class SyncLogEntryQueryPlanTestCase(TestCase):
+    """Tests that the queries of the Sync log views use the indexes of SyncLogEntry.
+
+    See `development/benchmark_log_queries.py` for the timings of these queries on a table of millions of rows.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a few Syncs with a thousand log entries each."""
+        cls.syncs = [
+            Sync.objects.create(source="Some other system", target="Nautobot", start_time=None, diff={})
+            for _ in range(5)
+        ]
+        actions = ("no-change", "create", "update", "delete")
+        statuses = ("success", "failure", "error")
+        SyncLogEntry.objects.bulk_create(
+            SyncLogEntry(sync=sync, action=actions[index % 4], status=statuses[index % 3], message="")
+            for sync in cls.syncs
+            for index in range(1000)
+        )
+
+    def assertUsesIndex(self, queryset, index_name):  # pylint: disable=invalid-name
+        """Assert that the query plan of `queryset` uses the index `index_name`.
+
+        Sequential scans are disabled, as the planner rightly prefers these for a table as small as this one.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE nautobot_ssot_synclogentry")
+            cursor.execute("SET enable_seqscan = off")
+            try:
+                plan = queryset.explain()
+            finally:
+                cursor.execute("RESET enable_seqscan")
+        self.assertIn(index_name, plan)
+        self.assertNotIn("Sort", plan)
+
+    def test_logs_of_sync(self):
+        """The log entries of a Sync, as listed by the Sync Logs tab."""
+        queryset = SyncLogEntry.objects.filter(sync=self.syncs[0]).order_by("-timestamp")[:50]
+        self.assertUsesIndex(queryset, "ssot_log_sync_timestamp_idx")
+
+    def test_logs_of_sync_by_action(self):
+        """The log entries of a Sync filtered by action."""
+        queryset = SyncLogEntry.objects.filter(sync=self.syncs[0], action="create").order_by("-timestamp")[:50]
+        self.assertUsesIndex(queryset, "ssot_log_sync_action_idx")
+
+    def test_logs_of_sync_by_status(self):
+        """The log entries of a Sync filtered by status."""
+        queryset = SyncLogEntry.objects.filter(sync=self.syncs[0], status="failure").order_by("-timestamp")[:50]
+        self.assertUsesIndex(queryset, "ssot_log_sync_status_idx")
@@ -0,0 +1,128 @@
+"""Unit tests for the profiling instrumentation."""
+
+import tracemalloc
+from unittest.mock import Mock
+
+from diffsync import Adapter, DiffSyncModel
+from django.test import TestCase
+from nautobot.tenancy.models import Tenant
+
+from nautobot_ssot.profiling import (
+    ModelStatistics,
+    get_memory_statistics,
+    normalize_sql,
+    record_queries,
+    take_memory_snapshot,
+    timed_load,
+)
+
+
+class NormalizeSQLTestCase(TestCase):
+    """Test the normalize_sql function."""
+
+    def test_normalize_literals(self):
+        """Test that string and number literals are replaced."""
+        self.assertEqual(
+            "SELECT * FROM tenant WHERE name = ? AND id > ? LIMIT ?",
+            normalize_sql("SELECT * FROM tenant WHERE name = 'it''s'  AND id > 1.5\nLIMIT 21"),
+        )
+
+    def test_normalize_parameter_lists(self):
+        """Test that parameter lists of different lengths are grouped together."""
+        self.assertEqual(
+            normalize_sql("SELECT * FROM tenant WHERE id IN (%s, %s)"),
+            normalize_sql("SELECT * FROM tenant WHERE id IN (%s, %s, %s)"),
+        )
+
+
+class RecordQueriesTestCase(TestCase):
+    """Test the record_queries context manager."""
+
+    def test_record_queries(self):
+        """Test that queries are counted and grouped by their normalized statement."""
+        with record_queries() as queries:
+            Tenant.objects.filter(name__in=["a", "b"]).count()
+            Tenant.objects.filter(name__in=["a", "b", "c"]).count()
+            Tenant.objects.exists()
+        statistics = queries.get_statistics(top_n=1)
+        self.assertEqual(3, statistics["count"])
+        self.assertEqual(1, len(statistics["top_statements"]))
+        self.assertEqual(2, statistics["top_statements"][0]["count"])
+
+
+class MemoryStatisticsTestCase(TestCase):
+    """Test the get_memory_statistics function."""
+
+    def test_get_memory_statistics(self):
+        """Test that allocation sites are grouped by file:line and compared to the previous snapshot."""
+        tracemalloc.start()
+        try:
+            first = [str(index) * 10 for index in range(1000)]
+            previous_snapshot = take_memory_snapshot()
+            tracemalloc.clear_traces()
+            second = [bytes(100) for _ in range(1000)]
+            snapshot = take_memory_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        statistics = get_memory_statistics(snapshot, previous_snapshot, top_n=2)
+        self.assertEqual(2, len(statistics["top_allocations"]))
+        self.assertRegex(statistics["top_allocations"][0]["location"], r"test_profiling\.py:\d+$")
+        self.assertGreater(statistics["top_allocations"][0]["size"], 100 * len(second))
+        self.assertEqual(2, len(statistics["compared_to_previous"]))
+        self.assertNotIn("compared_to_previous", get_memory_statistics(previous_snapshot, top_n=2))
+        self.assertEqual(1000, len(first))
+
+
+class TimedTenant(DiffSyncModel):
+    """Tenant model for testing load timings."""
+
+    _modelname = "tenant"
+    _identifiers = ("name",)
+
+    name: str
+
+
+class TimedAdapter(Adapter):
+    """Adapter for testing load timings."""
+
+    tenant = TimedTenant
+    top_level = ("tenant",)
+
+    def __init__(self, *args, job=None, **kwargs):
+        """Initialize the adapter with the job collecting the statistics."""
+        super().__init__(*args, **kwargs)
+        self.job = job
+
+    @timed_load("tenant")
+    def load(self):
+        """Load two tenants."""
+        self.add(self.tenant(name="Tenant A"))
+        self.add(self.tenant(name="Tenant B"))
+
+
+class ModelStatisticsTestCase(TestCase):
+    """Test the ModelStatistics class and timed_load decorator."""
+
+    def test_record(self):
+        """Test that counts and durations are summed up per model and operation."""
+        model_statistics = ModelStatistics()
+        model_statistics.record("tenant", "create", 0.5)
+        model_statistics.record("tenant", "create", 0.25)
+        model_statistics.record("tenant", "load", 1.0, count=10)
+        self.assertEqual(
+            {"tenant": {"create": {"count": 2, "time": 0.75}, "load": {"count": 10, "time": 1.0}}},
+            model_statistics.as_dict(),
+        )
+
+    def test_timed_load(self):
+        """Test that the objects added by a timed loader are counted in the statistics of the job."""
+        job = Mock(model_statistics=ModelStatistics())
+        TimedAdapter(job=job).load()
+        self.assertEqual(2, job.model_statistics.as_dict()["tenant"]["load"]["count"])
+
+    def test_timed_load_without_job(self):
+        """Test that a timed loader still works without a job collecting statistics."""
+        adapter = TimedAdapter()
+        adapter.load()
+        self.assertEqual(2, adapter.count("tenant"))
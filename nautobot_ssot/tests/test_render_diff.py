@@ -1,8 +1,9 @@
 """Test Render_diff templatetags."""
 
+import copy
 import unittest
 
-from nautobot_ssot.templatetags.render_diff import render_diff
+from nautobot_ssot.templatetags.render_diff import render_diff, render_diff_elements
 
 test_params = [
     (
@@ -64,3 +65,29 @@ class TestRenderDiff(unittest.TestCase):
         for input_dict, rendered_diff in test_params:
             with self.subTest():
                 self.assertEqual(render_diff(input_dict), rendered_diff)
+
+
+class TestRenderDiffElements(unittest.TestCase):
+    """Tests for render_diff_elements function."""
+
+    def test_diff_is_not_modified(self):
+        """Testing that rendering leaves the diff as is, so that it can be rendered again."""
+        diff = {
+            "region": {
+                "Catalonia": {
+                    "+": {"parent_name": None},
+                    "-": {"parent_name": "Europe"},
+                    "site": {"Barcelona": {"+": {"description": ""}}},
+                },
+            }
+        }
+        original_diff = copy.deepcopy(diff)
+        parts = []
+        render_diff_elements(diff["region"], parts)
+        self.assertEqual(diff, original_diff)
+        self.assertEqual(
+            "".join(parts),
+            '<li class="diff-changed">Catalonia<ul><li class="diff-added">parent_name: None</li>'
+            '<li class="diff-subtracted">parent_name: Europe</li><li>site<ul><li class="diff-added">Barcelona<ul>'
+            '<li class="diff-added">description: </li></ul></li></ul></li></ul></li>',
+        )
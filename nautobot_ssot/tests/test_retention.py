@@ -0,0 +1,86 @@
+"""Unit tests for the retention of the Sync history."""
+
+from datetime import timedelta
+
+from django.utils.timezone import now
+from nautobot.core.testing import TestCase
+from nautobot.extras.models import Job
+
+from nautobot_ssot.models import Sync, SyncDiffChunk, SyncLogEntry
+from nautobot_ssot.retention import get_expired_syncs, get_retention_policy, purge_syncs
+
+
+class RetentionTestCase(TestCase):
+    """Test the functions in nautobot_ssot.retention."""
+
+    def setUp(self):
+        """Create a Sync per day of the last ten days, every third of which had failures."""
+        self.current_time = now()
+        self.syncs = []
+        for days in range(10):
+            sync = Sync.objects.create(
+                source="Example Data Source",
+                target="Nautobot",
+                start_time=self.current_time - timedelta(days=days, hours=1),
+                diff={},
+                num_failed=int(days % 3 == 0),
+            )
+            for _ in range(3):
+                sync.logs.create(action="create", status="success")
+            self.syncs.append(sync)
+
+    def test_get_expired_syncs(self):
+        """Test that Syncs are kept if any of the rules of the policy keeps them."""
+        expired = get_expired_syncs(
+            Sync.objects.all(), keep_last=2, keep_days=4, keep_failed_days=7, current_time=self.current_time
+        )
+        # Syncs 0-3 are less than 4 days old, 6 had failures and is less than 7 days old.
+        self.assertEqual({sync.pk for sync in self.syncs[4:6] + self.syncs[7:]}, set(expired))
+
+        expired = get_expired_syncs(
+            Sync.objects.all(), keep_last=5, keep_days=0, keep_failed_days=0, current_time=self.current_time
+        )
+        self.assertEqual({sync.pk for sync in self.syncs[5:]}, set(expired))
+
+    def test_get_expired_syncs_skips_shards(self):
+        """Test that shards aren't expired on their own."""
+        Sync.objects.filter(pk=self.syncs[9].pk).update(parent=self.syncs[0])
+        expired = get_expired_syncs(
+            Sync.objects.all(), keep_last=0, keep_days=0, keep_failed_days=0, current_time=self.current_time
+        )
+        self.assertNotIn(self.syncs[9].pk, expired)
+
+    def test_get_retention_policy(self):
+        """Test that the settings of the retention policy of a Job are overridden from the `sync_retention` setting."""
+        job = Job.objects.get(module_name="nautobot_ssot.jobs.examples", job_class_name="ExampleDataSource")
+        overrides = {job.class_path: {"keep_last": 5, "unknown": 6}}
+        self.assertEqual(
+            {"keep_last": 5, "keep_days": 2, "keep_failed_days": 3}, get_retention_policy(job, 1, 2, 3, overrides)
+        )
+        self.assertEqual(
+            {"keep_last": 1, "keep_days": 2, "keep_failed_days": 3}, get_retention_policy(None, 1, 2, 3, overrides)
+        )
+
+    def test_purge_syncs(self):
+        """Test that Syncs are deleted along with their shards, log entries and diff chunks in chunks."""
+        Sync.objects.filter(pk=self.syncs[9].pk).update(parent=self.syncs[8])
+        SyncDiffChunk.objects.create(sync=self.syncs[8], model_type="tenant", index=0, num_elements=0, data=b"")
+
+        results = list(purge_syncs([sync.pk for sync in self.syncs[7:9]], chunk_size=2))
+
+        self.assertEqual(
+            [
+                ("nautobot_ssot.SyncLogEntry", 2),
+                ("nautobot_ssot.SyncLogEntry", 1),
+                ("nautobot_ssot.SyncLogEntry", 2),
+                ("nautobot_ssot.SyncLogEntry", 2),
+                ("nautobot_ssot.SyncLogEntry", 2),
+                ("nautobot_ssot.SyncDiffChunk", 1),
+                ("nautobot_ssot.Sync", 1),
+                ("nautobot_ssot.Sync", 2),
+            ],
+            [(result["model"], result["deleted"]) for result in results],
+        )
+        self.assertEqual(7, Sync.objects.count())
+        self.assertEqual(21, SyncLogEntry.objects.count())
+        self.assertFalse(SyncDiffChunk.objects.exists())
@@ -1,9 +1,12 @@
 """View test cases for nautobot_ssot."""
 
+import tempfile
 from datetime import datetime
 from unittest import skip
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.files.base import ContentFile
+from django.test import override_settings
 from django.urls import reverse
 from nautobot.apps.testing import ViewTestCases
 from nautobot.core.testing.utils import disable_warnings
@@ -106,6 +109,62 @@ class SyncViewsTestCase(  # pylint: disable=too-many-ancestors
             200,
         )
 
+    @override_settings(MEDIA_ROOT=tempfile.gettempdir())
+    def test_cpu_profile_download(self):
+        """Test downloading the CPU profile of a Sync."""
+        sync = Sync.objects.first()
+        url = reverse("plugins:nautobot_ssot:sync_cpu_profile", kwargs={"pk": sync.pk})
+        with disable_warnings("django.request"):
+            self.assertHttpStatus(self.client.get(url), 403)
+
+        obj_perm = ObjectPermission(name="Test permission", actions=["view"])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(self.model))
+        with disable_warnings("django.request"):
+            self.assertHttpStatus(self.client.get(url), 404)
+
+        sync.cpu_profile.save(f"{sync.pk}.pstats", ContentFile(b"profile"))
+        response = self.client.get(url)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(b"profile", b"".join(response.streaming_content))
+        self.assertIn(f'filename="{sync.pk}.pstats"', response["Content-Disposition"])
+
+    def test_diff_pagination(self):
+        """Test fetching the diff of a Sync one page of a model type at a time."""
+        sync = Sync.objects.first()
+        sync.diff = {
+            "tenant": {f"Tenant {i}": {"+": {"description": ""}} for i in range(3)},
+            "location": {"Amsterdam": {"-": {"description": ""}}},
+        }
+        sync.save()
+        url = reverse("plugins:nautobot_ssot:sync_diff", kwargs={"pk": sync.pk})
+        with disable_warnings("django.request"):
+            self.assertHttpStatus(self.client.get(url, {"model_type": "tenant"}), 403)
+
+        obj_perm = ObjectPermission(name="Test permission", actions=["view"])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(self.model))
+        with disable_warnings("django.request"):
+            self.assertHttpStatus(self.client.get(url), 400)
+
+        response = self.client.get(url, {"model_type": "tenant", "limit": 2})
+        self.assertHttpStatus(response, 200)
+        page = response.json()
+        self.assertEqual(3, page["count"])
+        self.assertEqual(2, page["next_offset"])
+        self.assertEqual(["Tenant 0", "Tenant 1"], [result["name"] for result in page["results"]])
+        self.assertIn('<li class="diff-added">Tenant 0<ul>', page["html"])
+
+        page = self.client.get(url, {"model_type": "tenant", "offset": 2, "limit": 2}).json()
+        self.assertIsNone(page["next_offset"])
+        self.assertEqual(["Tenant 2"], [result["name"] for result in page["results"]])
+
+        response = self.client.get(sync.get_absolute_url())
+        self.assertHttpStatus(response, 200)
+        self.assertEqual({"tenant": 3, "location": 1}, response.context["diff_model_counts"])
+
     def test_has_advanced_tab(self):
         pass
 
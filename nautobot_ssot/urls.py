@@ -13,6 +13,8 @@ urlpatterns = [
     path("history/delete/", views.SyncBulkDeleteView.as_view(), name="sync_bulk_delete"),
     path("history/<uuid:pk>/", views.SyncView.as_view(), name="sync"),
     path("history/<uuid:pk>/delete/", views.SyncDeleteView.as_view(), name="sync_delete"),
+    path("history/<uuid:pk>/cpu-profile/", views.SyncCPUProfileView.as_view(), name="sync_cpu_profile"),
+    path("history/<uuid:pk>/diff/", views.SyncDiffView.as_view(), name="sync_diff"),
     path("history/<uuid:pk>/jobresult/", views.SyncJobResultView.as_view(), name="sync_jobresult"),
     path("history/<uuid:pk>/logs/", views.SyncLogEntriesView.as_view(), name="sync_logentries"),
     path("logs/", views.SyncLogEntryListView.as_view(), name="synclogentry_list"),
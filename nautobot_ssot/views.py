@@ -1,13 +1,11 @@
 """Django views for Single Source of Truth (SSoT)."""
 
-import pprint
-
-from django.http import Http404
+from django.http import FileResponse, Http404, HttpResponseBadRequest, JsonResponse
 from django.shortcuts import get_object_or_404, render
 from django.views import View as DjangoView
 from django_tables2 import RequestConfig
 from nautobot.core.views.generic import BulkDeleteView, ObjectDeleteView, ObjectListView, ObjectView
-from nautobot.core.views.mixins import ContentTypePermissionRequiredMixin
+from nautobot.core.views.mixins import ContentTypePermissionRequiredMixin, ObjectPermissionRequiredMixin
 from nautobot.core.views.paginator import EnhancedPaginator
 from nautobot.extras.models import Job as JobModel
 
@@ -19,12 +17,13 @@ from .jobs import get_data_jobs
 from .jobs.base import DataSource, DataTarget
 from .models import Sync, SyncLogEntry
 from .tables import DashboardTable, SyncLogEntryTable, SyncTable, SyncTableSingleSourceOrTarget
+from .templatetags.render_diff import render_diff_elements
 
 
 class DashboardView(ObjectListView):
     """Dashboard / overview of SSoT."""
 
-    queryset = Sync.objects.defer("diff").all()
+    queryset = Sync.annotated_queryset()
     table = DashboardTable
     action_buttons = []
     template_name = "nautobot_ssot/dashboard.html"
@@ -136,10 +135,68 @@ class SyncView(ObjectView):
     def get_extra_context(self, request, instance):
         """Add additional context to the view."""
         return {
-            "diff": pprint.pformat(instance.diff, width=180, compact=True),
+            "diff_model_counts": instance.get_diff_model_counts(),
         }
 
 
+class SyncCPUProfileView(ObjectPermissionRequiredMixin, DjangoView):
+    """View for downloading the CPU profile of a single Sync record."""
+
+    queryset = Sync.objects.defer("diff")
+
+    def get_required_permission(self):
+        """Permissions required for the view."""
+        return "nautobot_ssot.view_sync"
+
+    def get(self, request, pk):
+        """Return the CPU profile as a `.pstats` file."""
+        instance = get_object_or_404(self.queryset, pk=pk)
+        if not instance.cpu_profile:
+            raise Http404("This sync has no CPU profile.")
+        return FileResponse(instance.cpu_profile.open("rb"), as_attachment=True, filename=f"{instance.pk}.pstats")
+
+
+class SyncDiffView(ObjectPermissionRequiredMixin, DjangoView):
+    """View for a page of the diff elements of a single model type of a Sync record, as rendered on its detail view."""
+
+    queryset = Sync.objects.defer("diff")
+    default_limit = 100
+    max_limit = 1000
+
+    def get_required_permission(self):
+        """Permissions required for the view."""
+        return "nautobot_ssot.view_sync"
+
+    def get(self, request, pk):
+        """Return the diff elements of the `model_type` query parameter, paginated by `offset` and `limit`."""
+        instance = get_object_or_404(self.queryset, pk=pk)
+        model_type = request.GET.get("model_type")
+        if not model_type:
+            return HttpResponseBadRequest("The model_type parameter is required.")
+        try:
+            offset = max(int(request.GET.get("offset", 0)), 0)
+            limit = min(max(int(request.GET.get("limit", self.default_limit)), 1), self.max_limit)
+        except ValueError:
+            return HttpResponseBadRequest("The offset and limit parameters must be integers.")
+
+        # Only the diff chunks holding the elements of the requested page are loaded.
+        count = instance.get_diff_model_counts().get(model_type, 0)
+        page = dict(instance.iter_model_diff(model_type, offset, limit))
+        parts = []
+        render_diff_elements(page, parts)
+        next_offset = offset + limit if offset + limit < count else None
+        return JsonResponse(
+            {
+                "model_type": model_type,
+                "count": count,
+                "offset": offset,
+                "next_offset": next_offset,
+                "results": [{"name": name, "diff": diff} for name, diff in page.items()],
+                "html": "".join(parts),
+            }
+        )
+
+
 class SyncJobResultView(ObjectView):
     """View for the JobResult associated with a single Sync record."""
 